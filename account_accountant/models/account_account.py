@@ -5,6 +5,18 @@ from odoo import models
 class AccountAccount(models.Model):
     _inherit = "account.account"
 
+    def write(self, vals):
+        res = super().write(vals)
+        if 'reconcile' in vals:
+            # The open journal items of the account start or stop being candidates for the invoice matching.
+            move_lines = self.env['account.move.line'].search([
+                ('account_id', 'in', self.ids),
+                ('parent_state', '=', 'posted'),
+                ('reconciled', '=', False),
+            ])
+            self.env['account.move.line.matching.token']._mark_to_refresh(move_lines)
+        return res
+
     def action_open_reconcile(self):
         self.ensure_one()
         # Open reconciliation view for this account
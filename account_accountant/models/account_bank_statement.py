@@ -1,12 +1,19 @@
-from odoo import _, api, fields, models
+from odoo import _, api, fields, models, modules
 from odoo.addons.base.models.res_bank import sanitize_account_number
 from odoo.exceptions import UserError
 from odoo.tools import html2plaintext
 
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dateutil.relativedelta import relativedelta
 from itertools import product
 from lxml import etree
 from markupsafe import Markup
+import logging
+import time
+
+_logger = logging.getLogger(__name__)
+
 
 class AccountBankStatement(models.Model):
     _inherit = 'account.bank.statement'
@@ -92,13 +99,15 @@ class AccountBankStatementLine(models.Model):
             },
         )
 
-    def _cron_try_auto_reconcile_statement_lines(self, batch_size=None, limit_time=0):
+    def _cron_try_auto_reconcile_statement_lines(self, batch_size=None, limit_time=0, nb_workers=1):
         """ Method called by the CRON to reconcile the statement lines automatically.
 
         :param  batch_size:  The maximum number of statement lines that could be processed at once by the CRON to avoid
                             a timeout. If specified, the CRON will be trigger again asap using a CRON trigger in case
                             there is still some statement lines to process.
                 limit_time: Maximum time allowed to run in seconds. 0 if the Cron is allowed to run without time limit.
+                nb_workers: The number of statement line shards (one per journal) processed in parallel, each one in its
+                            own thread and cursor.
         """
         def _compute_st_lines_to_reconcile(configured_company):
             # Find the bank statement lines that are not reconciled and try to reconcile them automatically.
@@ -121,7 +130,13 @@ class AccountBankStatementLine(models.Model):
             st_lines = self.env['account.bank.statement.line'].browse(st_line_ids)
             return st_lines, remaining_line_id
 
+        def _process_shard_in_new_cursor(st_line_ids):
+            with self.env.registry.cursor() as cr:
+                st_lines = self.env(cr=cr)['account.bank.statement.line'].browse(st_line_ids)
+                return st_lines._try_auto_reconcile_shard(start_time, limit_time)
+
         start_time = fields.Datetime.now()
+        start_perf_counter = time.perf_counter()
 
         self.env['account.reconcile.model'].flush_model()
 
@@ -146,19 +161,97 @@ class AccountBankStatementLine(models.Model):
         if not st_lines:
             return
 
+        # Split the statement lines per journal, keeping their order. The shards being disjoint, they can be processed in
+        # parallel, each worker claiming its lines on its own cursor.
+        shards = [st_lines]
+        if nb_workers > 1 and not modules.module.current_test:
+            lines_per_journal = {}
+            for st_line in st_lines:
+                lines_per_journal.setdefault(st_line.journal_id, self.env['account.bank.statement.line'])
+                lines_per_journal[st_line.journal_id] |= st_line
+            shards = list(lines_per_journal.values())
+
+        nb_failed_shards = 0
+        if len(shards) > 1:
+            # Make everything done so far visible to the workers' cursors.
+            self.env.cr.commit()
+            shard_results = []
+            with ThreadPoolExecutor(max_workers=nb_workers) as executor:
+                futures = [executor.submit(_process_shard_in_new_cursor, shard.ids) for shard in shards]
+                for future in futures:
+                    try:
+                        shard_results.append(future.result())
+                    except Exception:
+                        # The work of the shard is rolled back, its lines are processed again by a later run.
+                        nb_failed_shards += 1
+                        _logger.exception("Bank statement lines auto-reconciliation: a shard failed.")
+            self.env.invalidate_all()
+        else:
+            shard_results = [st_lines._try_auto_reconcile_shard(start_time, limit_time)]
+
+        nb_processed_lines = sum(result['nb_processed_lines'] for result in shard_results)
+        nb_auto_reconciled_lines = sum(result['nb_auto_reconciled_lines'] for result in shard_results)
+        matches_per_model = sum((result['matches_per_model'] for result in shard_results), Counter())
+        remaining_line_id = next((result['remaining_line_id'] for result in shard_results if result['remaining_line_id']), remaining_line_id)
+
+        duration = time.perf_counter() - start_perf_counter
+        _logger.info(
+            "Bank statement lines auto-reconciliation: %s line(s) processed in %.2fs (%.2f lines/s) over %s shard(s) "
+            "(%s failed), %s auto-reconciled. Match rate per reconciliation model: %s",
+            nb_processed_lines,
+            duration,
+            nb_processed_lines / duration if duration else 0.0,
+            len(shards),
+            nb_failed_shards,
+            nb_auto_reconciled_lines,
+            ', '.join(f"{name}: {count} ({count / nb_processed_lines:.1%})" for name, count in matches_per_model.items()) or '-',
+        )
+
+        # The lines of the failed shards are due again, unless all the shards failed, which the next scheduled run retries.
+        retrigger = 0 < nb_failed_shards < len(shards)
+        # If the next statement line has never been auto reconciled yet, force the trigger.
+        if remaining_line_id and not retrigger:
+            remaining_st_line = self.env['account.bank.statement.line'].browse(remaining_line_id)
+            retrigger = nb_auto_reconciled_lines or not remaining_st_line.cron_last_check
+        if retrigger:
+            self.env.ref('account_accountant.auto_reconcile_bank_statement_line')._trigger()
+
+    def _try_auto_reconcile_shard(self, start_time, limit_time):
+        """ Tries to auto-reconcile the statement lines of self, a shard of the lines processed by
+        _cron_try_auto_reconcile_statement_lines.
+
+        The lines already locked by a concurrent transaction are skipped: they will be processed by a later run.
+
+        :param start_time:  The time at which the CRON started, written as cron_last_check on the processed lines.
+        :param limit_time:  Maximum time allowed to run in seconds since start_time. 0 if there is no time limit.
+        :return:            A dict with the following keys:
+            * nb_processed_lines:       The number of statement lines processed.
+            * nb_auto_reconciled_lines: The number of statement lines that got reconciled.
+            * matches_per_model:        A Counter of the auto-reconciled statement lines per reconcile model name.
+            * remaining_line_id:        The id of the first line not processed because of the time limit, if any.
+        """
         # The field `cron_last_check` will be written on all processed lines which requires them to be protected against
         # concurrent update in order to avoid the whole transaction to be rollbacked.
-        self.env.cr.execute("SELECT 1 FROM account_bank_statement_line WHERE id in %s FOR UPDATE", [tuple(st_lines.ids)])
+        self.env.cr.execute("SELECT id FROM account_bank_statement_line WHERE id in %s FOR UPDATE SKIP LOCKED", [tuple(self.ids)])
+        locked_ids = {r[0] for r in self.env.cr.fetchall()}
+        st_lines = self.filtered(lambda st_line: st_line.id in locked_ids)
+
+        # Tokenize the open journal items once for the whole batch instead of once per statement line.
+        matching_context = {}
+        if len(st_lines) > 1:
+            matching_context['invoice_matching_token_index'] = self.env['account.reconcile.model']._get_invoice_matching_token_index(st_lines.company_id)
 
+        remaining_line_id = None
         nb_auto_reconciled_lines = 0
+        matches_per_model = Counter()
         for index, st_line in enumerate(st_lines):
             # we want the cron to run only for limit_time seconds
             if limit_time and fields.Datetime.now().timestamp() - start_time.timestamp() > limit_time:
                 remaining_line_id = st_line.id
                 st_lines = st_lines[:index]
                 break
-            wizard = self.env['bank.rec.widget'].with_context(default_st_line_id=st_line.id).new({})
-            wizard._action_trigger_matching_rules()
+            wizard = self.env['bank.rec.widget'].with_context(default_st_line_id=st_line.id, **matching_context).new({})
+            matching = wizard._action_trigger_matching_rules() or {}
             if wizard.state == 'valid' and wizard.matching_rules_allow_auto_reconcile:
                 try:
                     wizard._action_validate()
@@ -168,16 +261,18 @@ class AccountBankStatementLine(models.Model):
                             ', '.join(st_line.move_id.line_ids.reconcile_model_id.mapped('name')),
                         ))
                         nb_auto_reconciled_lines += 1
+                        matches_per_model[matching['model'].name] += 1
                 except UserError:
                     continue
 
         st_lines.write({'cron_last_check': start_time})
 
-        # If the next statement line has never been auto reconciled yet, force the trigger.
-        if remaining_line_id:
-            remaining_st_line = self.env['account.bank.statement.line'].browse(remaining_line_id)
-            if nb_auto_reconciled_lines or not remaining_st_line.cron_last_check:
-                self.env.ref('account_accountant.auto_reconcile_bank_statement_line')._trigger()
+        return {
+            'nb_processed_lines': len(st_lines),
+            'nb_auto_reconciled_lines': nb_auto_reconciled_lines,
+            'matches_per_model': matches_per_model,
+            'remaining_line_id': remaining_line_id,
+        }
 
     def _retrieve_partner(self):
         self.ensure_one()
@@ -70,6 +70,12 @@ class AccountMove(models.Model):
                 move._generate_deferred_entries()
         return posted
 
+    def write(self, vals):
+        res = super().write(vals)
+        if {'state', 'name', 'ref'}.intersection(vals):
+            self.env['account.move.line.matching.token']._mark_to_refresh(self.line_ids)
+        return res
+
     def action_post(self):
         # EXTENDS 'account' to trigger the CRON auto-reconciling the statement lines.
         res = super().action_post()
@@ -430,6 +436,12 @@ class AccountMoveLine(models.Model):
                 values['deferred_end_date'] = line.deferred_end_date
         return data_list
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        lines = super().create(vals_list)
+        self.env['account.move.line.matching.token']._mark_to_refresh(lines.filtered(lambda line: line.parent_state == 'posted'))
+        return lines
+
     def write(self, vals):
         """ Prevent changing the account of a move line when there are already deferral entries.
         """
@@ -445,7 +457,10 @@ class AccountMoveLine(models.Model):
                         "You cannot change the account for a deferred line in %(move_name)s if it has already been deferred.",
                         move_name=line.move_id.display_name
                     ))
-        return super().write(vals)
+        res = super().write(vals)
+        if {'name', 'account_id'}.intersection(vals):
+            self.env['account.move.line.matching.token']._mark_to_refresh(self)
+        return res
 
     # ============================= START - Deferred management ====================================
     def _compute_has_deferred_moves(self):
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+from odoo import api, fields, models
+from odoo.tools import create_index
+
+
+class AccountMoveLineMatchingToken(models.Model):
+    """ The tokens of the open journal items, looked up by the 'invoice_matching' reconciliation models to find the
+    journal items a statement line refers to (see _get_invoice_matching_amls_candidates).
+
+    Only the posted and not reconciled journal items on reconcilable accounts are tokenized. The tokens of the journal
+    items that may have changed are refreshed at the end of the transaction, or before being searched. Rows left for
+    journal items reconciled in the meantime are harmless, as the candidates are filtered with the matching domain.
+    """
+    _name = 'account.move.line.matching.token'
+    _description = "Journal Item Matching Token"
+    _log_access = False
+
+    move_line_id = fields.Many2one(comodel_name='account.move.line', required=True, readonly=True, index=True, ondelete='cascade')
+    token_type = fields.Selection(
+        selection=[
+            ('numerical', "Numerical"),
+            ('exact', "Exact"),
+        ],
+        required=True,
+        readonly=True,
+    )
+    token = fields.Char(required=True, readonly=True)
+
+    def init(self):
+        super().init()
+        # The exact tokens are whole labels and references, that can be longer than what a btree index entry allows.
+        create_index(self.env.cr,
+                     indexname='account_move_line_matching_token_token_idx',
+                     tablename=self._table,
+                     expressions=['token'],
+                     method='hash')
+        self.env.cr.execute("SELECT 1 FROM account_move_line_matching_token LIMIT 1")
+        if not self.env.cr.fetchone():
+            self._refresh_tokens()
+
+    @api.model
+    def _mark_to_refresh(self, move_lines):
+        """ Schedules the refresh of the tokens of move_lines, at the end of the transaction at the latest. """
+        if not move_lines:
+            return
+        pending_ids = self.env.cr.precommit.data.setdefault('account_accountant.matching_token_move_line_ids', set())
+        if not pending_ids:
+            self.env.cr.precommit.add(self._refresh_pending_tokens)
+        pending_ids.update(move_lines.ids)
+
+    @api.model
+    def _refresh_pending_tokens(self):
+        """ Refreshes the tokens scheduled by _mark_to_refresh. To be called before searching the tokens. """
+        pending_ids = self.env.cr.precommit.data.pop('account_accountant.matching_token_move_line_ids', None)
+        if pending_ids:
+            self._refresh_tokens(pending_ids)
+
+    @api.model
+    def _refresh_tokens(self, move_line_ids=None):
+        """ Recomputes the tokens of the provided journal items, or of all of them if move_line_ids is None.
+
+        The tokens are extracted like the statement lines' ones are compared in _get_invoice_matching_amls_candidates:
+        each of the label of the journal item, the name of its move and the reference of its move gives an 'exact'
+        token, and the groups of digits found in them give 'numerical' tokens. Each occurrence is kept, as they are all
+        counted when ranking the candidates.
+        """
+        self.env['account.move.line'].flush_model(['name', 'move_id', 'account_id', 'company_id', 'parent_state', 'reconciled'])
+        self.env['account.move'].flush_model(['name', 'ref'])
+        self.env['account.account'].flush_model(['reconcile'])
+
+        if move_line_ids is None:
+            self.env.cr.execute("DELETE FROM account_move_line_matching_token")
+            id_condition = ''
+            params = []
+        else:
+            if not move_line_ids:
+                return
+            self.env.cr.execute("DELETE FROM account_move_line_matching_token WHERE move_line_id IN %s", [tuple(move_line_ids)])
+            id_condition = 'AND account_move_line.id IN %s'
+            params = [tuple(move_line_ids)]
+
+        self.env.cr.execute(rf'''
+            WITH aml_value AS (
+                SELECT
+                    account_move_line.id AS move_line_id,
+                    UNNEST(ARRAY[account_move_line.name, move.name, move.ref]) AS value
+                FROM account_move_line
+                JOIN account_move move ON move.id = account_move_line.move_id
+                JOIN account_account account ON account.id = account_move_line.account_id
+                WHERE account_move_line.parent_state = 'posted'
+                    AND account_move_line.reconciled IS NOT TRUE
+                    AND account.reconcile
+                    {id_condition}
+            )
+            INSERT INTO account_move_line_matching_token (move_line_id, token_type, token)
+                SELECT move_line_id, 'exact', value
+                FROM aml_value
+                WHERE COALESCE(value, '') != ''
+            UNION ALL
+                SELECT tokenized.move_line_id, 'numerical', tokenized.token
+                FROM (
+                    SELECT
+                        move_line_id,
+                        UNNEST(
+                            REGEXP_SPLIT_TO_ARRAY(
+                                SUBSTRING(
+                                    REGEXP_REPLACE(value, '[^0-9\s]', '', 'g'),
+                                    '\S(?:.*\S)*'
+                                ),
+                                '\s+'
+                            )
+                        ) AS token
+                    FROM aml_value
+                    WHERE value IS NOT NULL
+                ) AS tokenized
+                WHERE tokenized.token IS NOT NULL
+        ''', params)
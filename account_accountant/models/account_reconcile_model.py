@@ -1,10 +1,42 @@
-from odoo import fields, models, Command, tools
+from odoo import api, fields, models, Command, tools
 
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
 from dateutil.relativedelta import relativedelta
 
 
+class InvoiceMatchingTokenIndex:
+    """ In-memory copy of the account.move.line.matching.token of some companies, loaded once to match a whole batch of
+    statement lines with the 'invoice_matching' rules (see _cron_try_auto_reconcile_statement_lines). Looking the
+    tokens up here gives the same candidates with the same number of matches as querying the table for each line.
+    """
+
+    def __init__(self, company_ids, rows):
+        """
+        :param company_ids: The ids of the companies whose open journal items are indexed.
+        :param rows:        An iterable of (aml_id, token_type, token) tuples.
+        """
+        self.company_ids = frozenset(company_ids)
+        self.indexes = {'numerical': defaultdict(list), 'exact': defaultdict(list)}
+        for aml_id, token_type, token in rows:
+            self.indexes[token_type][token].append(aml_id)
+
+    def covers(self, company):
+        return company.id in self.company_ids
+
+    def get_nb_matches(self, numerical_tokens, exact_tokens):
+        """ Returns a Counter {aml_id: nb_match}, with nb_match counted like in _get_invoice_matching_amls_candidates. """
+        searched_tokens = set(numerical_tokens) | set(exact_tokens)
+        nb_matches = Counter()
+        for token_type, st_line_tokens in (('numerical', numerical_tokens), ('exact', exact_tokens)):
+            if not st_line_tokens:
+                continue
+            index = self.indexes[token_type]
+            for token in searched_tokens:
+                nb_matches.update(index.get(token, ()))
+        return nb_matches
+
+
 class AccountReconcileModel(models.Model):
     _inherit = 'account.reconcile.model'
 
@@ -305,6 +337,22 @@ class AccountReconcileModel(models.Model):
 
         return numerical_tokens, list(exact_tokens), text_tokens
 
+    @api.model
+    def _get_invoice_matching_token_index(self, companies):
+        """ Loads the InvoiceMatchingTokenIndex of the open journal items of the provided companies and their branches. """
+        companies = self.env['res.company'].search([('id', 'child_of', companies.root_id.ids)])
+        self.env['account.move.line.matching.token']._refresh_pending_tokens()
+        self._cr.execute('''
+            SELECT
+                token.move_line_id,
+                token.token_type,
+                token.token
+            FROM account_move_line_matching_token token
+            JOIN account_move_line ON account_move_line.id = token.move_line_id
+            WHERE account_move_line.company_id IN %s
+        ''', [tuple(companies.ids)])
+        return InvoiceMatchingTokenIndex(companies.ids, self._cr.fetchall())
+
     def _get_invoice_matching_amls_candidates(self, st_line, partner):
         """ Returns the match candidates for the 'invoice_matching' rule, with respect to the provided parameters.
 
@@ -324,81 +372,50 @@ class AccountReconcileModel(models.Model):
         query = self.env['account.move.line']._where_calc(aml_domain)
         tables, where_clause, where_params = query.get_sql()
 
-        aml_cte = ''
-        all_params = []
-        sub_queries = []
         numerical_tokens, exact_tokens, _text_tokens = self._get_invoice_matching_st_line_tokens(st_line)
         if numerical_tokens or exact_tokens:
-            aml_cte = rf'''
-                WITH aml_cte AS (
-                    SELECT
-                        account_move_line.id as account_move_line_id,
-                        account_move_line.date as account_move_line_date,
-                        account_move_line.date_maturity as account_move_line_date_maturity,
-                        account_move_line.name as account_move_line_name,
-                        account_move_line__move_id.name as account_move_line__move_id_name,
-                        account_move_line__move_id.ref as account_move_line__move_id_ref
-                    FROM {tables}
-                    JOIN account_move account_move_line__move_id ON account_move_line__move_id.id = account_move_line.move_id
-                    WHERE {where_clause}
+            # The numerical (resp. exact) tokens of the journal items are only considered if the statement line has some
+            # numerical (resp. exact) tokens, but are then compared to all the tokens of the statement line.
+            token_index = self._context.get('invoice_matching_token_index')
+            candidate_ids = []
+            order_by = get_order_by_clause(alias='account_move_line')
+            if token_index and token_index.covers(st_line.company_id):
+                # The tokens have already been loaded for the whole batch of statement lines being matched.
+                nb_matches = token_index.get_nb_matches(numerical_tokens, exact_tokens)
+                if nb_matches:
+                    self._cr.execute(
+                        f'''
+                            SELECT account_move_line.id
+                            FROM {tables}
+                            JOIN UNNEST(%s::integer[], %s::integer[]) AS candidate(id, nb_match) ON candidate.id = account_move_line.id
+                            WHERE {where_clause}
+                            ORDER BY candidate.nb_match DESC, {order_by}
+                        ''',
+                        [list(nb_matches), list(nb_matches.values())] + where_params,
+                    )
+                    candidate_ids = [r[0] for r in self._cr.fetchall()]
+            else:
+                self.env['account.move.line.matching.token']._refresh_pending_tokens()
+                token_types = []
+                if numerical_tokens:
+                    token_types.append('numerical')
+                if exact_tokens:
+                    token_types.append('exact')
+                self._cr.execute(
+                    f'''
+                        SELECT account_move_line.id
+                        FROM {tables}
+                        JOIN account_move_line_matching_token token ON token.move_line_id = account_move_line.id
+                        WHERE {where_clause}
+                            AND token.token_type IN %s
+                            AND token.token IN %s
+                        GROUP BY account_move_line.id
+                        ORDER BY COUNT(*) DESC, {order_by}
+                    ''',
+                    where_params + [tuple(token_types), tuple(numerical_tokens + exact_tokens)],
                 )
-            '''
-            all_params += where_params
-        if numerical_tokens:
-            for table_alias, field in (
-                ('account_move_line', 'name'),
-                ('account_move_line__move_id', 'name'),
-                ('account_move_line__move_id', 'ref'),
-            ):
-                sub_queries.append(rf'''
-                    SELECT
-                        account_move_line_id as id,
-                        account_move_line_date as date,
-                        account_move_line_date_maturity as date_maturity,
-                        UNNEST(
-                            REGEXP_SPLIT_TO_ARRAY(
-                                SUBSTRING(
-                                    REGEXP_REPLACE({table_alias}_{field}, '[^0-9\s]', '', 'g'),
-                                    '\S(?:.*\S)*'
-                                ),
-                                '\s+'
-                            )
-                        ) AS token
-                    FROM aml_cte
-                    WHERE {table_alias}_{field} IS NOT NULL
-                ''')
-        if exact_tokens:
-            for table_alias, field in (
-                ('account_move_line', 'name'),
-                ('account_move_line__move_id', 'name'),
-                ('account_move_line__move_id', 'ref'),
-            ):
-                sub_queries.append(rf'''
-                    SELECT
-                        account_move_line_id as id,
-                        account_move_line_date as date,
-                        account_move_line_date_maturity as date_maturity,
-                        {table_alias}_{field} AS token
-                    FROM aml_cte
-                    WHERE COALESCE({table_alias}_{field}, '') != ''
-                ''')
-        if sub_queries:
-            order_by = get_order_by_clause(alias='sub')
-            self._cr.execute(
-                aml_cte +
-                '''
-                    SELECT
-                        sub.id,
-                        COUNT(*) AS nb_match
-                    FROM (''' + ' UNION ALL '.join(sub_queries) + ''') AS sub
-                    WHERE sub.token IN %s
-                    GROUP BY sub.date_maturity, sub.date, sub.id
-                    HAVING COUNT(*) > 0
-                    ORDER BY nb_match DESC, ''' + order_by + '''
-                ''',
-                all_params + [tuple(numerical_tokens + exact_tokens)],
-            )
-            candidate_ids = [r[0] for r in self._cr.fetchall()]
+                candidate_ids = [r[0] for r in self._cr.fetchall()]
+
             if candidate_ids:
                 return {
                     'allow_auto_reconcile': True,
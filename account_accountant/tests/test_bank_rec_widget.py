@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
+from odoo.addons.account_accountant.models.account_bank_statement import AccountBankStatementLine
 from odoo.addons.account_accountant.tests.test_bank_rec_widget_common import TestBankRecWidgetCommon
+from odoo.exceptions import UserError
 from odoo.tests import tagged
 from odoo.tools import html2plaintext
 from odoo import fields, Command
@@ -2751,6 +2753,68 @@ class TestBankRecWidget(TestBankRecWidgetCommon):
         self.assertRecordValues(st_line1, [{'is_reconciled': True, 'cron_last_check': fields.Datetime.from_string('2017-01-01 00:00:00')}])
         self.assertRecordValues(st_line2, [{'is_reconciled': False, 'cron_last_check': False}])
 
+    def test_auto_reconcile_cron_metrics(self):
+        self.env['account.reconcile.model'].search([('company_id', '=', self.company_data['company'].id)]).unlink()
+
+        st_lines = self._create_st_line(1234.0, partner_id=self.partner_a.id, date='2017-01-01')
+        st_lines += self._create_st_line(5678.0, partner_id=self.partner_a.id, date='2017-01-02')
+        st_lines += self._create_st_line(9999.0, partner_id=self.partner_b.id, date='2017-01-02')
+        self.env['account.reconcile.model'].create({
+            'name': "test_auto_reconcile_cron_metrics",
+            'rule_type': 'writeoff_suggestion',
+            'auto_reconcile': True,
+            'match_partner': True,
+            'match_partner_ids': [Command.set(self.partner_a.ids)],
+            'line_ids': [Command.create({'account_id': self.account_revenue1.id})],
+        })
+
+        with freeze_time('2017-01-01'), self.assertLogs('odoo.addons.account_accountant.models.account_bank_statement', level='INFO') as logs:
+            self.env['account.bank.statement.line']._cron_try_auto_reconcile_statement_lines(nb_workers=2)
+
+        self.assertRecordValues(st_lines, [{'is_reconciled': True}, {'is_reconciled': True}, {'is_reconciled': False}])
+        self.assertIn("3 line(s) processed", logs.output[0])
+        self.assertIn("2 auto-reconciled", logs.output[0])
+        self.assertIn("test_auto_reconcile_cron_metrics: 2 (66.7%)", logs.output[0])
+
+    def test_auto_reconcile_cron_failing_shard(self):
+        """ A failing shard of the parallel auto-reconciliation does not prevent the other shards from being processed,
+        nor the cron from logging its metrics and being retriggered for the lines of the failed shard. """
+        self.env['account.reconcile.model'].search([('company_id', '=', self.company_data['company'].id)]).unlink()
+        cron = self.env.ref('account_accountant.auto_reconcile_bank_statement_line')
+        other_journal = self.company_data['default_journal_bank'].copy()
+
+        st_line1 = self._create_st_line(1234.0, partner_id=self.partner_a.id, date='2017-01-01')
+        st_line2 = self._create_st_line(5678.0, partner_id=self.partner_a.id, date='2017-01-01', journal_id=other_journal.id)
+        self.env['account.reconcile.model'].create({
+            'name': "test_auto_reconcile_cron_failing_shard",
+            'rule_type': 'writeoff_suggestion',
+            'auto_reconcile': True,
+            'line_ids': [Command.create({'account_id': self.account_revenue1.id})],
+        })
+        self.env['ir.cron.trigger'].search([('cron_id', '=', cron.id)]).unlink()
+
+        self.patch(self.env.cr, 'commit', lambda: None)
+        self.registry.enter_test_mode(self.cr)
+        self.addCleanup(self.registry.leave_test_mode)
+
+        try_auto_reconcile_shard = AccountBankStatementLine._try_auto_reconcile_shard
+
+        def _try_auto_reconcile_shard(self, start_time, limit_time):
+            if self.journal_id == other_journal:
+                raise UserError("Shard failure")
+            return try_auto_reconcile_shard(self, start_time, limit_time)
+
+        with freeze_time('2017-01-01'), \
+             patch('odoo.modules.module.current_test', None), \
+             patch.object(AccountBankStatementLine, '_try_auto_reconcile_shard', _try_auto_reconcile_shard), \
+             self.assertLogs('odoo.addons.account_accountant.models.account_bank_statement', level='INFO') as logs:
+            self.env['account.bank.statement.line']._cron_try_auto_reconcile_statement_lines(nb_workers=2)
+
+        self.assertRecordValues(st_line1 + st_line2, [{'is_reconciled': True}, {'is_reconciled': False}])
+        self.assertIn("1 line(s) processed", logs.output[-1])
+        self.assertIn("(1 failed)", logs.output[-1])
+        self.assertEqual(len(self.env['ir.cron.trigger'].search([('cron_id', '=', cron.id)])), 1)
+
     @freeze_time('2019-01-01')
     def test_button_apply_reco_model(self):
         inv_line = self._create_invoice_line(
@@ -222,6 +222,45 @@ class TestReconciliationMatchingRules(AccountTestInvoicingCommon):
             self.cash_line_1: {'amls': self.invoice_line_4, 'model': self.rule_1},
         })
 
+    @freeze_time('2020-01-01')
+    def test_matching_with_token_index(self):
+        """ Matching a batch of statement lines through the token index gives the same results as matching them one by one. """
+        st_lines = self.bank_line_1 + self.bank_line_2 + self.bank_line_3 + self.bank_line_4 + self.bank_line_5 + self.cash_line_1
+        rules = self.rule_1 + self.rule_2
+        token_index = self.env['account.reconcile.model']._get_invoice_matching_token_index(st_lines.company_id)
+        for match_text_location_label in (True, False):
+            self.rule_1.match_text_location_label = match_text_location_label
+            for st_line in st_lines:
+                partner = st_line._retrieve_partner()
+                self.assertDictEqual(
+                    rules.with_context(invoice_matching_token_index=token_index)._apply_rules(st_line, partner),
+                    rules._apply_rules(st_line, partner),
+                )
+
+    def test_matching_tokens_maintenance(self):
+        matching_token = self.env['account.move.line.matching.token']
+
+        def get_tokens(aml):
+            matching_token._refresh_pending_tokens()
+            return set(matching_token.search([('move_line_id', '=', aml.id)]).mapped(lambda token: (token.token_type, token.token)))
+
+        invoice = self.invoice_line_6.move_id
+        self.assertTrue({('exact', 'RF12 3456'), ('numerical', '12'), ('numerical', '3456')} <= get_tokens(self.invoice_line_6))
+
+        invoice.ref = "REF 9876"
+        tokens = get_tokens(self.invoice_line_6)
+        self.assertIn(('numerical', '9876'), tokens)
+        self.assertNotIn(('exact', 'RF12 3456'), tokens)
+
+        invoice.button_draft()
+        self.assertFalse(get_tokens(self.invoice_line_6))
+
+        invoice.action_post()
+        self.assertTrue(get_tokens(self.invoice_line_6))
+
+        self.env['account.payment.register'].with_context(active_model='account.move', active_ids=invoice.ids).create({})._create_payments()
+        self.assertFalse(get_tokens(self.invoice_line_6))
+
     @freeze_time('2020-01-01')
     def test_matching_fields_match_text_location(self):
         st_line = self._create_st_line(payment_ref="1111", ref="2222 3333", narration="4444 5555 6666")
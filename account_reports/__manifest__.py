@@ -11,6 +11,7 @@ Accounting Reports
     'depends': ['account_accountant'],
     'data': [
         'security/ir.model.access.csv',
+        'security/account_reports_security.xml',
         'data/pdf_export_templates.xml',
         'data/balance_sheet.xml',
         'data/cash_flow_report.xml',
@@ -30,6 +31,7 @@ Accounting Reports
         'data/account_report_actions.xml',
         'data/menuitems.xml',
         'data/mail_activity_type_data.xml',
+        'data/ir_cron.xml',
         'views/account_move_views.xml',
         'views/res_company_views.xml',
         'views/partner_view.xml',
@@ -8,3 +8,33 @@ class AccountAccount(models.Model):
     _inherit = "account.account"
 
     exclude_provision_currency_ids = fields.Many2many('res.currency', relation='account_account_exclude_res_currency_provision', help="Whether or not we have to make provisions for the selected foreign currencies.")
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        accounts = super().create(vals_list)
+        # The account_codes report engine caches the accounts matching each prefix.
+        accounts.company_id._bump_account_codes_version()
+        return accounts
+
+    def write(self, vals):
+        companies = self.company_id
+        res = super().write(vals)
+        if vals.keys() & {'code', 'tag_ids', 'company_id'}:
+            (companies | self.company_id)._bump_account_codes_version()
+        return res
+
+    def unlink(self):
+        companies = self.company_id
+        res = super().unlink()
+        companies._bump_account_codes_version()
+        return res
+
+
+class AccountAccountTag(models.Model):
+    _inherit = "account.account.tag"
+
+    def unlink(self):
+        res = super().unlink()
+        # The account_codes report engine caches the accounts matching each tag.
+        self.env['res.company'].sudo().with_context(active_test=False).search([])._bump_account_codes_version()
+        return res
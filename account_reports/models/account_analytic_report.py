@@ -197,6 +197,12 @@ class AccountReport(models.AbstractModel):
 
         return tables, where_clause, where_params
 
+    def _get_balance_snapshot_bounds(self, options, date_scope):
+        # The balance snapshots don't hold any analytic information.
+        if options.get('analytic_groupby_option') or options.get('analytic_accounts'):
+            return {}
+        return super()._get_balance_snapshot_bounds(options, date_scope)
+
     def action_audit_cell(self, options, params):
         column_group_options = self._get_column_group_options(options, params['column_group_key'])
 
@@ -37,6 +37,13 @@ class GeneralLedgerCustomHandler(models.AbstractModel):
         # Automatically unfold the report when printing it, unless some specific lines have been unfolded
         options['unfold_all'] = (options['export_mode'] == 'print' and not options.get('unfolded_lines')) or options['unfold_all']
 
+        options['buttons'].append({
+            'name': _('XLSX (background)'),
+            'sequence': 25,
+            'action': 'action_export_xlsx_in_background',
+            'always_show': True,
+        })
+
     def _dynamic_lines_generator(self, report, options, all_column_groups_expression_totals, warnings=None):
         lines = []
         date_from = fields.Date.from_string(options['date']['date_from'])
@@ -351,9 +358,9 @@ class GeneralLedgerCustomHandler(models.AbstractModel):
 
         return new_options
 
-    def _get_aml_values(self, report, options, expanded_account_ids, offset=0, limit=None):
+    def _get_aml_values(self, report, options, expanded_account_ids, offset=0, limit=None, after_key=None):
         rslt = {account_id: {} for account_id in expanded_account_ids}
-        aml_query, aml_params = self._get_query_amls(report, options, expanded_account_ids, offset=offset, limit=limit)
+        aml_query, aml_params = self._get_query_amls(report, options, expanded_account_ids, offset=offset, limit=limit, after_key=after_key)
         self._cr.execute(aml_query, aml_params)
         aml_results_number = 0
         has_more = False
@@ -381,15 +388,21 @@ class GeneralLedgerCustomHandler(models.AbstractModel):
 
         return rslt, has_more
 
-    def _get_query_amls(self, report, options, expanded_account_ids, offset=0, limit=None):
+    def _get_query_amls(self, report, options, expanded_account_ids, offset=0, limit=None, after_key=None):
         """ Construct a query retrieving the account.move.lines when expanding a report line with or without the load
         more.
         :param options:               The report options.
         :param expanded_account_ids:  The account.account ids corresponding to consider. If None, match every account.
         :param offset:                The offset of the query (used by the load more).
         :param limit:                 The limit of the query (used by the load more).
+        :param after_key:             A (date, move_name, aml_id) tuple. If set, only the move lines coming strictly after
+                                      it in the order of the query are returned (keyset pagination, used by the streamed
+                                      exports). Only supported with a single column group.
         :return:                      (query, params)
         """
+        if after_key and len(options['column_groups']) > 1:
+            raise UserError(_("Keyset pagination of the general ledger is only supported with a single column group."))
+
         additional_domain = [('account_id', 'in', expanded_account_ids)] if expanded_account_ids is not None else None
         queries = []
         all_params = []
@@ -403,6 +416,10 @@ class GeneralLedgerCustomHandler(models.AbstractModel):
             # period: [('date' <= options['date_to']), ('date', '>=', options['date_from'])]
             tables, where_clause, where_params = report._query_get(group_options, domain=additional_domain, date_scope='strict_range')
             ct_query = report._get_query_currency_table(group_options)
+            if after_key:
+                # The move name is coalesced like in the ORDER BY, as a NULL would make the whole comparison NULL.
+                where_clause = f"{where_clause} AND (account_move_line.date, COALESCE(move.name, ''), account_move_line.id) > (%s, %s, %s)"
+                where_params = [*where_params, *after_key]
             query = f'''
                 (SELECT
                     account_move_line.id,
@@ -441,7 +458,7 @@ class GeneralLedgerCustomHandler(models.AbstractModel):
                 LEFT JOIN account_full_reconcile full_rec   ON full_rec.id = account_move_line.full_reconcile_id
                 WHERE {where_clause}
                 GROUP BY account_move_line.id, account_move_line.date
-                ORDER BY account_move_line.date, move_name, account_move_line.id)
+                ORDER BY account_move_line.date, COALESCE(MIN(move.name), ''), account_move_line.id)
             '''
 
             queries.append(query)
@@ -664,6 +681,66 @@ class GeneralLedgerCustomHandler(models.AbstractModel):
             'columns': line_columns,
         }
 
+    def action_export_xlsx_in_background(self, options):
+        """ Queues a streamed XLSX export of the fully unfolded general ledger, for the ledgers too big to be exported
+        within a request. The file is posted to the user once generated.
+        """
+        if len(options['column_groups']) > 1:
+            raise UserError(_("The background export of the general ledger does not support comparisons or horizontal groups."))
+
+        report = self.env['account.report'].browse(options['report_id'])
+        self.env['account.report.background.export']._enqueue(report, options)
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'type': 'info',
+                'message': _("The export is being generated. You will be notified in your inbox once it is ready."),
+                'sticky': False,
+            },
+        }
+
+    def _custom_xlsx_lines_generator(self, report, options, page_size=5000):
+        """ Yields the lines of the fully unfolded general ledger one by one, for account.report's _export_to_xlsx_streamed.
+
+        Only the account lines are computed upfront. The move lines of each account are then fetched page by page, using
+        keyset pagination on the order of _get_query_amls, so that neither the query results nor the line dicts of the
+        whole ledger are ever held in memory at once.
+        """
+        def balance_progress(line_dict):
+            return {
+                column['column_group_key']: line_col.get('no_format', 0)
+                for column, line_col in zip(options['columns'], line_dict['columns'])
+                if column['expression_label'] == 'balance'
+            }
+
+        folded_options = {**options, 'unfold_all': False, 'unfolded_lines': []}
+        for line in report._get_lines(folded_options):
+            yield line
+
+            model, account_id = report._get_model_info_from_id(line['id'])
+            if model != 'account.account' or not line.get('unfoldable'):
+                continue
+
+            progress = {column_group_key: 0 for column_group_key in options['column_groups']}
+            account, init_balance_by_col_group = self._get_initial_balance_values(report, [account_id], options)[account_id]
+            initial_balance_line = report._get_partner_and_general_ledger_initial_balance_line(options, line['id'], init_balance_by_col_group, account.currency_id)
+            if initial_balance_line:
+                yield initial_balance_line
+                progress = balance_progress(initial_balance_line)
+
+            after_key = None
+            has_more = True
+            while has_more:
+                aml_results, has_more = self._get_aml_values(report, options, [account_id], limit=page_size + 1, after_key=after_key)
+                for aml_result in aml_results[account_id].values():
+                    aml_line = self._get_aml_line(report, line['id'], options, aml_result, progress)
+                    yield aml_line
+                    progress = balance_progress(aml_line)
+
+                    aml_values = next(iter(aml_result.values()))
+                    after_key = (aml_values['date'], aml_values['move_name'] or '', aml_values['id'])
+
     def caret_option_audit_tax(self, options, params):
         return self.env['account.generic.tax.report.handler'].caret_option_audit_tax(options, params)
 
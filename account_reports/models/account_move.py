@@ -42,6 +42,19 @@ class AccountMove(models.Model):
                     # Show the warning if some of the sub companies (branches or member of the tax unit) still need to post a tax closing.
                     move.tax_closing_show_multi_closing_warning = len(other_company_closings) != len(report_company_ids) - 1
 
+    def write(self, vals):
+        # Invalidate the report balance snapshots of the periods whose posted journal items change.
+        impacts_snapshots = bool(vals.keys() & {'state', 'date', 'journal_id', 'company_id'})
+        if impacts_snapshots:
+            posted_periods = self._get_balance_snapshot_periods()
+        res = super().write(vals)
+        if impacts_snapshots:
+            self.env['account.report.balance.snapshot']._mark_dirty(posted_periods | self._get_balance_snapshot_periods())
+        return res
+
+    def _get_balance_snapshot_periods(self):
+        return {(move.company_id.id, move.date) for move in self if move.state == 'posted'}
+
     def _post(self, soft=True):
         # Overridden to create carryover external values and join the pdf of the report when posting the tax closing
         for move in self.filtered(lambda m: m.tax_closing_end_date):
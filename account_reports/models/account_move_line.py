@@ -5,6 +5,9 @@ from odoo import api, fields, models, _
 
 from odoo.exceptions import UserError
 
+# Fields of account.move.line aggregated, or used as dimensions, in account.report.balance.snapshot.
+BALANCE_SNAPSHOT_FIELDS = {'account_id', 'journal_id', 'partner_id', 'balance', 'debit', 'credit', 'amount_currency', 'date', 'company_id', 'move_id'}
+
 class AccountMoveLine(models.Model):
     _name = "account.move.line"
     _inherit = "account.move.line"
@@ -13,6 +16,29 @@ class AccountMoveLine(models.Model):
                                     help="Expected payment date as manually set through the customer statement"
                                          "(e.g: if you had the customer on the phone and want to remember the date he promised he would pay)")
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        lines = super().create(vals_list)
+        self.env['account.report.balance.snapshot']._mark_dirty(lines._get_balance_snapshot_periods())
+        return lines
+
+    def write(self, vals):
+        # Invalidate the report balance snapshots of the periods whose posted journal items change.
+        impacts_snapshots = bool(vals.keys() & BALANCE_SNAPSHOT_FIELDS)
+        if impacts_snapshots:
+            posted_periods = self._get_balance_snapshot_periods()
+        res = super().write(vals)
+        if impacts_snapshots:
+            self.env['account.report.balance.snapshot']._mark_dirty(posted_periods | self._get_balance_snapshot_periods())
+        return res
+
+    def unlink(self):
+        self.env['account.report.balance.snapshot']._mark_dirty(self._get_balance_snapshot_periods())
+        return super().unlink()
+
+    def _get_balance_snapshot_periods(self):
+        return {(line.company_id.id, line.date) for line in self if line.parent_state == 'posted'}
+
     @api.constrains('tax_ids', 'tax_tag_ids')
     def _check_taxes_on_closing_entries(self):
         for aml in self:
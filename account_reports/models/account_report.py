@@ -20,7 +20,7 @@ from dateutil.relativedelta import relativedelta
 from odoo.addons.web.controllers.utils import clean_action
 from odoo import models, fields, api, _, osv, _lt
 from odoo.exceptions import RedirectWarning, UserError, ValidationError
-from odoo.tools import config, date_utils, get_lang, float_compare, float_is_zero
+from odoo.tools import config, date_utils, frozendict, get_lang, float_compare, float_is_zero, ormcache
 from odoo.tools.float_utils import float_round
 from odoo.tools.misc import formatLang, format_date, xlsxwriter
 from odoo.tools.safe_eval import expr_eval, safe_eval
@@ -43,6 +43,9 @@ ACCOUNT_CODES_ENGINE_TAG_ID_PREFIX_REGEX = re.compile(r"tag\(((?P<id>\d+)|(?P<re
 # Performance optimisation: those engines always will receive None as their next_groupby, allowing more efficient batching.
 NO_NEXT_GROUPBY_ENGINES = {'tax_tags', 'account_codes'}
 
+# The account_codes engine can read those groupby values from account.report.balance.snapshot.
+BALANCE_SNAPSHOT_GROUPBY_FIELDS = ('account_id', 'journal_id', 'partner_id')
+
 NUMBER_FIGURE_TYPES = ('float', 'integer', 'monetary', 'percentage')
 
 LINE_ID_HIERARCHY_DELIMITER = '|'
@@ -2599,7 +2602,9 @@ class AccountReport(models.Model):
 
         # Treat each formula batch for each column group
         all_column_groups_expression_totals = {}
-        for group_key, group_options in self._split_options_per_column_group(options).items():
+        options_per_column_group = self._split_options_per_column_group(options)
+        fused_formula_results = self._compute_account_codes_batches_for_all_column_groups(options_per_column_group, grouped_formulas, offset=offset, limit=limit)
+        for group_key, group_options in options_per_column_group.items():
             if forced_all_column_groups_expression_totals:
                 forced_column_group_totals = forced_all_column_groups_expression_totals.get(group_key, None)
             else:
@@ -2612,6 +2617,7 @@ class AccountReport(models.Model):
                 offset=offset,
                 limit=limit,
                 warnings=warnings,
+                precomputed_formula_results=fused_formula_results.get(group_key),
             )
             all_column_groups_expression_totals[group_key] = current_group_expression_totals
 
@@ -2653,7 +2659,7 @@ class AccountReport(models.Model):
             'owner_column_group': group_key,
         }
 
-    def _compute_expression_totals_for_single_column_group(self, column_group_options, grouped_formulas, forced_column_group_expression_totals=None, offset=0, limit=None, warnings=None):
+    def _compute_expression_totals_for_single_column_group(self, column_group_options, grouped_formulas, forced_column_group_expression_totals=None, offset=0, limit=None, warnings=None, precomputed_formula_results=None):
         """ Evaluates expressions for a single column group.
 
             :param column_group_options: The options dict obtained from _split_options_per_column_group() for the column group to evaluate.
@@ -2674,6 +2680,10 @@ class AccountReport(models.Model):
             :param limit: The SQL limit to apply when computing these expressions' result. Used if self.load_more_limit is set, to handle
                           the load more feature.
 
+            :param precomputed_formula_results: A dict {(engine, (date_scope, current_groupby, next_groupby)): formula_results} of the
+                                                batches already evaluated for this column group, with formula_results in the same
+                                                format as _compute_formula_batch's result. Those batches won't be evaluated again.
+
             :return: A dict(expression, {'value': value, 'has_sublines': has_sublines}), where:
                      - expression is one of the account.report.expressions that got evaluated
 
@@ -2758,10 +2768,15 @@ class AccountReport(models.Model):
             for selection_val in self.env['account.report.expression']._fields['engine'].selection
             if selection_val[0] != 'aggregation'
         ]
+        precomputed_formula_results = precomputed_formula_results or {}
         for engine in batchable_engines:
-            for (date_scope, current_groupby, next_groupby), formulas_dict in grouped_formulas.get(engine, {}).items():
-                formula_results = self._compute_formula_batch(column_group_options, engine, date_scope, formulas_dict, current_groupby, next_groupby,
-                                                              offset=offset, limit=limit, warnings=warnings)
+            for batch_key, formulas_dict in grouped_formulas.get(engine, {}).items():
+                date_scope, current_groupby, next_groupby = batch_key
+                if (engine, batch_key) in precomputed_formula_results:
+                    formula_results = precomputed_formula_results[(engine, batch_key)]
+                else:
+                    formula_results = self._compute_formula_batch(column_group_options, engine, date_scope, formulas_dict, current_groupby, next_groupby,
+                                                                  offset=offset, limit=limit, warnings=warnings)
                 inject_formula_results(
                     formula_results,
                     column_group_expression_totals,
@@ -3320,39 +3335,171 @@ class AccountReport(models.Model):
         """
         self._check_groupby_fields((next_groupby.split(',') if next_groupby else []) + ([current_groupby] if current_groupby else []))
 
-        # Gather the account code prefixes to compute the total from
-        prefix_details_by_formula = {}  # in the form {formula: [(1, prefix1), (-1, prefix2)]}
-        prefixes_to_compute = set()
+        prefix_details_by_formula, accounts_prefix_map = self._get_account_codes_engine_plan(options, formulas_dict)
+
+        query, params = self._get_account_codes_engine_query(options, date_scope, current_groupby, offset=offset, limit=limit)
+        self._cr.execute(query, params)
+
+        return self._get_account_codes_engine_results(formulas_dict, current_groupby, prefix_details_by_formula, accounts_prefix_map, self._cr.dictfetchall())
+
+    def _compute_account_codes_batches_for_all_column_groups(self, options_per_column_group, grouped_formulas, offset=0, limit=None):
+        """ Evaluates the account_codes batches of all the column groups at once, running a single query per batch instead
+        of one per column group. The journal items are bucketed into the column groups whose domain they match with a
+        lateral join, so that column groups with overlapping dates (e.g. from_beginning date scopes) are supported.
+
+        Batches are only fused when every column group queries the same tables with the same currency table (hence only
+        differing by their dates, journals, or forced domains), and when no balance snapshot can be used.
+
+        :param options_per_column_group: The result of _split_options_per_column_group.
+        :param grouped_formulas: The formulas to evaluate, grouped per engine and batch, as in _compute_expression_totals_for_single_column_group.
+        :return: A dict {column_group_key: {('account_codes', batch_key): formula_results}}, with formula_results in the same format
+                 as _compute_formula_batch's result. Batches that could not be fused are left out.
+        """
+        rslt = defaultdict(dict)
+        if len(options_per_column_group) < 2 or offset or limit:
+            return rslt
+
+        all_options = list(options_per_column_group.values())
+        if any(self.get_report_company_ids(group_options) != self.get_report_company_ids(all_options[0]) for group_options in all_options):
+            return rslt
+
+        for batch_key, formulas_dict in grouped_formulas.get('account_codes', {}).items():
+            date_scope, current_groupby, next_groupby = batch_key
+            if any(self._get_balance_snapshot_bounds(group_options, date_scope) for group_options in all_options):
+                continue
+
+            queries_data = {}
+            for group_key, group_options in options_per_column_group.items():
+                tables, where_clause, where_params = self._query_get(group_options, date_scope)
+                queries_data[group_key] = (tables, where_clause, where_params, self._get_query_currency_table(group_options))
+
+            shared_from_clauses = {(tables, currency_table_query) for tables, _where_clause, _where_params, currency_table_query in queries_data.values()}
+            if len(shared_from_clauses) != 1:
+                continue
+            tables, currency_table_query = shared_from_clauses.pop()
+            if '%s' in tables:
+                # The parameters of the FROM clause can't be told apart from the ones of the WHERE clause.
+                continue
+
+            self._check_groupby_fields((next_groupby.split(',') if next_groupby else []) + ([current_groupby] if current_groupby else []))
+            prefix_details_by_formula, accounts_prefix_map = self._get_account_codes_engine_plan(all_options[0], formulas_dict)
+
+            column_group_queries = []
+            column_group_conditions = []
+            column_group_params = []
+            conditions_params = []
+            for group_key, (_tables, where_clause, where_params, _currency_table_query) in queries_data.items():
+                column_group_queries.append(f"SELECT %s WHERE {where_clause}")
+                column_group_params += [group_key, *where_params]
+                column_group_conditions.append(f"({where_clause})")
+                conditions_params += where_params
+
+            current_groupby_aml_sql = f'account_move_line.{current_groupby}' if current_groupby else ''
+            query = f"""
+                SELECT
+                    column_group.key AS column_group_key,
+                    account_move_line.account_id AS account_id,
+                    SUM(ROUND(account_move_line.balance * currency_table.rate, currency_table.precision)) AS sum,
+                    COUNT(account_move_line.id) AS aml_count
+                    {f',{current_groupby_aml_sql} AS grouping_key' if current_groupby else ''}
+                FROM {tables}
+                JOIN {currency_table_query} ON currency_table.company_id = account_move_line.company_id
+                JOIN LATERAL (
+                    {' UNION ALL '.join(column_group_queries)}
+                ) AS column_group(key) ON TRUE
+                WHERE {' OR '.join(column_group_conditions)}
+                GROUP BY column_group.key, account_move_line.account_id{f', {current_groupby_aml_sql}' if current_groupby else ''}
+                {'ORDER BY ' + current_groupby_aml_sql if current_groupby else ''}
+            """
+            self._cr.execute(query, column_group_params + conditions_params)
+
+            query_results_per_column_group = {group_key: [] for group_key in options_per_column_group}
+            for query_res in self._cr.dictfetchall():
+                query_results_per_column_group[query_res['column_group_key']].append(query_res)
+
+            for group_key, query_results in query_results_per_column_group.items():
+                rslt[group_key][('account_codes', batch_key)] = self._get_account_codes_engine_results(
+                    formulas_dict, current_groupby, prefix_details_by_formula, accounts_prefix_map, query_results,
+                )
+
+        return rslt
+
+    def _get_account_codes_engine_plan(self, options, formulas_dict):
+        """ Parses the formulas of the account_codes engine and matches their prefixes with the accounts of the report's companies.
+        Both steps are cached, so that they are only done once for all the renders of the report.
+
+        :return: A tuple (prefix_details_by_formula, accounts_prefix_map), where:
+                 - prefix_details_by_formula is a dict {formula: ((multiplicator, prefix_key, balance_character), ...)}
+                 - accounts_prefix_map is a dict {account_id: (prefix_key, ...)}, giving the prefix keys each account matches
+        """
+        prefix_details_by_formula = {}
+        prefix_keys_to_compute = set()
         for formula in formulas_dict:
-            prefix_details_by_formula[formula] = []
-            for token in ACCOUNT_CODES_ENGINE_SPLIT_REGEX.split(formula.replace(' ', '')):
-                if token:
-                    token_match = ACCOUNT_CODES_ENGINE_TERM_REGEX.match(token)
+            prefix_details_by_formula[formula] = self._parse_account_codes_formula(formula)
+            prefix_keys_to_compute.update(prefix_key for _multiplicator, prefix_key, _balance_character in prefix_details_by_formula[formula])
+
+        company_ids = tuple(sorted(self.get_report_company_ids(options)))
+        # The accounts of the parent companies are matched as well (see _check_company_domain).
+        companies = self.env['res.company'].sudo().browse(company_ids)
+        accounts_prefix_map = self._get_account_codes_prefix_map(
+            company_ids,
+            tuple(sorted(prefix_keys_to_compute)),
+            tuple((company.id, company.account_codes_version) for company in (companies | companies.parent_ids).sorted('id')),
+        )
+        return prefix_details_by_formula, accounts_prefix_map
 
-                    if not token_match:
-                        raise UserError(_("Invalid token '%s' in account_codes formula '%s'", token, formula))
+    @api.model
+    @ormcache('formula')
+    def _parse_account_codes_formula(self, formula):
+        """ Parses a formula of the account_codes engine.
 
-                    parsed_token = token_match.groupdict()
+        :return: A tuple of (multiplicator, prefix_key, balance_character) tuples, one per term of the formula. prefix_key is a tuple
+                 made of the prefix followed by its excluded prefixes.
+        """
+        prefix_details = []
+        for token in ACCOUNT_CODES_ENGINE_SPLIT_REGEX.split(formula.replace(' ', '')):
+            if token:
+                token_match = ACCOUNT_CODES_ENGINE_TERM_REGEX.match(token)
+
+                if not token_match:
+                    raise UserError(_("Invalid token '%s' in account_codes formula '%s'", token, formula))
+
+                parsed_token = token_match.groupdict()
 
-                    if not parsed_token:
-                        raise UserError(_("Could not parse account_code formula from token '%s'", token))
+                if not parsed_token:
+                    raise UserError(_("Could not parse account_code formula from token '%s'", token))
 
-                    multiplicator = -1 if parsed_token['sign'] == '-' else 1
-                    excluded_prefixes_match = token_match['excluded_prefixes']
-                    excluded_prefixes = excluded_prefixes_match.split(',') if excluded_prefixes_match else []
-                    prefix = token_match['prefix']
+                multiplicator = -1 if parsed_token['sign'] == '-' else 1
+                excluded_prefixes_match = token_match['excluded_prefixes']
+                excluded_prefixes = excluded_prefixes_match.split(',') if excluded_prefixes_match else []
+                prefix = token_match['prefix']
 
-                    # We group using both prefix and excluded_prefixes as keys, for the case where two expressions would
-                    # include the same prefix, but exlcude different prefixes (example 104\(1041) and 104\(1042))
-                    prefix_key = (prefix, *excluded_prefixes)
-                    prefix_details_by_formula[formula].append((multiplicator, prefix_key, token_match['balance_character']))
-                    prefixes_to_compute.add((prefix, tuple(excluded_prefixes)))
+                # We group using both prefix and excluded_prefixes as keys, for the case where two expressions would
+                # include the same prefix, but exlcude different prefixes (example 104\(1041) and 104\(1042))
+                prefix_key = (prefix, *excluded_prefixes)
+                prefix_details.append((multiplicator, prefix_key, token_match['balance_character']))
 
+        return tuple(prefix_details)
+
+    @api.model
+    @ormcache('company_ids', 'prefix_keys', 'versions')
+    def _get_account_codes_prefix_map(self, company_ids, prefix_keys, versions):
+        """ Matches the prefixes of the account_codes engine with the accounts of the provided companies.
+        The result is cached by version of the accounts of the companies and of their parent companies, which changes
+        whenever an account is created, deleted, or gets its code or tags changed (see res.company's
+        _bump_account_codes_version).
+
+        :param company_ids: A sorted tuple of company ids.
+        :param prefix_keys: A sorted tuple of prefix keys, as returned by _parse_account_codes_formula.
+        :param versions: The (id, account_codes_version) of each company of company_ids and of their parent companies,
+                         only used as cache key.
+        :return: A frozendict {account_id: (prefix_key, ...)}, giving the prefix keys each account matches.
+        """
         # Create the subquery for the WITH linking our prefixes with account.account entries
         all_prefixes_queries = []
         prefix_params = []
-        prefilter = self.env['account.account']._check_company_domain(self.get_report_company_ids(options))
-        for prefix, excluded_prefixes in prefixes_to_compute:
+        prefilter = self.env['account.account']._check_company_domain(list(company_ids))
+        for prefix, *excluded_prefixes in prefix_keys:
             account_domain = [
                 *prefilter,
             ]
@@ -3402,7 +3549,15 @@ class AccountReport(models.Model):
         for prefix, account_id in self._cr.fetchall():
             accounts_prefix_map[account_id].append(tuple(prefix))
 
-        # Run main query
+        return frozendict({account_id: tuple(prefixes) for account_id, prefixes in accounts_prefix_map.items()})
+
+    def _get_account_codes_engine_query(self, options, date_scope, current_groupby, offset=0, limit=None):
+        """ Builds the query summing the balance of the journal items per account (and per current_groupby, if any)
+        for the account_codes engine.
+
+        :return: A tuple (query, params). The query returns the account_id, sum and aml_count columns, as well as
+                 grouping_key if current_groupby is set.
+        """
         tables, where_clause, where_params = self._query_get(options, date_scope)
 
         currency_table_query = self._get_query_currency_table(options)
@@ -3429,6 +3584,12 @@ class AccountReport(models.Model):
         if not tail_query_additional_groupby_where_sql:
             where_params += tail_params
 
+        # Closed periods already aggregated in account.report.balance.snapshot are read from there; only the remaining tail
+        # is computed from the journal items.
+        snapshot_bounds = {}
+        if not tail_query and current_groupby in (None, *BALANCE_SNAPSHOT_GROUPBY_FIELDS):
+            snapshot_bounds = self._get_balance_snapshot_bounds(options, date_scope)
+
         query = f"""
             SELECT
                 account_move_line.account_id AS account_id,
@@ -3443,17 +3604,25 @@ class AccountReport(models.Model):
             {'ORDER BY account_move_line.' + current_groupby if current_groupby else ''}
             {tail_query if not tail_query_additional_groupby_where_sql else ''}
         """
-        self._cr.execute(query, where_params)
+        if snapshot_bounds:
+            query, where_params = self._get_query_with_balance_snapshots(options, date_scope, snapshot_bounds, where_clause, where_params, tables, currency_table_query, current_groupby)
 
-        # Parse result
+        return query, where_params
+
+    def _get_account_codes_engine_results(self, formulas_dict, current_groupby, prefix_details_by_formula, accounts_prefix_map, query_results):
+        """ Computes the result of each formula of the account_codes engine from the per-account sums returned by
+        the query of _get_account_codes_engine_query.
+
+        :return: A dict in the same format as _compute_formula_batch's result.
+        """
         rslt = {}
 
         res_by_prefix_account_id = {}
-        for query_res in self._cr.dictfetchall():
+        for query_res in query_results:
             # Done this way so that we can run similar code for groupby and non-groupby
             grouping_key = query_res['grouping_key'] if current_groupby else None
             account_id = query_res['account_id']
-            for prefix_key in accounts_prefix_map[account_id]:
+            for prefix_key in accounts_prefix_map.get(account_id, ()):
                 res_by_prefix_account_id.setdefault(prefix_key, {})\
                                         .setdefault(account_id, [])\
                                         .append((grouping_key, {'result': query_res['sum'], 'has_sublines': query_res['aml_count'] > 0}))
@@ -3609,6 +3778,136 @@ class AccountReport(models.Model):
                 expressions, options, date_scope, current_groupby, next_groupby, offset=offset, limit=limit, warnings=warnings)
         return rslt
 
+    def _get_balance_snapshot_bounds(self, options, date_scope):
+        """ Returns the companies of the report for which the account_codes engine can read the closed periods from
+        account.report.balance.snapshot instead of account.move.line, under the provided options and date_scope.
+
+        Snapshots only aggregate posted journal items in the company currency, per account, journal and partner.
+        They are therefore only used when the options don't filter the journal items on anything else, so that the
+        result is always the same as when computing everything from account_move_line.
+
+        :return: A dict {company_id: bound}, where bound is the last day of a month. The journal items of company_id
+                 dated up to bound (included) are to be read from the snapshots. Empty dict if the snapshots can't be used.
+        """
+        date_from, date_to, _allow_include_initial_balance = self._get_date_bounds_info(options, date_scope)
+        if date_from and fields.Date.from_string(date_from).day != 1:
+            return {}
+
+        if (
+            options.get('all_entries')
+            or options.get('forced_domain')
+            or self.only_tax_exigible
+            or self._get_options_partner_domain(options)
+            or self._get_options_unreconciled_domain(options)
+            or self._get_options_fiscal_position_domain(options)
+            or self._get_options_account_type_domain(options)
+            or self._get_options_aml_ir_filters(options)
+        ):
+            return {}
+
+        # Custom record rules could hide some of the journal items aggregated in the snapshots. The effective domain of the
+        # rules of the current user, as that's who the journal items are read for, must thus be the one of the company rule
+        # alone: the always-true rules (e.g. the ones of the standard accounting groups) vanish when the rules are combined.
+        IrRule = self.env['ir.rule']
+        company_rule = self.env.ref('account.account_move_line_comp_rule', raise_if_not_found=False)
+        company_domain = []
+        if company_rule and company_rule in IrRule._get_rules('account.move.line'):
+            company_domain = safe_eval(company_rule.sudo().domain_force, IrRule._eval_context())
+        effective_domain = IrRule._compute_domain('account.move.line', 'read') or []
+        if osv.expression.AND([effective_domain]) != osv.expression.AND([company_domain]):
+            return {}
+
+        # Snapshots are expressed in company currency; they can't be used with a conversion rate.
+        report_currency = self.env.company.currency_id
+        eligible_company_ids = [
+            company.id
+            for company in self.env['res.company'].browse(self.get_report_company_ids(options))
+            if company.currency_id == report_currency
+        ]
+
+        date_to = fields.Date.from_string(date_to)
+        last_closed_day = date_to if date_to == date_utils.end_of(date_to, 'month') else date_utils.start_of(date_to, 'month') - relativedelta(days=1)
+        return {
+            company_id: min(covered_until, last_closed_day)
+            for company_id, covered_until in self.env['account.report.balance.snapshot']._get_covered_until(eligible_company_ids).items()
+        }
+
+    def _get_query_with_balance_snapshots(self, options, date_scope, snapshot_bounds, where_clause, where_params, tables, currency_table_query, current_groupby):
+        """ Builds the main query of the account_codes engine, reading the periods covered by snapshot_bounds from
+        account.report.balance.snapshot and the rest of the journal items from account_move_line.
+
+        :param snapshot_bounds: The result of _get_balance_snapshot_bounds.
+        :return: A tuple (query, params), the query returning the same columns as the regular account_codes engine query.
+        """
+        date_from, _date_to, allow_include_initial_balance = self._get_date_bounds_info(options, date_scope)
+
+        tail_conditions = []
+        tail_params = []
+        for company_id, bound in snapshot_bounds.items():
+            tail_conditions.append("(account_move_line.company_id = %s AND account_move_line.date > %s)")
+            tail_params += [company_id, bound]
+        uncovered_company_ids = set(self.get_report_company_ids(options)) - set(snapshot_bounds)
+        if uncovered_company_ids:
+            tail_conditions.append("account_move_line.company_id IN %s")
+            tail_params.append(tuple(uncovered_company_ids))
+
+        snapshot_conditions = []
+        snapshot_params = []
+        for company_id, bound in snapshot_bounds.items():
+            snapshot_conditions.append("(snapshot.company_id = %s AND snapshot.date <= %s)")
+            snapshot_params += [company_id, bound]
+        snapshot_where_clause = f"({' OR '.join(snapshot_conditions)})"
+
+        journals_domain = self._get_options_journals_domain(options)
+        if journals_domain:
+            snapshot_where_clause += " AND snapshot.journal_id IN %s"
+            snapshot_params.append(tuple(journals_domain[0][2]))
+
+        if date_from:
+            include_initial_balance_sql = " OR account.include_initial_balance" if allow_include_initial_balance else ""
+            snapshot_where_clause += f" AND (snapshot.date >= %s{include_initial_balance_sql})"
+            snapshot_params.append(date_from)
+
+        tail_select_groupby_sql = f', account_move_line.{current_groupby} AS grouping_key' if current_groupby else ''
+        tail_groupby_sql = f', account_move_line.{current_groupby}' if current_groupby else ''
+        snapshot_select_groupby_sql = f', snapshot.{current_groupby} AS grouping_key' if current_groupby else ''
+        snapshot_groupby_sql = f', snapshot.{current_groupby}' if current_groupby else ''
+
+        query = f"""
+            SELECT
+                balances.account_id AS account_id,
+                SUM(balances.sum) AS sum,
+                SUM(balances.aml_count)::integer AS aml_count
+                {', balances.grouping_key AS grouping_key' if current_groupby else ''}
+            FROM (
+                SELECT
+                    account_move_line.account_id AS account_id,
+                    SUM(ROUND(account_move_line.balance * currency_table.rate, currency_table.precision)) AS sum,
+                    COUNT(account_move_line.id) AS aml_count
+                    {tail_select_groupby_sql}
+                FROM {tables}
+                JOIN {currency_table_query} ON currency_table.company_id = account_move_line.company_id
+                WHERE {where_clause}
+                AND ({' OR '.join(tail_conditions)})
+                GROUP BY account_move_line.account_id{tail_groupby_sql}
+
+                UNION ALL
+
+                SELECT
+                    snapshot.account_id AS account_id,
+                    SUM(snapshot.balance) AS sum,
+                    SUM(snapshot.aml_count) AS aml_count
+                    {snapshot_select_groupby_sql}
+                FROM account_report_balance_snapshot snapshot
+                JOIN account_account account ON account.id = snapshot.account_id
+                WHERE {snapshot_where_clause}
+                GROUP BY snapshot.account_id{snapshot_groupby_sql}
+            ) AS balances
+            GROUP BY balances.account_id{', balances.grouping_key' if current_groupby else ''}
+            {'ORDER BY balances.grouping_key' if current_groupby else ''}
+        """
+        return query, where_params + tail_params + snapshot_params
+
     def _get_engine_query_tail(self, offset, limit):
         """ Helper to generate the OFFSET, LIMIT and ORDER conditions of formula engines' queries.
         """
@@ -5287,6 +5586,79 @@ class AccountReport(models.Model):
                 write_method = sheet.write_datetime if cell_type == 'date' else sheet.write
                 write_method(y + y_offset, x + line.get('colspan', 1) - 1, cell_value, cell_format)
 
+    def _export_to_xlsx_streamed(self, options, output):
+        """ Writes the XLSX export of the report into output, a binary file object. Used by the background exports.
+
+        Contrary to export_to_xlsx, the lines are never all held in memory: they are yielded one by one by the
+        _custom_xlsx_lines_generator function of the custom handler, and written right away using the constant_memory
+        mode of xlsxwriter, which flushes each row to disk once the next one is started. Reports whose custom handler
+        does not define this function are exported like export_to_xlsx does.
+        """
+        self.ensure_one()
+        custom_handler_model = self._get_custom_handler_model()
+        if not custom_handler_model or not hasattr(self.env[custom_handler_model], '_custom_xlsx_lines_generator'):
+            output.write(self.export_to_xlsx(options)['file_content'])
+            return
+
+        print_mode_self = self.with_context(no_format=True)
+        print_options = print_mode_self.get_options(previous_options={**options, 'export_mode': 'print'})
+        lines = print_mode_self.env[custom_handler_model]._custom_xlsx_lines_generator(print_mode_self, print_options)
+
+        workbook = xlsxwriter.Workbook(output, {
+            'constant_memory': True,
+            'strings_to_formulas': False,
+        })
+        sheet = workbook.add_worksheet(self.name[:31])
+
+        title_format = workbook.add_format({'font_name': 'Arial', 'bold': True, 'bottom': 2})
+        text_format_props = {'font_name': 'Arial', 'font_color': '#666666', 'font_size': 12}
+        default_format_props = {**text_format_props, 'num_format': '#,##0.00'}
+        date_format_props = {**text_format_props, 'num_format': 'yyyy-mm-dd'}
+        workbook_formats = {
+            bold: {
+                'text': workbook.add_format({**text_format_props, 'bold': bold}),
+                'default': workbook.add_format({**default_format_props, 'bold': bold}),
+                'date': workbook.add_format({**date_format_props, 'bold': bold}),
+            }
+            for bold in (False, True)
+        }
+
+        # As in _inject_report_into_xlsx_sheet, the code of the accounts gets its own column. Headers are written first,
+        # as constant_memory mode doesn't allow going back to a previous row.
+        sheet.set_column(0, 0, 11)
+        sheet.set_column(1, 1, 50)
+        sheet.set_column(2, 1 + len(print_options['columns']), 10)
+        sheet.write(0, 0, _("Code"), title_format)
+        sheet.write(0, 1, _("Name"), title_format)
+        for x, column in enumerate(print_options['columns'], start=2):
+            sheet.write(0, x, column.get('name', ''), title_format)
+
+        account_line_id = account_code = None
+        for y, line in enumerate(lines, start=1):
+            line_id = self._parse_line_id(line.get('id'))
+            is_initial_line = line_id[-1][0] == 'initial' if line_id else False
+            line_formats = workbook_formats[line.get('level', 0) <= 2 and not is_initial_line]
+
+            if self._get_model_info_from_id(line['id'])[0] == 'account.account':
+                account_line_id = line['id']
+                account_code, line_name = self.env['account.account']._split_code_name(line['name'])
+            else:
+                line_name = line['name']
+                if line.get('parent_id') != account_line_id:
+                    account_line_id = account_code = None
+
+            sheet.write(y, 0, account_code or '', line_formats['text'])
+            sheet.write(y, 1, line_name, line_formats['text'])
+            for x, column in enumerate(line['columns'], start=2):
+                cell_type, cell_value = self._get_cell_type_value(column)
+                if cell_type == 'date':
+                    sheet.write_datetime(y, x, cell_value, line_formats['date'])
+                else:
+                    sheet.write(y, x, cell_value, line_formats['default'])
+
+        self._add_options_xlsx_sheet(workbook, [print_options])
+        workbook.close()
+
     def _add_options_xlsx_sheet(self, workbook, options_list):
         """Adds a new sheet for xlsx report exports with a summary of all filters and options activated at the moment of the export."""
         filters_sheet = workbook.add_worksheet(_("Filters"))
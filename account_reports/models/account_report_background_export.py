@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+
+from odoo import api, fields, models, _
+from odoo.tools import config
+
+_logger = logging.getLogger(__name__)
+
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+class AccountReportBackgroundExport(models.Model):
+    """ An export of an accounting report to XLSX, generated by a cron instead of within the request of the user.
+
+    Exporting very big reports (typically a full year of general ledger) may exceed the memory and time limits of the
+    HTTP workers. Such exports are queued as records of this model, processed by
+    account_reports.ir_cron_account_report_background_export, and the resulting file is posted on the record so that
+    the requesting user is notified.
+    """
+    _name = 'account.report.background.export'
+    _inherit = ['mail.thread']
+    _description = "Accounting Report Background Export"
+    _order = 'create_date desc, id desc'
+
+    name = fields.Char(string="Name", required=True, readonly=True)
+    report_id = fields.Many2one(comodel_name='account.report', required=True, readonly=True, ondelete='cascade')
+    company_id = fields.Many2one(comodel_name='res.company', required=True, readonly=True, default=lambda self: self.env.company)
+    options = fields.Text(string="Options", required=True, readonly=True)
+    state = fields.Selection(
+        selection=[
+            ('to_do', "To Do"),
+            ('done', "Done"),
+            ('error', "Failed"),
+        ],
+        required=True,
+        readonly=True,
+        default='to_do',
+    )
+    attachment_id = fields.Many2one(comodel_name='ir.attachment', readonly=True, ondelete='set null')
+
+    @api.model
+    def _enqueue(self, report, options):
+        """ Queues the export of report with options, and triggers the cron processing it. """
+        export = self.create({
+            'name': report.get_default_report_filename(options, 'xlsx'),
+            'report_id': report.id,
+            'options': json.dumps(options),
+        })
+        self.env.ref('account_reports.ir_cron_account_report_background_export')._trigger()
+        return export
+
+    def _generate_file(self):
+        """ Generates the file of the export, with the access rights and companies of the user who requested it. """
+        self.ensure_one()
+        options = json.loads(self.options)
+        allowed_company_ids = [self.company_id.id] + [
+            company_opt['id']
+            for company_opt in options.get('companies', [])
+            if company_opt['id'] != self.company_id.id
+        ]
+        report = self.report_id.with_user(self.create_uid).with_context(allowed_company_ids=allowed_company_ids)
+
+        with tempfile.TemporaryFile() as output:
+            report._export_to_xlsx_streamed(options, output)
+            return self._create_attachment_from_file(output, report.get_export_mime_type('xlsx'))
+
+    def _create_attachment_from_file(self, output, mimetype):
+        """ Creates the attachment of the export from the file object output.
+
+        With the file storage, the file is copied chunk by chunk into the filestore, as ir.attachment would otherwise need
+        the whole content in memory to compute its checksum and write it. The database storage has no choice but to load
+        it.
+        """
+        self.ensure_one()
+        Attachment = self.env['ir.attachment']
+        vals = {
+            'name': self.name,
+            'mimetype': mimetype,
+            'res_model': self._name,
+            'res_id': self.id,
+        }
+
+        output.seek(0)
+        if Attachment._storage() == 'db':
+            return Attachment.create({**vals, 'raw': output.read()})
+
+        sha = hashlib.sha1()
+        for chunk in iter(lambda: output.read(STREAM_CHUNK_SIZE), b''):
+            sha.update(chunk)
+        checksum = sha.hexdigest()
+        file_size = output.tell()
+
+        # Same location as ir.attachment._get_path, a file with the same checksum already holds the same content.
+        fname = checksum[:2] + '/' + checksum
+        full_path = Attachment._full_path(fname)
+        if not os.path.exists(full_path):
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            output.seek(0)
+            with open(full_path, 'wb') as fp:
+                shutil.copyfileobj(output, fp, STREAM_CHUNK_SIZE)
+            # Garbage collect the file if the transaction aborts, like ir.attachment._file_write.
+            Attachment._mark_for_gc(fname)
+
+        # ir.attachment drops those values from create and write, as it computes them from the content.
+        attachment = Attachment.create(vals)
+        self.env.cr.execute(
+            "UPDATE ir_attachment SET store_fname = %s, checksum = %s, file_size = %s WHERE id = %s",
+            [fname, checksum, file_size, attachment.id],
+        )
+        attachment.invalidate_recordset(['store_fname', 'checksum', 'file_size', 'raw', 'datas'])
+        return attachment
+
+    @api.model
+    def _cron_process_exports(self, batch_size=5):
+        """ Generates the pending exports, committing after each of them so that a failure does not impact the others.
+
+        :param batch_size: The maximum number of exports generated at each run. The cron is retriggered as long as some
+                           exports remain to be generated.
+        """
+        auto_commit = not bool(config['test_enable'] or config['test_file'])
+        exports = self.search([('state', '=', 'to_do')], order='id', limit=batch_size + 1)
+        for export in exports[:batch_size]:
+            try:
+                with self.env.cr.savepoint():
+                    attachment = export._generate_file()
+                    export.write({'state': 'done', 'attachment_id': attachment.id})
+                    export.message_post(
+                        body=_("The export of %s is ready.", export.report_id.name),
+                        attachment_ids=attachment.ids,
+                        partner_ids=export.create_uid.partner_id.ids,
+                    )
+            except Exception as e:
+                _logger.exception("Background export %s of report %s failed.", export.id, export.report_id.id)
+                export.state = 'error'
+                export.message_post(
+                    body=_("The export of %s failed: %s", export.report_id.name, str(e)),
+                    partner_ids=export.create_uid.partner_id.ids,
+                )
+            if auto_commit:
+                self.env.cr.commit()
+
+        if len(exports) > batch_size:
+            self.env.ref('account_reports.ir_cron_account_report_background_export')._trigger()
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+import logging
+
+from dateutil.relativedelta import relativedelta
+
+from odoo import api, fields, models
+from odoo.tools import create_index, date_utils
+
+_logger = logging.getLogger(__name__)
+
+
+class AccountReportBalanceSnapshot(models.Model):
+    """ Monthly balances of the posted journal items, per (company, account, journal, partner).
+
+    Those rows are only trusted by the report engines for the months whose account.report.balance.snapshot.period
+    is 'valid'. Any change impacting posted journal items of a month marks that month as 'dirty' again, so that it
+    is read from account_move_line until the cron rebuilds it.
+    """
+    _name = 'account.report.balance.snapshot'
+    _description = "Accounting Report Balance Snapshot"
+    _log_access = False
+
+    company_id = fields.Many2one(comodel_name='res.company', required=True, readonly=True, ondelete='cascade')
+    company_currency_id = fields.Many2one(related='company_id.currency_id')
+    date = fields.Date(string="Period Start", required=True, readonly=True)
+    account_id = fields.Many2one(comodel_name='account.account', required=True, readonly=True, ondelete='cascade')
+    journal_id = fields.Many2one(comodel_name='account.journal', required=True, readonly=True, ondelete='cascade')
+    partner_id = fields.Many2one(comodel_name='res.partner', readonly=True, ondelete='cascade')
+    balance = fields.Monetary(currency_field='company_currency_id', readonly=True)
+    aml_count = fields.Integer(readonly=True)
+
+    def init(self):
+        super().init()
+        create_index(self.env.cr,
+                     indexname='account_report_balance_snapshot_company_date_idx',
+                     tablename=self._table,
+                     expressions=['company_id', 'date'])
+
+    @api.model
+    def _mark_dirty(self, company_dates):
+        """ Invalidates the snapshot periods containing the provided dates.
+
+        The period rows are upserted rather than updated, so that a concurrent transaction currently building one of
+        those periods either makes this one wait or fails with a serialization error. This way, a period can never
+        be committed as 'valid' while missing a change.
+
+        :param company_dates: An iterable of (company_id, date) tuples.
+        """
+        companies = self.env['res.company'].browse({company_id for company_id, _date in company_dates}).sudo()
+        enabled_company_ids = set(companies.filtered('account_report_balance_snapshot').ids)
+        periods = {
+            (company_id, date_utils.start_of(fields.Date.to_date(date), 'month'))
+            for company_id, date in company_dates
+            if company_id in enabled_company_ids and date
+        }
+        if not periods:
+            return
+
+        self.env.cr.execute_values("""
+            INSERT INTO account_report_balance_snapshot_period (company_id, date, state)
+                 VALUES %s
+            ON CONFLICT (company_id, date) DO UPDATE SET state = 'dirty'
+        """, [(company_id, date, 'dirty') for company_id, date in sorted(periods)])
+
+    @api.model
+    def _get_periods_to_build(self, company):
+        """ Returns the start dates of the closed months of company whose snapshot is missing or dirty, oldest first.
+        The current month is never snapshotted: it is the open tail that the engines always read from the journal items.
+        """
+        self.env.cr.execute("""
+            SELECT MIN(date)
+              FROM account_move_line
+             WHERE company_id = %s
+               AND parent_state = 'posted'
+        """, [company.id])
+        first_date = self.env.cr.fetchone()[0]
+        if not first_date:
+            return []
+
+        self.env.cr.execute("""
+            SELECT date
+              FROM account_report_balance_snapshot_period
+             WHERE company_id = %s
+               AND state = 'valid'
+        """, [company.id])
+        valid_periods = {date for date, in self.env.cr.fetchall()}
+
+        current_month_start = date_utils.start_of(fields.Date.context_today(self), 'month')
+        period_start = date_utils.start_of(first_date, 'month')
+        periods_to_build = []
+        while period_start < current_month_start:
+            if period_start not in valid_periods:
+                periods_to_build.append(period_start)
+            period_start += relativedelta(months=1)
+        return periods_to_build
+
+    @api.model
+    def _build_periods(self, company, period_starts):
+        """ (Re)computes the snapshot rows of the provided months for company, from its posted journal items. """
+        for period_start in period_starts:
+            # Lock the period row first; see _mark_dirty.
+            self.env.cr.execute("""
+                INSERT INTO account_report_balance_snapshot_period (company_id, date, state)
+                     VALUES (%s, %s, 'valid')
+                ON CONFLICT (company_id, date) DO UPDATE SET state = 'valid'
+            """, [company.id, period_start])
+            self.env.cr.execute("""
+                DELETE FROM account_report_balance_snapshot
+                      WHERE company_id = %s
+                        AND date = %s
+            """, [company.id, period_start])
+            self.env.cr.execute("""
+                INSERT INTO account_report_balance_snapshot (company_id, date, account_id, journal_id, partner_id, balance, aml_count)
+                     SELECT account_move_line.company_id,
+                            %s,
+                            account_move_line.account_id,
+                            account_move_line.journal_id,
+                            account_move_line.partner_id,
+                            SUM(account_move_line.balance),
+                            COUNT(account_move_line.id)
+                       FROM account_move_line
+                      WHERE account_move_line.company_id = %s
+                        AND account_move_line.parent_state = 'posted'
+                        AND account_move_line.account_id IS NOT NULL
+                        AND account_move_line.date >= %s
+                        AND account_move_line.date < %s
+                   GROUP BY account_move_line.company_id,
+                            account_move_line.account_id,
+                            account_move_line.journal_id,
+                            account_move_line.partner_id
+            """, [period_start, company.id, period_start, period_start + relativedelta(months=1)])
+        self.invalidate_model()
+
+    @api.model
+    def _get_covered_until(self, company_ids):
+        """ Returns a dict {company_id: date}, giving for each company having snapshots enabled the last day of the
+        contiguous run of valid snapshot periods starting at its first period. All the posted journal items dated up to
+        that day are accounted for in account.report.balance.snapshot. Companies without such a run are left out.
+        """
+        companies = self.env['res.company'].browse(company_ids).sudo().filtered('account_report_balance_snapshot')
+        if not companies:
+            return {}
+
+        self.env.cr.execute("""
+            SELECT company_id, date, state
+              FROM account_report_balance_snapshot_period
+             WHERE company_id IN %s
+          ORDER BY company_id, date
+        """, [tuple(companies.ids)])
+
+        covered_until = {}
+        interrupted_company_ids = set()
+        expected_period_by_company = {}
+        for company_id, period_start, state in self.env.cr.fetchall():
+            if company_id in interrupted_company_ids:
+                continue
+
+            expected_period = expected_period_by_company.get(company_id)
+            if state != 'valid' or (expected_period and period_start != expected_period):
+                interrupted_company_ids.add(company_id)
+                continue
+
+            next_period_start = period_start + relativedelta(months=1)
+            covered_until[company_id] = next_period_start - relativedelta(days=1)
+            expected_period_by_company[company_id] = next_period_start
+
+        return covered_until
+
+    @api.model
+    def _cron_build_balance_snapshots(self, batch_size=24):
+        """ Builds the missing and dirty snapshot periods of all the companies having snapshots enabled.
+
+        :param batch_size: The maximum number of months to build per company at each run. The cron is retriggered
+                           as long as some periods remain to be built.
+        """
+        remaining = False
+        for company in self.env['res.company'].search([('account_report_balance_snapshot', '=', True)]):
+            periods_to_build = self._get_periods_to_build(company)
+            self._build_periods(company, periods_to_build[:batch_size])
+            remaining = remaining or len(periods_to_build) > batch_size
+            _logger.info("Built %s balance snapshot period(s) for company %s.", min(len(periods_to_build), batch_size), company.id)
+
+        if remaining:
+            self.env.ref('account_reports.ir_cron_account_report_balance_snapshot')._trigger()
+
+
+class AccountReportBalanceSnapshotPeriod(models.Model):
+    _name = 'account.report.balance.snapshot.period'
+    _description = "Accounting Report Balance Snapshot Period"
+    _log_access = False
+    _order = 'company_id, date'
+
+    company_id = fields.Many2one(comodel_name='res.company', required=True, readonly=True, ondelete='cascade')
+    date = fields.Date(string="Period Start", required=True, readonly=True)
+    state = fields.Selection(
+        selection=[('valid', "Valid"), ('dirty', "Dirty")],
+        required=True,
+        readonly=True,
+        default='dirty',
+    )
+
+    _sql_constraints = [
+        ('company_date_uniq', 'unique (company_id, date)', "A balance snapshot period must be unique per company."),
+    ]
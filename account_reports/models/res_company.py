@@ -33,6 +33,28 @@ class ResCompany(models.Model):
     account_representative_id = fields.Many2one('res.partner', string='Accounting Firm',
                                                 help="Specify an Accounting Firm that will act as a representative when exporting reports.")
     account_display_representative_field = fields.Boolean(compute='_compute_account_display_representative_field')
+    account_report_balance_snapshot = fields.Boolean(
+        string="Accounting Reports Balance Snapshots",
+        help="When ticked, the balances of the closed months are aggregated by a scheduled action, so that the "
+             "accounting reports don't need to read all the journal items of those months again.")
+    # Version of the accounts of the company, keying the cache of the account_codes engine (see _get_account_codes_prefix_map)
+    account_codes_version = fields.Integer(readonly=True, copy=False)
+
+    def init(self):
+        super().init()
+        self.env.cr.execute("CREATE SEQUENCE IF NOT EXISTS res_company_account_codes_version_seq")
+
+    def _bump_account_codes_version(self):
+        """ Invalidate the accounts matching each prefix of the account_codes engine cached for the companies in self.
+        The new versions come from a sequence, so that a version is never reused, even after a rollback.
+        """
+        if not self:
+            return
+        self.env.cr.execute(
+            "UPDATE res_company SET account_codes_version = nextval('res_company_account_codes_version_seq') WHERE id IN %s",
+            [tuple(self.ids)],
+        )
+        self.invalidate_recordset(['account_codes_version'])
 
     @api.depends('account_fiscal_country_id.code')
     def _compute_account_display_representative_field(self):
@@ -72,6 +94,11 @@ class ResCompany(models.Model):
                 if need_tax_closing_update:
                     to_update += company
 
+        if 'account_report_balance_snapshot' in values:
+            # Snapshots are not maintained while disabled; start again from scratch.
+            self.env['account.report.balance.snapshot'].sudo().search([('company_id', 'in', self.ids)]).unlink()
+            self.env['account.report.balance.snapshot.period'].sudo().search([('company_id', 'in', self.ids)]).unlink()
+
         res = super().write(values)
 
         for update_company in to_update:
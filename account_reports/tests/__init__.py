@@ -29,3 +29,4 @@ from . import test_all_reports_generation
 from . import test_analytic_reports
 from . import test_deferred_reports
 from . import test_report_sections
+from . import test_balance_snapshots
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+from freezegun import freeze_time
+
+from odoo.addons.account_reports.tests.common import TestAccountReportsCommon
+from odoo import fields
+from odoo.tests import new_test_user, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestBalanceSnapshots(TestAccountReportsCommon):
+
+    @classmethod
+    def setUpClass(cls, chart_template_ref=None):
+        super().setUpClass(chart_template_ref=chart_template_ref)
+
+        cls.invoices = cls.env['account.move']
+        for invoice_date, amount in (('2020-01-15', 1000.0), ('2020-02-10', 500.0), ('2020-03-05', 250.0), ('2020-04-20', 125.0)):
+            cls.invoices += cls.init_invoice('out_invoice', partner=cls.partner_a, invoice_date=invoice_date, amounts=[amount], post=True)
+        cls.bill = cls.init_invoice('in_invoice', partner=cls.partner_b, invoice_date='2020-02-25', amounts=[300.0], post=True)
+
+        cls.report = cls.env.ref('account_reports.profit_and_loss')
+        cls.balance_sheet = cls.env.ref('account_reports.balance_sheet')
+
+    def _get_report_values(self, report, date_from, date_to):
+        options = self._generate_options(report, date_from, date_to)
+        return [
+            (line['name'], [column.get('no_format') for column in line['columns']])
+            for line in report._get_lines(options)
+        ]
+
+    def _get_all_report_values(self, user=None):
+        report = self.report.with_user(user) if user else self.report
+        balance_sheet = self.balance_sheet.with_user(user) if user else self.balance_sheet
+        return [
+            self._get_report_values(report, '2020-01-01', '2020-04-30'),
+            self._get_report_values(report, '2020-02-01', '2020-03-15'),
+            self._get_report_values(balance_sheet, '2020-01-01', '2020-03-31'),
+        ]
+
+    def _build_snapshots(self):
+        self.env['account.report.balance.snapshot']._cron_build_balance_snapshots()
+
+    @freeze_time('2020-04-25')
+    def test_snapshots_same_result(self):
+        expected_values = self._get_all_report_values()
+
+        self.env.company.account_report_balance_snapshot = True
+        self._build_snapshots()
+
+        covered_until = self.env['account.report.balance.snapshot']._get_covered_until(self.env.company.ids)
+        self.assertEqual(covered_until.get(self.env.company.id), fields.Date.from_string('2020-03-31'))
+        self.assertEqual(self._get_all_report_values(), expected_values)
+
+    @freeze_time('2020-04-25')
+    def test_snapshots_invalidation(self):
+        self.env.company.account_report_balance_snapshot = True
+        self._build_snapshots()
+
+        # Changing the posted journal items of a period invalidates that period only.
+        self.invoices[1].button_draft()
+        self.init_invoice('out_invoice', partner=self.partner_a, invoice_date='2020-03-20', amounts=[42.0], post=True)
+        covered_until = self.env['account.report.balance.snapshot']._get_covered_until(self.env.company.ids)
+        self.assertEqual(covered_until.get(self.env.company.id), fields.Date.from_string('2020-01-31'))
+        values_with_snapshots = self._get_all_report_values()
+
+        self._build_snapshots()
+        self.assertEqual(self._get_all_report_values(), values_with_snapshots)
+
+        self.env.company.account_report_balance_snapshot = False
+        self.assertEqual(self._get_all_report_values(), values_with_snapshots)
+
+    @freeze_time('2020-04-25')
+    def test_snapshots_standard_record_rules(self):
+        """ The standard record rules of the accounting groups only restrict the companies: an accountant uses the
+        snapshots. """
+        accountant = new_test_user(
+            self.env, login='snapshot_accountant', groups='account.group_account_manager',
+            company_id=self.env.company.id, company_ids=self.env.company.ids,
+        )
+        expected_values = self._get_all_report_values(user=accountant)
+
+        self.env.company.account_report_balance_snapshot = True
+        self._build_snapshots()
+
+        options = self._generate_options(self.report, '2020-01-01', '2020-04-30')
+        self.assertEqual(
+            self.report.with_user(accountant)._get_balance_snapshot_bounds(options, 'normal'),
+            {self.env.company.id: fields.Date.from_string('2020-03-31')},
+        )
+        self.assertEqual(self._get_all_report_values(user=accountant), expected_values)
+
+    @freeze_time('2020-04-25')
+    def test_snapshots_record_rules(self):
+        """ Snapshots aggregate all the journal items; they mustn't be used when a record rule hides some of them. """
+        accountant = new_test_user(
+            self.env, login='snapshot_accountant', groups='account.group_account_manager',
+            company_id=self.env.company.id, company_ids=self.env.company.ids,
+        )
+        self.env['ir.rule'].create({
+            'name': "Hide the vendor bills",
+            'model_id': self.env['ir.model']._get_id('account.move.line'),
+            'domain_force': "[('journal_id.type', '!=', 'purchase')]",
+            'groups': [(4, self.env.ref('account.group_account_manager').id)],
+        })
+        expected_values = self._get_all_report_values(user=accountant)
+        self.assertNotEqual(expected_values, self._get_all_report_values())
+
+        self.env.company.account_report_balance_snapshot = True
+        self._build_snapshots()
+
+        options = self._generate_options(self.report, '2020-01-01', '2020-04-30')
+        self.assertFalse(self.report.with_user(accountant)._get_balance_snapshot_bounds(options, 'normal'))
+        self.assertEqual(self._get_all_report_values(user=accountant), expected_values)
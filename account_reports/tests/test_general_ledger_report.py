@@ -659,3 +659,38 @@ class TestGeneralLedgerReport(TestAccountReportsCommon, odoo.tests.HttpCase):
             ],
             options
         )
+
+    def test_general_ledger_background_export(self):
+        options = self._generate_options(self.report, fields.Date.from_string('2017-01-01'), fields.Date.from_string('2017-12-31'))
+        print_options = self.report.get_options(previous_options={**options, 'export_mode': 'print'})
+        handler = self.env['account.general.ledger.report.handler']
+
+        # A tiny page size makes the streamed lines go through several pages of move lines for the same account.
+        streamed_lines = handler._custom_xlsx_lines_generator(self.report, print_options, page_size=2)
+        self.assertEqual(
+            [(line['name'], [column.get('no_format') for column in line['columns']]) for line in streamed_lines],
+            [(line['name'], [column.get('no_format') for column in line['columns']]) for line in self.report._get_lines(print_options)],
+        )
+
+        handler.action_export_xlsx_in_background(options)
+        export = self.env['account.report.background.export'].search([('report_id', '=', self.report.id)])
+        export._cron_process_exports()
+        self.assertRecordValues(export, [{'state': 'done'}])
+        self.assertTrue(export.attachment_id.raw.startswith(b'PK'), "The attachment should hold the XLSX file")
+        self.assertEqual(export.attachment_id.file_size, len(export.attachment_id.raw))
+
+    def test_general_ledger_background_export_move_without_name(self):
+        options = self._generate_options(self.report, fields.Date.from_string('2017-01-01'), fields.Date.from_string('2017-12-31'))
+        print_options = self.report.get_options(previous_options={**options, 'export_mode': 'print'})
+        handler = self.env['account.general.ledger.report.handler']
+
+        # A NULL move name must not stop the keyset pagination of the move lines.
+        self.env.flush_all()
+        self.env.cr.execute("UPDATE account_move SET name = NULL WHERE id = %s", [self.move_2017_1.id])
+        self.env.invalidate_all()
+
+        streamed_lines = handler._custom_xlsx_lines_generator(self.report, print_options, page_size=2)
+        self.assertEqual(
+            [(line['name'], [column.get('no_format') for column in line['columns']]) for line in streamed_lines],
+            [(line['name'], [column.get('no_format') for column in line['columns']]) for line in self.report._get_lines(print_options)],
+        )
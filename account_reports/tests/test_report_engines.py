@@ -1833,3 +1833,84 @@ class TestReportEngines(TestAccountReportsCommon):
             ],
             options,
         )
+
+    def test_account_codes_fused_column_groups(self):
+        """ The account_codes batches of all the column groups are evaluated with a single query when comparing periods.
+        This test makes sure the fused query gives the same result as computing each column group separately.
+        """
+        report = self._create_report(
+            [
+                self._prepare_test_report_line(self._prepare_test_expression_account_codes('1')),
+                self._prepare_test_report_line(self._prepare_test_expression_account_codes('11D - 12C')),
+                self._prepare_test_report_line(self._prepare_test_expression_account_codes('1', date_scope='from_beginning'), groupby='account_id'),
+            ],
+        )
+
+        self._create_test_account_moves([
+            self._prepare_test_account_move_line(100, account_code='11', date='2020-01-15'),
+            self._prepare_test_account_move_line(-30, account_code='12', date='2020-01-20'),
+            self._prepare_test_account_move_line(50, account_code='13', date='2020-01-25'),
+            self._prepare_test_account_move_line(200, account_code='12', date='2020-02-10'),
+            self._prepare_test_account_move_line(-400, account_code='11', date='2020-03-05'),
+        ])
+
+        options = self._generate_options(report, '2020-03-01', '2020-03-31', default_options={'unfold_all': True})
+        options = self._update_comparison_filter(options, report, 'previous_period', 2)
+
+        with patch.object(type(report), '_compute_formula_batch_with_engine_account_codes', side_effect=AssertionError("Column groups should be fused")):
+            fused_lines = report._get_lines(options)
+
+        with patch.object(type(report), '_compute_account_codes_batches_for_all_column_groups', return_value={}):
+            separate_lines = report._get_lines(options)
+
+        self.assertEqual(
+            [(line['name'], [column.get('no_format') for column in line['columns']]) for line in fused_lines],
+            [(line['name'], [column.get('no_format') for column in line['columns']]) for line in separate_lines],
+        )
+        self.assertLinesValues(
+            # pylint: disable=bad-whitespace
+            fused_lines,
+            [   0,                     1,         2,         3],
+            [
+                ('test_line_1',   -400.0,     200.0,     120.0),
+                ('test_line_2',      0.0,       0.0,     130.0),
+                ('test_line_3',    -80.0,     320.0,     120.0),
+                ('11 11',         -300.0,     100.0,     100.0),
+                ('12 12',          170.0,     170.0,     -30.0),
+                ('13 13',           50.0,      50.0,      50.0),
+            ],
+            options,
+        )
+
+    def test_account_codes_prefix_cache_invalidation(self):
+        """ The accounts matching the prefixes of the account_codes engine are cached between renders. This test makes sure
+        creating accounts and changing their code invalidates that cache.
+        """
+        report = self._create_report([self._prepare_test_report_line(self._prepare_test_expression_account_codes('21'))])
+        self._create_test_account_moves([
+            self._prepare_test_account_move_line(100, account_code='211'),
+            self._prepare_test_account_move_line(50, account_code='221'),
+        ])
+        options = self._generate_options(report, '2020-01-01', '2020-01-01')
+
+        self.assertLinesValues(report._get_lines(options), [0, 1], [('test_line_1', 100.0)], options)
+
+        self.env['account.account'].search([('code', '=', '221'), ('company_id', '=', self.env.company.id)]).code = '212'
+        self.assertLinesValues(report._get_lines(options), [0, 1], [('test_line_1', 150.0)], options)
+
+        self._create_test_account_moves([self._prepare_test_account_move_line(25, account_code='213')])
+        self.assertLinesValues(report._get_lines(options), [0, 1], [('test_line_1', 175.0)], options)
+
+    def test_account_codes_prefix_cache_invalidation_parent_company(self):
+        """ The accounts of the parent companies are matched by the account_codes engine for their branches, so creating
+        one must also invalidate the cache of the branches.
+        """
+        report = self._create_report([self._prepare_test_report_line(self._prepare_test_expression_account_codes('21'))])
+        branch = self.env['res.company'].create({'name': "Branch", 'parent_id': self.env.company.id})
+        options = {'companies': [{'id': branch.id}]}
+
+        _prefix_details, accounts_prefix_map = report._get_account_codes_engine_plan(options, {'21': None})
+        new_account = self.env['account.account'].create({'code': '214', 'name': '214', 'account_type': 'asset_current'})
+        _prefix_details, accounts_prefix_map_after = report._get_account_codes_engine_plan(options, {'21': None})
+        self.assertNotIn(new_account.id, accounts_prefix_map)
+        self.assertIn(new_account.id, accounts_prefix_map_after)
@@ -219,6 +219,12 @@ class AccountReport(models.Model):
         context_self = self.with_context(account_report_cash_basis=options.get('report_cash_basis'))
         return super(AccountReport, context_self)._query_get(options, date_scope, domain=domain)
 
+    def _get_balance_snapshot_bounds(self, options, date_scope):
+        # The balance snapshots aggregate the journal items on accrual basis.
+        if options.get('report_cash_basis'):
+            return {}
+        return super()._get_balance_snapshot_bounds(options, date_scope)
+
     def open_document(self, options, params=None):
         action = super().open_document(options, params)
         action['context'].pop('cash_basis', '')
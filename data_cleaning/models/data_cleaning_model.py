@@ -12,6 +12,10 @@ from odoo.tools import split_every
 # This is quite slow so requires smaller batch size.
 DR_CREATE_STEP_AUTO = 5000
 DR_CREATE_STEP_MANUAL = 50000
+# Number of records formatted at once by the phone cleaner, to keep the memory bounded.
+DR_PHONE_FORMAT_STEP = 10000
+# Maximum number of formatted phone numbers kept between the chunks of _clean_records_format_phone
+DR_PHONE_FORMAT_CACHE_SIZE = 50000
 
 
 class DataCleaningModel(models.Model):
@@ -80,30 +84,53 @@ class DataCleaningModel(models.Model):
     def _clean_records_format_phone(self, actions, field):
         self.ensure_one()
 
-        self._cr.execute("""
-            SELECT res_id, data_cleaning_rule_id
-            FROM data_cleaning_record
-            JOIN data_cleaning_record_data_cleaning_rule_rel
-            ON data_cleaning_record_data_cleaning_rule_rel.data_cleaning_record_id = data_cleaning_record.id""")
-        existing_rows = self._cr.fetchall()
-
-        records = self.env[self.res_model_name].search([(field, 'not in', [False, ''])])
-        records = records.with_context(prefetch_fields=False)
-        # Avoids multiple select queries when reading fields in _get_country_id and record[field].
-        records.read([fname for fname in ['country_id', 'company_id'] if fname in records] + [field])
         field_id = actions[field]['field_id']
         rule_ids = actions[field]['rule_ids']
+        Model = self.env[self.res_model_name].with_context(prefetch_fields=False)
+        fnames = [fname for fname in ['country_id', 'company_id'] if fname in Model] + [field]
+        # The same numbers come back often (switchboards, shared numbers), so each one is only
+        # parsed once per country, as long as it is among the last DR_PHONE_FORMAT_CACHE_SIZE ones.
+        formatted_numbers = {}
         result = []
-        for record in records:
-            record_country = self.env['data_cleaning.record']._get_country_id(record)
-            formatted = self.env[self.res_model_name]._phone_format(number=record[field], country=record_country, force_format='INTERNATIONAL')
-            if (record.id, rule_ids[0]) not in existing_rows and formatted and record[field] != formatted:
-                result.append({
-                    'res_id': record['id'],
-                    'rule_ids': rule_ids,
-                    'cleaning_model_id': self.id,
-                    'field_id': field_id,
-                })
+        last_id = 0
+        while True:
+            # Keyset pagination, only one chunk of records is loaded at a time.
+            records = Model.search([(field, 'not in', [False, '']), ('id', '>', last_id)], order='id', limit=DR_PHONE_FORMAT_STEP)
+            if not records:
+                break
+            last_id = records[-1].id
+            # Avoids multiple select queries when reading fields in _get_country_id and record[field].
+            records.read(fnames)
+
+            self._cr.execute("""
+                SELECT res_id
+                FROM data_cleaning_record
+                JOIN data_cleaning_record_data_cleaning_rule_rel
+                ON data_cleaning_record_data_cleaning_rule_rel.data_cleaning_record_id = data_cleaning_record.id
+                WHERE data_cleaning_rule_id = %s AND res_id IN %s""", [rule_ids[0], tuple(records.ids)])
+            existing_res_ids = {res_id for res_id, in self._cr.fetchall()}
+
+            for record in records:
+                if record.id in existing_res_ids:
+                    continue
+                number = record[field]
+                record_country = self.env['data_cleaning.record']._get_country_id(record)
+                key = (number, record_country.id)
+                formatted = formatted_numbers.pop(key, None)
+                if formatted is None:
+                    if len(formatted_numbers) >= DR_PHONE_FORMAT_CACHE_SIZE:
+                        # Drop the least recently used number
+                        del formatted_numbers[next(iter(formatted_numbers))]
+                    formatted = Model._phone_format(number=number, country=record_country, force_format='INTERNATIONAL')
+                formatted_numbers[key] = formatted
+                if formatted and number != formatted:
+                    result.append({
+                        'res_id': record.id,
+                        'rule_ids': rule_ids,
+                        'cleaning_model_id': self.id,
+                        'field_id': field_id,
+                    })
+            records.invalidate_recordset(fnames)
         return result
 
 
@@ -88,7 +88,7 @@ class DataMergeGroup(models.Model):
 
             records = group.record_ids._original_records()
             if not records:
-                return
+                continue
 
             master = elect_master(records)
             if master:
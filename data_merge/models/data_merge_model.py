@@ -2,43 +2,154 @@
 
 from odoo import models, api, fields, _
 from odoo.exceptions import UserError, ValidationError
-from odoo.tools import SQL
+from odoo.tools import SQL, split_every
 
 from psycopg2 import ProgrammingError, errorcodes
 
+from collections import defaultdict
 from dateutil.relativedelta import relativedelta
 
 import ast
+import random
 import timeit
 import logging
 import re
+import zlib
 
 from odoo.osv.expression import get_unaccent_wrapper
 
 _logger = logging.getLogger(__name__)
 
+class UnionFind:
+    """ Disjoint sets of hashable elements, merged in quasi-constant time. """
+
+    def __init__(self):
+        self.parent = {}
+
+    def find(self, element):
+        """ Return the representative of the set of element, adding it as a singleton if unknown. """
+        parent = self.parent
+        root = parent.setdefault(element, element)
+        while parent[root] != root:
+            root = parent[root]
+        while parent[element] != root:
+            parent[element], element = root, parent[element]
+        return root
+
+    def union(self, element, other):
+        root, other_root = self.find(element), self.find(other)
+        if root != other_root:
+            self.parent[other_root] = root
+
+    def groups(self):
+        groups = defaultdict(set)
+        for element in self.parent:
+            groups[self.find(element)].add(element)
+        return list(groups.values())
+
+
 # Merge list of list based on their common element
 #   Input: [['a', 'b'], ['b', 'c'], ['d', 'e']]
 #   Output: [['a', 'b', 'c'], ['d', 'e']]
-# https://stackoverflow.com/a/9112588
 def merge_common_lists(lsts):
-    sets = [set(lst) for lst in lsts if lst]
-    merged = True
-    while merged:
-        merged = False
-        results = []
-        while sets:
-            common, rest = sets[0], sets[1:]
-            sets = []
-            for x in rest:
-                if x.isdisjoint(common):
-                    sets.append(x)
-                else:
-                    merged = True
-                    common |= x
-            results.append(common)
-        sets = results
-    return sets
+    union_find = UnionFind()
+    for lst in lsts:
+        for element in lst:
+            union_find.union(lst[0], element)
+    return union_find.groups()
+
+
+# MinHash signatures of SIMILARITY_NUM_PERM universal hash functions, see group_similar_values
+SIMILARITY_NUM_PERM = 32
+SIMILARITY_PRIME = (1 << 61) - 1
+_similarity_random = random.Random(42)
+SIMILARITY_PERMUTATIONS = [
+    (_similarity_random.randrange(1, SIMILARITY_PRIME), _similarity_random.randrange(0, SIMILARITY_PRIME))
+    for _i in range(SIMILARITY_NUM_PERM)
+]
+# Values sharing a MinHash band with more values than that are not compared, see _get_minhash_candidate_pairs
+SIMILARITY_MAX_BUCKET_SIZE = 500
+
+
+def _get_ngrams(value, size=3):
+    padded = '%s%s ' % (' ' * (size - 1), value)
+    return {padded[index:index + size] for index in range(len(padded) - size + 1)}
+
+
+def _get_minhash_candidate_pairs(ngram_sets, threshold):
+    """ Yield the pairs of indexes of the sets of ngrams that share a band of their MinHash signature.
+
+    Buckets of more than SIMILARITY_MAX_BUCKET_SIZE values are skipped: such bands are too common to tell the
+    duplicates apart (e.g. very short values) and comparing all their values would be quadratic.
+    """
+    nb_rows = next((
+        nb_rows for nb_rows in (8, 4, 2)
+        if (nb_rows / SIMILARITY_NUM_PERM) ** (1 / nb_rows) <= threshold * 0.85
+    ), 1)
+
+    buckets = defaultdict(list)
+    for index, ngrams in enumerate(ngram_sets):
+        hashes = [zlib.crc32(ngram.encode()) for ngram in ngrams]
+        signature = [min((a * h + b) % SIMILARITY_PRIME for h in hashes) for a, b in SIMILARITY_PERMUTATIONS]
+        for band_start in range(0, SIMILARITY_NUM_PERM, nb_rows):
+            buckets[band_start, tuple(signature[band_start:band_start + nb_rows])].append(index)
+
+    for indexes in buckets.values():
+        if len(indexes) > SIMILARITY_MAX_BUCKET_SIZE:
+            _logger.info('Skipped a bucket of %s similar values', len(indexes))
+            continue
+        for position, index in enumerate(indexes):
+            for other_index in indexes[:position]:
+                yield other_index, index
+
+
+def _get_changed_candidate_pairs(ngram_sets, changed_indexes):
+    """ Yield the pairs of indexes of the sets of ngrams sharing at least one ngram, one of them being in
+    changed_indexes. The sets of the other values are only looked up in an index of the ngrams of the changed ones.
+    """
+    indexes_per_ngram = defaultdict(list)
+    for index in changed_indexes:
+        for ngram in ngram_sets[index]:
+            indexes_per_ngram[ngram].append(index)
+
+    for index, ngrams in enumerate(ngram_sets):
+        other_indexes = {other_index for ngram in ngrams for other_index in indexes_per_ngram.get(ngram, ())}
+        for other_index in other_indexes:
+            if other_index != index:
+                yield other_index, index
+
+
+def group_similar_values(values, threshold, changed_indexes=None):
+    """ Group the values whose trigrams are similar enough, transitively.
+
+    Two values are similar when the Jaccard index of their sets of trigrams is at least threshold. Rather than
+    comparing all the pairs of values, the values are blocked with MinHash LSH: the MinHash signature of each value is
+    split in bands, and only the values having an identical band, which most likely are similar, are compared. The
+    number of rows per band is chosen so that pairs of values with a similarity of threshold share a band with a very
+    high probability.
+
+    When only a few values changed since the last search (changed_indexes), the other ones are already grouped: only
+    the pairs involving a changed value and sharing a trigram with it are compared, and no signature is computed.
+
+    :param list values: distinct strings
+    :param float threshold: minimal similarity, between 0 and 1
+    :param list changed_indexes: the indexes in values of the values that changed since the last search, if any
+    :return: the lists of indexes in values of the groups of similar values, with at least 2 values
+    """
+    ngram_sets = [_get_ngrams(value) for value in values]
+    if changed_indexes is not None and len(changed_indexes) * 2 <= len(values):
+        candidate_pairs = _get_changed_candidate_pairs(ngram_sets, changed_indexes)
+    else:
+        candidate_pairs = _get_minhash_candidate_pairs(ngram_sets, threshold)
+
+    union_find = UnionFind()
+    for other_index, index in candidate_pairs:
+        if union_find.find(index) == union_find.find(other_index):
+            continue
+        ngrams, other_ngrams = ngram_sets[index], ngram_sets[other_index]
+        if len(ngrams & other_ngrams) >= threshold * len(ngrams | other_ngrams):
+            union_find.union(other_index, index)
+    return [sorted(group) for group in union_find.groups() if len(group) > 1]
 
 
 class DataMergeModel(models.Model):
@@ -64,6 +175,9 @@ class DataMergeModel(models.Model):
     records_to_merge_count = fields.Integer(compute='_compute_records_to_merge_count')
 
     mix_by_company = fields.Boolean('Cross-Company', default=False, help="When enabled, duplicates across different companies will be suggested")
+    last_search_date = fields.Datetime(string='Last Duplicate Search', readonly=True, copy=False,
+        help="Start of the last search of duplicates. The next incremental search only looks for the duplicates "
+             "of the records created or modified since then.")
 
     ### User Notifications for Manual merge
     notify_user_ids = fields.Many2many('res.users', string='Notify Users',
@@ -174,14 +288,16 @@ class DataMergeModel(models.Model):
         """
         Identify duplicate records for each active model and either notify the users or automatically merge the duplicates
         """
-        self.env['data_merge.model'].sudo().search([]).find_duplicates(batch_commits=True)
+        self.env['data_merge.model'].sudo().search([]).find_duplicates(batch_commits=True, incremental=True)
         self._notify_new_duplicates()
 
-    def find_duplicates(self, batch_commits=False):
+    def find_duplicates(self, batch_commits=False, incremental=False):
         """
         Search for duplicate records and create the data_merge.group along with its data_merge.record
 
         :param bool batch_commits: If set, will automatically commit every X records
+        :param bool incremental: If set, only look for the duplicates of the records created or modified since the
+            last search (see last_search_date). Their values are still compared with the ones of all the records.
         """
         unaccent = get_unaccent_wrapper(self.env.cr)
         self.env.flush_all()
@@ -190,6 +306,11 @@ class DataMergeModel(models.Model):
             ids = []
             res_model = self.env[dm_model.res_model_name]
             table = res_model._table
+            search_date = self.env.cr.now()
+            watermark = False
+            write_date_field = res_model._fields.get('write_date')
+            if incremental and write_date_field and write_date_field.store:
+                watermark = dm_model.last_search_date
 
             for rule in dm_model.rule_ids:
                 domain = ast.literal_eval(dm_model.domain or '[]')
@@ -201,37 +322,69 @@ class DataMergeModel(models.Model):
                     rhs_alias = query.join(lhs_alias, lhs_column, related_model._table, 'id', lhs_column)
                     sql_field = related_model._field_to_sql(rhs_alias, related_model._rec_name, query)
 
-                if rule.match_mode == 'accent':
+                if rule.match_mode in ('accent', 'similarity'):
                     # Since unaccent is case sensitive, we must add a lower to make sql_field insensitive
                     sql_field = unaccent(SQL('lower(%s)', sql_field))
 
-                sql_group_by = SQL()
+                sql_company = None
                 company_field = res_model._fields.get('company_id')
                 if company_field and not dm_model.mix_by_company:
                     if company_field.store or company_field.inherited:
-                        sql_group_by = SQL(', %s', res_model._field_to_sql(table, 'company_id', query))
+                        sql_company = res_model._field_to_sql(table, 'company_id', query)
                     elif company_field.related and company_field.related_field.store:
-                        sql_group_by = SQL(', %s', res_model._field_to_sql(table, company_field.related, query))
+                        sql_company = res_model._field_to_sql(table, company_field.related, query)
 
                 # Get all the rows matching the rule defined
                 # (e.g. exact match of the name) having at least 2 records
                 # Each row contains the matched value and an array of matching records:
-                #   | value matched | {array of record IDs matching the field}
+                #   | value matched | {array of record IDs matching the field} | company | changed since the last search
+                # The similarity rules need all the values, to compare them with each other.
                 sql = SQL(
                     """
                     SELECT %(field)s AS group_field_name,
-                        array_agg(%(table_id)s ORDER BY %(table_id)s ASC)
+                        array_agg(%(table_id)s ORDER BY %(table_id)s ASC),
+                        %(company)s,
+                        %(changed)s
                     FROM %(tables)s
                     WHERE length(%(field)s) > 0 AND %(where_clause)s
                     GROUP BY group_field_name %(group_by)s
-                    HAVING COUNT(%(field)s) > 1
+                    %(having)s
                     """,
                     field=sql_field,
                     table_id=SQL.identifier(table, 'id'),
+                    company=sql_company or SQL('NULL'),
+                    changed=SQL('bool_or(%s >= %s)', SQL.identifier(table, 'write_date'), watermark) if watermark else SQL('TRUE'),
                     tables=query.from_clause,
                     where_clause=query.where_clause or SQL("TRUE"),
-                    group_by=sql_group_by,
+                    group_by=SQL(', %s', sql_company) if sql_company else SQL(),
+                    having=SQL() if rule.match_mode == 'similarity' else SQL('HAVING COUNT(%s) > 1', sql_field),
                 )
+                if watermark and rule.match_mode != 'similarity':
+                    # Only the values of the records modified since the last search can have new duplicates.
+                    sql = SQL(
+                        """
+                        SELECT %(field)s AS group_field_name,
+                            array_agg(%(table_id)s ORDER BY %(table_id)s ASC),
+                            %(company)s
+                        FROM %(tables)s
+                        WHERE length(%(field)s) > 0 AND %(where_clause)s
+                            AND %(field)s IN (
+                                SELECT %(field)s
+                                FROM %(tables)s
+                                WHERE %(where_clause)s AND %(write_date)s >= %(watermark)s
+                            )
+                        GROUP BY group_field_name %(group_by)s
+                        HAVING COUNT(%(field)s) > 1
+                        """,
+                        field=sql_field,
+                        table_id=SQL.identifier(table, 'id'),
+                        company=sql_company or SQL('NULL'),
+                        tables=query.from_clause,
+                        where_clause=query.where_clause or SQL("TRUE"),
+                        write_date=SQL.identifier(table, 'write_date'),
+                        watermark=watermark,
+                        group_by=SQL(', %s', sql_company) if sql_company else SQL(),
+                    )
 
                 try:
                     self._cr.execute(sql)
@@ -241,6 +394,18 @@ class DataMergeModel(models.Model):
                     raise
 
                 rows = self._cr.fetchall()
+                if rule.match_mode == 'similarity':
+                    rows_per_company = defaultdict(list)
+                    for row in rows:
+                        rows_per_company[row[2]].append(row)
+                    for company_rows in rows_per_company.values():
+                        # Only the values of the records modified since the last search can have new similar values.
+                        changed_indexes = [index for index, row in enumerate(company_rows) if row[3]] if watermark else None
+                        if changed_indexes == []:
+                            continue
+                        for indexes in group_similar_values([row[0] for row in company_rows], rule.match_threshold / 100, changed_indexes):
+                            ids.append([res_id for index in indexes for res_id in company_rows[index][1]])
+                    rows = [row for row in rows if len(row[1]) > 1]
                 ids = ids + [row[1] for row in rows]
 
             # Fetches the IDs of all the records who already matched (and are not merged),
@@ -253,6 +418,18 @@ class DataMergeModel(models.Model):
                 WHERE model_id = %s
                 GROUP BY group_id""", [dm_model.id])
             done_groups_res_ids = [set(x[0]) for x in self._cr.fetchall()]
+            done_groups_per_res_id = defaultdict(list)
+            for done_group_res_ids in done_groups_res_ids:
+                for res_id in done_group_res_ids:
+                    done_groups_per_res_id[res_id].append(done_group_res_ids)
+
+            if watermark:
+                # The matches between records that did not change since the last search are not searched again: the
+                # existing groups stand for them. Add the groups touched by the new matches, so that merging the lists
+                # gives the same groups as a complete search (e.g. A-B matching by name and B-C newly matching by email
+                # gives A-B-C, not B-C).
+                matched_res_ids = {res_id for res_ids in ids for res_id in res_ids}
+                ids += [list(done_group_res_ids) for res_id in matched_res_ids for done_group_res_ids in done_groups_per_res_id[res_id]]
 
             _logger.info('Query identification done after %s' % str(timeit.default_timer() - t1))
             t1 = timeit.default_timer()
@@ -264,39 +441,47 @@ class DataMergeModel(models.Model):
             _logger.info('Merging lists done after %s' % str(timeit.default_timer() - t1))
             t1 = timeit.default_timer()
             _logger.info('Record creation started at %s', str(t1))
+
+            # Skip the groups whose IDs are already part of an existing group
+            # e.g.
+            #   The group with records A B C already exists:
+            #       1/ If group_to_create equals A B, do not create a new group
+            #       2/ If group_to_create equals A D, create the new group (A D is not a subset of A B C)
+            # Only the groups containing one of the IDs can contain all of them.
+            groups_to_create = [
+                group_to_create
+                for group_to_create in groups_to_create
+                if not any(group_to_create <= x for x in done_groups_per_res_id[next(iter(group_to_create))])
+            ]
             groups_created = 0
             groups_to_create_count = len(groups_to_create)
-            for group_to_create in groups_to_create:
-                groups_created += 1
-                if groups_created % 100 == 0:
-                    _logger.info('Created groups %s / %s' % (groups_created, groups_to_create_count))
-
-                # Check if the IDs of the group to create is already part of an existing group
-                # e.g.
-                #   The group with records A B C already exists:
-                #       1/ If group_to_create equals A B, do not create a new group
-                #       2/ If group_to_create equals A D, create the new group (A D is not a subset of A B C)
-                if any(group_to_create <= x for x in done_groups_res_ids):
-                    continue
-
-                group = self.env['data_merge.group'].with_context(prefetch_fields=False).create({'model_id': dm_model.id})
-                d = [{'group_id': group.id, 'res_id': rec} for rec in group_to_create]
-                self.env['data_merge.record'].with_context(prefetch_fields=False).create(d)
-
-                if groups_created % 1000 == 0 and batch_commits:
-                    self.env.cr.commit()
-
-                group._elect_master_record()
-
-                if dm_model.create_threshold > 0 and group.similarity * 100 <= dm_model.create_threshold:
-                    group.unlink()
-                    continue
+            for batch in split_every(1000, groups_to_create):
+                groups = self.env['data_merge.group'].with_context(prefetch_fields=False).create([
+                    {'model_id': dm_model.id} for _group_to_create in batch
+                ])
+                self.env['data_merge.record'].with_context(prefetch_fields=False).create([
+                    {'group_id': group.id, 'res_id': rec}
+                    for group, group_to_create in zip(groups, batch)
+                    for rec in group_to_create
+                ])
+                groups._elect_master_record()
+
+                if dm_model.create_threshold > 0:
+                    groups_below_threshold = groups.filtered(lambda group: group.similarity * 100 <= dm_model.create_threshold)
+                    groups_below_threshold.unlink()
+                    groups -= groups_below_threshold
 
                 if dm_model.merge_mode == 'automatic':
-                    if group.similarity * 100 >= dm_model.merge_threshold:
+                    for group in groups.filtered(lambda group: group.similarity * 100 >= dm_model.merge_threshold):
                         group.merge_records()
                         group.unlink()
 
+                groups_created += len(batch)
+                _logger.info('Created groups %s / %s' % (groups_created, groups_to_create_count))
+                if batch_commits:
+                    self.env.cr.commit()
+
+            dm_model.last_search_date = search_date
             _logger.info('Record creation done after %s' % str(timeit.default_timer() - t1))
 
     ##############
@@ -317,6 +502,10 @@ class DataMergeModel(models.Model):
         return super().copy(default)
 
     def write(self, vals):
+        if {'domain', 'mix_by_company', 'rule_ids', 'res_model_id'} & vals.keys():
+            # The duplicates of all the records have to be searched again
+            vals['last_search_date'] = False
+
         if 'active' in vals and not vals['active']:
             self.env['data_merge.group'].search([('model_id', 'in', self.ids)]).unlink()
 
@@ -16,17 +16,39 @@ class DataMergeRule(models.Model):
     match_mode = fields.Selection(
         lambda self: self._available_match_modes(),
         default='exact', string='Merge If', required=True)
+    match_threshold = fields.Integer(string='Match Threshold', default=80,
+        help='Minimum similarity (in %) between the values of two records for them to be suggested as duplicates')
     sequence = fields.Integer(string='Sequence', default=1)
 
     _sql_constraints = [
         ('uniq_model_id_field_id', 'unique(model_id, field_id)', 'A field can only appear once!'),
+        ('check_match_threshold', 'CHECK(match_threshold > 0 AND match_threshold <= 100)', 'The match threshold should be between 1 and 100'),
     ]
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        rules = super().create(vals_list)
+        rules.model_id.last_search_date = False
+        return rules
+
+    def write(self, vals):
+        if {'field_id', 'match_mode', 'match_threshold', 'model_id'} & vals.keys():
+            self.model_id.last_search_date = False
+        res = super().write(vals)
+        if 'model_id' in vals:
+            self.model_id.last_search_date = False
+        return res
+
+    def unlink(self):
+        self.model_id.last_search_date = False
+        return super().unlink()
+
     def _available_match_modes(self):
         modes = [('exact', _("Exact Match"))]
         # can't conditionally set demo data...
         if self.env.context.get('install_mode') or self.env.registry.has_unaccent:
             modes.append(('accent', _("Case/Accent Insensitive Match")))
+        modes.append(('similarity', _("Similar Match")))
         return modes
 
     def _update_default_rules(self):
@@ -1,5 +1,8 @@
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 
+from datetime import datetime
+
+from odoo.addons.data_merge.models.data_merge_model import group_similar_values, merge_common_lists
 from odoo.tests import tagged
 
 from . import test_common
@@ -39,6 +42,95 @@ class TestDeduplication(test_common.TestCommon):
 
         self.assertEqual(self.MyModel.records_to_merge_count, 2, '2 records should have been found')
 
+    def test_deduplication_similarity(self):
+        self.DMRule.create({
+            'model_id': self.MyModel.id,
+            'field_id': self.env['ir.model.fields']._get('x_dm_test_model', 'x_name').id,
+            'match_mode': 'similarity',
+            'match_threshold': 60,
+        })
+
+        jonathan = self._create_record('x_dm_test_model', x_name='Jonathan Smithson')
+        self._create_record('x_dm_test_model', x_name='Alice Cooper')
+        self.MyModel.find_duplicates()
+        self.MyModel._compute_records_to_merge_count()
+
+        self.assertEqual(self.MyModel.records_to_merge_count, 0, '0 record should have been found')
+
+        jonathon = self._create_record('x_dm_test_model', x_name='Jonathon Smithson')
+        jonathon_bis = self._create_record('x_dm_test_model', x_name='jonathon smithson')
+        self.MyModel.find_duplicates()
+        self.MyModel._compute_records_to_merge_count()
+
+        self.assertEqual(self.MyModel.records_to_merge_count, 3, '3 records should have been found')
+        group = self.DMGroup.search([('model_id', '=', self.MyModel.id)])
+        self.assertEqual(len(group), 1, '1 group should have been created')
+        self.assertEqual(set(group.record_ids.mapped('res_id')), {jonathan.id, jonathon.id, jonathon_bis.id})
+
+    def test_deduplication_incremental(self):
+        self._create_rule('x_name', 'exact')
+
+        self.patch(self.env.cr, 'now', lambda: datetime(2024, 1, 1))
+        self._create_record('x_dm_test_model', x_name='toto')
+        self._create_record('x_dm_test_model', x_name='toto')
+        self.patch(self.env.cr, 'now', lambda: datetime(2024, 1, 2))
+        self.MyModel.find_duplicates(incremental=True)
+        self.assertEqual(self.MyModel.last_search_date, datetime(2024, 1, 2))
+        self.assertEqual(self.DMGroup.search_count([('model_id', '=', self.MyModel.id)]), 1, 'The first search should be complete')
+
+        # Only the records modified since the last search are looked at
+        self.DMGroup.search([('model_id', '=', self.MyModel.id)]).unlink()
+        self.patch(self.env.cr, 'now', lambda: datetime(2024, 1, 3))
+        titis = self._create_record('x_dm_test_model', x_name='titi') + self._create_record('x_dm_test_model', x_name='titi')
+        self.MyModel.find_duplicates(incremental=True)
+        groups = self.DMGroup.search([('model_id', '=', self.MyModel.id)])
+        self.assertEqual(len(groups), 1, '1 group should have been created')
+        self.assertEqual(set(groups.record_ids.mapped('res_id')), set(titis.ids))
+
+        self.MyModel.find_duplicates()
+        self.assertEqual(self.DMGroup.search_count([('model_id', '=', self.MyModel.id)]), 2, '2 groups should have been found')
+
+        # Changing the rules requires a complete search
+        self.MyModel.rule_ids.match_mode = 'exact'
+        self.assertFalse(self.MyModel.last_search_date)
+
+    def test_deduplication_incremental_existing_groups(self):
+        self._create_rule('x_name', 'exact')
+        self._create_rule('x_email', 'exact')
+
+        self.patch(self.env.cr, 'now', lambda: datetime(2024, 1, 1))
+        rec_a = self._create_record('x_dm_test_model', x_name='toto', x_email='a@example.com')
+        rec_b = self._create_record('x_dm_test_model', x_name='toto', x_email='b@example.com')
+        rec_c = self._create_record('x_dm_test_model', x_name='titi', x_email='c@example.com')
+        self.patch(self.env.cr, 'now', lambda: datetime(2024, 1, 2))
+        self.MyModel.find_duplicates(incremental=True)
+
+        # Only C changed, but it is a duplicate of A through B
+        self.patch(self.env.cr, 'now', lambda: datetime(2024, 1, 3))
+        rec_c.x_email = 'b@example.com'
+        self.MyModel.find_duplicates(incremental=True)
+        groups = self.DMGroup.search([('model_id', '=', self.MyModel.id)])
+        self.assertCountEqual(
+            [set(group.record_ids.mapped('res_id')) for group in groups],
+            [{rec_a.id, rec_b.id}, {rec_a.id, rec_b.id, rec_c.id}],
+            'An incremental search should find the same groups as a complete one',
+        )
+
+    def test_merge_common_lists(self):
+        self.assertCountEqual(
+            merge_common_lists([[1, 2], [3, 4], [5], [2, 3], [6, 7], []]),
+            [{1, 2, 3, 4}, {5}, {6, 7}],
+        )
+        self.assertCountEqual(
+            group_similar_values(['odoo sa', 'odoo s.a.', 'microsoft', 'open erp', 'openerp'], 0.5),
+            [[0, 1], [3, 4]],
+        )
+        self.assertCountEqual(
+            group_similar_values(['odoo sa', 'odoo s.a.', 'microsoft', 'open erp', 'openerp'], 0.5, changed_indexes=[4]),
+            [[3, 4]],
+            'Only the values similar to the changed ones should be grouped',
+        )
+
     def test_deduplication_multiple(self):
         self._create_rule('x_name', 'exact')
         self._create_rule('x_email', 'exact')
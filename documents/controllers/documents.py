@@ -4,6 +4,7 @@ import base64
 import io
 import json
 import logging
+import time
 import zipfile
 from contextlib import ExitStack
 
@@ -18,6 +19,36 @@ from odoo.tools.translate import _
 
 logger = logging.getLogger(__name__)
 
+# Size of the blocks in which the files are read when zipping them
+ZIP_BLOCK_SIZE = 64 * 1024
+# Files already compressed, deflating them again takes time for nothing
+COMPRESSED_MIMETYPE_PREFIXES = (
+    'image/jpeg', 'image/png', 'image/gif', 'image/webp', 'video/', 'audio/',
+    'application/zip', 'application/gzip', 'application/x-7z-compressed', 'application/x-rar',
+    'application/vnd.openxmlformats-officedocument', 'application/vnd.oasis.opendocument',
+)
+
+
+class _ZipOutput(io.RawIOBase):
+    """Write-only, non-seekable file in which the zip is written, keeping the
+    written data until it is popped to be sent."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def pop(self):
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
 
 class ShareRoute(http.Controller):
 
@@ -65,35 +96,62 @@ class ShareRoute(http.Controller):
     def _generate_zip(cls, name, file_streams):
         """returns zip files for the Document Inspector and the portal.
 
+        The zip is built on-the-fly while it is sent, reading the files by
+        blocks, so that neither the files nor the archive are loaded entirely
+        in memory.
+
         :param name: the name to give to the zip file.
         :param file_streams: binary file streams to be zipped.
         :return: a http response to download a zip file.
         """
-        # TODO: zip on-the-fly while streaming instead of loading the
-        #       entire zip in memory and sending it all at once.
+        # The streams must be prepared while the request's cursor is still
+        # open, the response is only generated once it is returned.
+        file_streams = [binary_stream for binary_stream in file_streams if binary_stream]
+        headers = [
+            ('Content-Type', 'zip'),
+            ('X-Content-Type-Options', 'nosniff'),
+            ('Content-Disposition', content_disposition(name))
+        ]
+        chunks = (chunk for chunk in cls._generate_zip_chunks(file_streams) if chunk)
+        return request.make_response(chunks, headers)
+
+    @classmethod
+    def _generate_zip_chunks(cls, file_streams):
+        """Generate the content of a zip of the given streams, by chunks.
 
-        stream = io.BytesIO()
+        :param file_streams: binary file streams to be zipped.
+        """
+        output = _ZipOutput()
         try:
-            with zipfile.ZipFile(stream, 'w') as doc_zip:
+            with zipfile.ZipFile(output, 'w') as doc_zip:
                 for binary_stream in file_streams:
-                    if not binary_stream:
-                        continue
-                    doc_zip.writestr(
-                        binary_stream.download_name,
-                        binary_stream.read(),  # Cf Todo: this is bad
-                        compress_type=zipfile.ZIP_DEFLATED
+                    zip_info = zipfile.ZipInfo(binary_stream.download_name, date_time=time.localtime()[:6])
+                    zip_info.file_size = binary_stream.size or 0
+                    zip_info.compress_type = (
+                        zipfile.ZIP_STORED
+                        if (binary_stream.mimetype or '').startswith(COMPRESSED_MIMETYPE_PREFIXES)
+                        else zipfile.ZIP_DEFLATED
                     )
+                    with doc_zip.open(zip_info, 'w') as zip_file:
+                        for block in cls._read_stream_blocks(binary_stream):
+                            zip_file.write(block)
+                            yield output.pop()
+                    yield output.pop()
         except zipfile.BadZipfile:
             logger.exception("BadZipfile exception")
+        yield output.pop()
 
-        content = stream.getvalue()  # Cf Todo: this is bad
-        headers = [
-            ('Content-Type', 'zip'),
-            ('X-Content-Type-Options', 'nosniff'),
-            ('Content-Length', len(content)),
-            ('Content-Disposition', content_disposition(name))
-        ]
-        return request.make_response(content, headers)
+    @classmethod
+    def _read_stream_blocks(cls, binary_stream):
+        """Read the content of a binary stream by blocks of ZIP_BLOCK_SIZE."""
+        if binary_stream.type == 'path':
+            with open(binary_stream.path, 'rb') as file:
+                while block := file.read(ZIP_BLOCK_SIZE):
+                    yield block
+        else:
+            data = binary_stream.read()
+            for offset in range(0, len(data), ZIP_BLOCK_SIZE):
+                yield data[offset:offset + ZIP_BLOCK_SIZE]
 
     # Download & upload routes #####################################################################
 
@@ -11,7 +11,7 @@ import requests
 from dateutil.relativedelta import relativedelta
 
 from odoo import _, api, fields, models
-from odoo.exceptions import AccessError, UserError, ValidationError
+from odoo.exceptions import AccessError, ValidationError
 from odoo.osv import expression
 from odoo.tools import image_process, create_index
 from odoo.tools.mimetypes import get_extension
@@ -23,6 +23,8 @@ from .documents_facet import N_FACET_COLORS
 
 _logger = logging.getLogger(__name__)
 
+THUMBNAIL_BATCH_SIZE = 100
+
 
 def _sanitize_file_extension(extension):
     """ Remove leading and trailing spacing + Remove leading "." """
@@ -65,6 +67,7 @@ class Document(models.Model):
     thumbnail_status = fields.Selection([
             ('present', 'Present'), # Document has a thumbnail
             ('error', 'Error'), # Error when generating the thumbnail
+            ('to_generate', 'To Generate'), # Thumbnail queued for the generation cron
         ], compute="_compute_thumbnail_status", store=True, readonly=False,
     )
     url = fields.Char('URL', index=True, size=1024, tracking=True)
@@ -177,30 +180,24 @@ class Document(models.Model):
 
     @api.depends('checksum')
     def _compute_thumbnail(self):
+        # Thumbnails of pdfs are generated by the client and the ones of images by the
+        # `_cron_generate_thumbnails` cron. To force the generation, we invalidate the thumbnail.
         for record in self:
-            if record.mimetype == 'application/pdf':
-                # Thumbnails of pdfs are generated by the client. To force the generation, we invalidate the thumbnail.
-                record.thumbnail = False
-            else:
-                try:
-                    record.thumbnail = base64.b64encode(image_process(record.raw, size=(200, 140), crop='center'))
-                except (UserError, TypeError):
-                    record.thumbnail = False
+            record.thumbnail = False
 
     @api.depends("thumbnail")
     def _compute_thumbnail_status(self):
-        domain = [
-            ('res_model', '=', self._name),
-            ('res_field', '=', 'thumbnail'),
-            ('res_id', 'in', self.ids),
-        ]
-        documents_with_thumbnail = set(res['res_id'] for res in self.env['ir.attachment'].sudo().search_read(domain, ['res_id']))
         for document in self:
             if document.mimetype == 'application/pdf':
                 # As the thumbnail invalidation is not propagated to the status, we invalid it as well.
                 document.thumbnail_status = False
+            elif document.thumbnail:
+                # The thumbnail value is used rather than its attachment, which only follows at flush.
+                document.thumbnail_status = 'present'
+            elif document.mimetype and document.mimetype.startswith('image/'):
+                document.thumbnail_status = 'to_generate'
             else:
-                document.thumbnail_status = document.id in documents_with_thumbnail and 'present'
+                document.thumbnail_status = False
 
     @api.depends('attachment_type', 'url')
     def _compute_type(self):
@@ -222,9 +219,13 @@ class Document(models.Model):
         """
         if self.mimetype not in ('application/pdf', 'application/pdf;base64'):
             return None
-        stream = io.BytesIO(base64.b64decode(self.datas))
+        # Read the file from the filestore rather than loading (and decoding) it in memory.
+        attachment = self.attachment_id.sudo()
         try:
-            return PdfFileReader(stream, strict=False).numPages > 1
+            if attachment.store_fname:
+                with open(attachment._full_path(attachment.store_fname), 'rb') as stream:
+                    return PdfFileReader(stream, strict=False).numPages > 1
+            return PdfFileReader(io.BytesIO(self.raw or b''), strict=False).numPages > 1
         except AttributeError:
             raise  # If PyPDF's API changes and the `numPages` property isn't there anymore, not if its computation fails.
         except Exception:  # noqa: BLE001
@@ -537,6 +538,7 @@ class Document(models.Model):
                 attachment.with_context(no_document=True).write({
                     'res_model': 'documents.document',
                     'res_id': document.id})
+        documents._trigger_thumbnail_generation()
         return documents
 
     def write(self, vals):
@@ -617,8 +619,18 @@ class Document(models.Model):
         if 'attachment_id' in vals:
             self.attachment_id.check('read')
 
+        if attachment_dict or 'attachment_id' in vals:
+            self._trigger_thumbnail_generation()
+
         return write_result
 
+    def _trigger_thumbnail_generation(self):
+        """ Wakes up the thumbnail cron if some of the documents are images waiting for a thumbnail. """
+        if any(document.mimetype and document.mimetype.startswith('image/') for document in self):
+            thumbnail_cron = self.env.ref('documents.ir_cron_generate_thumbnails', raise_if_not_found=False)
+            if thumbnail_cron:
+                thumbnail_cron._trigger()
+
     def _process_activities(self, attachment_id):
         self.ensure_one()
         if attachment_id and self.request_activity_id:
@@ -754,6 +766,34 @@ class Document(models.Model):
             removable_folders.unlink()
         return res
 
+    @api.model
+    def _cron_generate_thumbnails(self, batch_size=False):
+        """ Generates the thumbnails of the documents waiting for one, by batch.
+
+        :return: `True` if the cron has been retriggered to process the remaining documents.
+        """
+        batch_size = batch_size or THUMBNAIL_BATCH_SIZE
+        documents = self.with_context(active_test=False).search(
+            [('thumbnail_status', '=', 'to_generate')], order='id', limit=batch_size + 1)
+        for document in documents[:batch_size]:
+            # Only load the file being processed, not the whole batch.
+            raw = document.attachment_id.with_prefetch().raw
+            try:
+                with self.env.cr.savepoint():
+                    document.write({
+                        'thumbnail': base64.b64encode(image_process(raw, size=(200, 140), crop='center')),
+                        'thumbnail_status': 'present',
+                    })
+            except Exception:  # noqa: BLE001
+                # A file that can't be processed must not block the documents following it.
+                _logger.warning('Impossible to generate the thumbnail of %r.', document.name, exc_info=True)
+                document.thumbnail_status = 'error'
+            document.attachment_id.invalidate_recordset(['raw', 'datas'])
+        if len(documents) > batch_size:
+            self.env.ref('documents.ir_cron_generate_thumbnails')._trigger()
+            return True
+        return False
+
     @api.autovacuum
     def _gc_clear_bin(self):
         """Files are deleted automatically from the trash bin after the configured remaining days."""
@@ -47,6 +47,28 @@ class TestDocumentsRoutes(HttpCaseWithUserDemo):
         with io.BytesIO(response.content) as buffer, zipfile.ZipFile(buffer) as zipfile_obj:
             self.assertEqual(zipfile_obj.read(self.document_txt.name), b'TEST')
 
+    def test_documents_zip_compression(self):
+        self.authenticate('admin', 'admin')
+        raw_gif = base64.b64decode(b"R0lGODdhAQABAIAAAP///////ywAAAAAAQABAAACAkQBADs=")
+        document_gif = self.env['documents.document'].create({
+            'raw': raw_gif,
+            'name': 'file.gif',
+            'mimetype': 'image/gif',
+            'folder_id': self.folder_a.id,
+        })
+        response = self.url_open('/document/zip', data={
+            'file_ids': f'{self.document_txt.id},{document_gif.id}',
+            'zip_name': 'testZip.zip',
+            'csrf_token': http.Request.csrf_token(self),
+        })
+        self.assertEqual(response.status_code, 200)
+        with io.BytesIO(response.content) as buffer, zipfile.ZipFile(buffer) as zipfile_obj:
+            self.assertEqual(zipfile_obj.read('file.txt'), b'TEST')
+            self.assertEqual(zipfile_obj.read('file.gif'), raw_gif)
+            self.assertEqual(zipfile_obj.getinfo('file.txt').compress_type, zipfile.ZIP_DEFLATED)
+            self.assertEqual(zipfile_obj.getinfo('file.gif').compress_type, zipfile.ZIP_STORED,
+                             "Already compressed files should only be stored")
+
     def test_documents_zip_authentification(self):
 
         self.authenticate('admin', 'admin')
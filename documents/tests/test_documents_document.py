@@ -4,8 +4,11 @@
 from odoo import Command
 from odoo.tests.common import TransactionCase, new_test_user
 from odoo.exceptions import AccessError
+from odoo.addons.documents.models import documents_document
+from odoo.tools import mute_logger
 from odoo.tests import users
 import base64
+from unittest.mock import patch
 
 GIF = b"R0lGODdhAQABAIAAAP///////ywAAAAAAQABAAACAkQBADs="
 TEXT = base64.b64encode(bytes("TEST", 'utf-8'))
@@ -449,6 +452,53 @@ class TestCaseDocuments(TransactionCase):
         document.with_user(self.doc_user.id).write({'datas': TEXT, 'mimetype': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'})
         self.assertEqual(document.mimetype, 'application/vnd.openxmlformats-officedocument.wordprocessingml.document', "should preserve office mime type")
 
+    def test_generate_thumbnails(self):
+        """
+        Tests that the thumbnails of images are generated by the cron, by batch
+        """
+        documents = self.env['documents.document'].create([
+            {'datas': GIF, 'name': f'file{i}.gif', 'mimetype': 'image/gif', 'folder_id': self.folder_b.id}
+            for i in range(3)
+        ])
+        text_document = self.env['documents.document'].create({'datas': TEXT, 'folder_id': self.folder_b.id})
+        self.assertEqual(documents.mapped('thumbnail_status'), ['to_generate'] * 3)
+        self.assertFalse(documents.thumbnail)
+        self.assertFalse(text_document.thumbnail_status)
+
+        self.assertTrue(self.env['documents.document']._cron_generate_thumbnails(batch_size=2))
+        self.assertEqual(documents.mapped('thumbnail_status'), ['present', 'present', 'to_generate'])
+        self.assertFalse(self.env['documents.document']._cron_generate_thumbnails(batch_size=2))
+        self.assertEqual(documents.mapped('thumbnail_status'), ['present'] * 3)
+        self.assertTrue(all(documents.mapped('thumbnail')))
+
+        documents[0].write({'datas': TEXT, 'mimetype': 'image/png'})
+        self.assertEqual(documents[0].thumbnail_status, 'to_generate', "a new version should be queued again")
+        self.env['documents.document']._cron_generate_thumbnails()
+        self.assertEqual(documents[0].thumbnail_status, 'error', "an invalid image should not be retried")
+
+    def test_generate_thumbnails_failure(self):
+        """
+        Tests that a document whose thumbnail can't be generated doesn't block the other ones
+        """
+        self.env['documents.document'].search([('thumbnail_status', '=', 'to_generate')]).thumbnail_status = 'error'
+        documents = self.env['documents.document'].create([
+            {'datas': GIF, 'name': f'file{i}.gif', 'mimetype': 'image/gif', 'folder_id': self.folder_b.id}
+            for i in range(2)
+        ])
+        image_process = documents_document.image_process
+
+        def _image_process(source, *args, **kwargs):
+            if not image_process_calls:
+                image_process_calls.append(source)
+                raise RuntimeError("Unexpected failure")
+            return image_process(source, *args, **kwargs)
+
+        image_process_calls = []
+        with patch.object(documents_document, 'image_process', _image_process), \
+             mute_logger('odoo.addons.documents.models.documents_document'):
+            self.env['documents.document']._cron_generate_thumbnails()
+        self.assertEqual(documents.mapped('thumbnail_status'), ['error', 'present'])
+
     def test_cascade_delete(self):
         """
         Makes sure that documents are unlinked when their attachment is unlinked.
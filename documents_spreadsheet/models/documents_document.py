@@ -64,10 +64,10 @@ class Document(models.Model):
             vals = self._resize_thumbnail_value(vals)
         return super().write(vals)
 
-    def join_spreadsheet_session(self, share_id=None, access_token=None):
+    def join_spreadsheet_session(self, share_id=None, access_token=None, revision_id=None):
         if self.sudo().handler != "spreadsheet":
             raise ValidationError(_("The spreadsheet you are trying to access does not exist."))
-        data = super().join_spreadsheet_session(share_id, access_token)
+        data = super().join_spreadsheet_session(share_id, access_token, revision_id)
         self._update_spreadsheet_contributors()
         return dict(data, is_favorited=self.sudo().is_favorited, folder_id=self.sudo().folder_id.id)
 
@@ -86,6 +86,35 @@ QUnit.module(
             assert.verifySteps(["spreadsheet-loaded"]);
         });
 
+        QUnit.test("join a spreadsheet again since its last revision", async function (assert) {
+            const serverData = getBasicServerData();
+            serverData.models["documents.document"].records.push({
+                id: 4000,
+                spreadsheet_data: JSON.stringify({
+                    sheets: [{ id: "sheet1", cells: { A1: { content: "hello" } } }],
+                    revisionId: "snapshot-revision-id",
+                }),
+                name: "Spreadsheet",
+                handler: "spreadsheet",
+            });
+            const mockRPC = async function (route, args) {
+                if (args.method === "join_spreadsheet_session") {
+                    assert.step(`join since ${args.args[3]}`);
+                    if (args.args[3]) {
+                        return { name: "Spreadsheet", revisions: [], isReadonly: false };
+                    }
+                }
+            };
+            const { webClient } = await createSpreadsheet({
+                serverData,
+                spreadsheetId: 4000,
+                mockRPC,
+            });
+            const { model } = await createSpreadsheet({ webClient, spreadsheetId: 4000 });
+            assert.strictEqual(getCellContent(model, "A1"), "hello");
+            assert.verifySteps(["join since undefined", "join since snapshot-revision-id"]);
+        });
+
         QUnit.test("breadcrumb is rendered in control panel", async function (assert) {
             assert.expect(3);
 
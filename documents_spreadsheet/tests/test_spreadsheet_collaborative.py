@@ -4,6 +4,7 @@ import json
 import base64
 
 from freezegun import freeze_time
+from unittest.mock import patch
 from uuid import uuid4
 
 from .common import SpreadsheetTestCommon
@@ -87,6 +88,57 @@ class SpreadsheetCollaborative(SpreadsheetTestCommon):
         self.assertEqual(spreadsheet["data"], {})
         self.assertEqual(spreadsheet["revisions"], [commands], "It should have past revisions")
 
+    def test_join_spreadsheet_session_since_revision(self):
+        spreadsheet = self.create_spreadsheet()
+        revision1 = self.new_revision_data(spreadsheet)
+        spreadsheet.dispatch_spreadsheet_message(revision1)
+        revision2 = self.new_revision_data(spreadsheet)
+        spreadsheet.dispatch_spreadsheet_message(revision2)
+        revision3 = self.new_revision_data(spreadsheet)
+        spreadsheet.dispatch_spreadsheet_message(revision3)
+        del revision1["clientId"]
+        del revision2["clientId"]
+        del revision3["clientId"]
+
+        data = spreadsheet.join_spreadsheet_session(revision_id=revision1["nextRevisionId"])
+        self.assertNotIn("data", data, "It should not send the snapshot again")
+        self.assertEqual(data["revisions"], [revision2, revision3])
+        data = spreadsheet.join_spreadsheet_session(revision_id=revision2["nextRevisionId"])
+        self.assertNotIn("data", data)
+        self.assertEqual(data["revisions"], [revision3], "It should only send the missing revisions")
+        data = spreadsheet.join_spreadsheet_session(revision_id=revision3["nextRevisionId"])
+        self.assertEqual(data["revisions"], [])
+        data = spreadsheet.join_spreadsheet_session(revision_id="START_REVISION")
+        self.assertEqual(data["data"], {}, "It should send the initial data, which may have been replaced")
+        self.assertEqual(data["revisions"], [revision1, revision2, revision3])
+        data = spreadsheet.join_spreadsheet_session(revision_id="unknown-revision-id")
+        self.assertEqual(data["data"], {}, "It should send the snapshot for an unknown revision")
+        self.assertEqual(data["revisions"], [revision1, revision2, revision3])
+
+        self.snapshot(spreadsheet, revision3["nextRevisionId"], "snapshot-revision-id", {"revisionId": "snapshot-revision-id"})
+        data = spreadsheet.join_spreadsheet_session(revision_id="snapshot-revision-id")
+        self.assertNotIn("data", data)
+        self.assertEqual(data["revisions"], [])
+        data = spreadsheet.join_spreadsheet_session(revision_id=revision3["nextRevisionId"])
+        self.assertEqual(data["data"], {"revisionId": "snapshot-revision-id"}, "It should send the snapshot for an archived revision")
+        self.assertEqual(data["revisions"], [])
+
+    def test_join_snapshot_request_many_revisions(self):
+        spreadsheet = self.create_spreadsheet()
+        spreadsheet.dispatch_spreadsheet_message(self.new_revision_data(spreadsheet))
+        spreadsheet.dispatch_spreadsheet_message(self.new_revision_data(spreadsheet))
+        self.assertFalse(spreadsheet.join_spreadsheet_session()["snapshot_requested"])
+        with patch("odoo.addons.spreadsheet_edition.models.spreadsheet_mixin.SNAPSHOT_REVISIONS_THRESHOLD", 1):
+            self.assertTrue(
+                spreadsheet.join_spreadsheet_session()["snapshot_requested"],
+                "It should request a snapshot of a spreadsheet with too many revisions",
+            )
+
+    def test_read_uncompressed_snapshot(self):
+        spreadsheet = self.create_spreadsheet()
+        spreadsheet.spreadsheet_snapshot = base64.b64encode(b'{"sheets": [], "revisionId": "snapshot-revision-id"}')
+        self.assertEqual(spreadsheet._get_spreadsheet_snapshot(), {"sheets": [], "revisionId": "snapshot-revision-id"})
+
     def test_snapshot_spreadsheet_save_data(self):
         spreadsheet = self.create_spreadsheet()
         spreadsheet.dispatch_spreadsheet_message(self.new_revision_data(spreadsheet))
@@ -109,7 +161,8 @@ class SpreadsheetCollaborative(SpreadsheetTestCommon):
             {"type": "SNAPSHOT_CREATED", "version": 1},
             "It should have saved a snapshot revision"
         )
-        self.assertEqual(base64.decodebytes(spreadsheet.spreadsheet_snapshot), b'{"sheets": [], "revisionId": "snapshot-revision-id"}', "It should have saved the data")
+        self.assertEqual(spreadsheet._get_spreadsheet_snapshot(), {"sheets": [], "revisionId": "snapshot-revision-id"}, "It should have saved the data")
+        self.assertEqual(base64.decodebytes(spreadsheet.spreadsheet_snapshot)[:2], b"\x1f\x8b", "It should have compressed the data")
         self.assertEqual(
             spreadsheet.server_revision_id,
             "snapshot-revision-id",
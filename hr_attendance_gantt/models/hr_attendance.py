@@ -64,7 +64,7 @@ class HrAttendance(models.Model):
         return values
 
     @api.model
-    def get_gantt_data(self, domain, groupby, read_specification, limit=None, offset=0):
+    def get_gantt_data(self, domain, groupby, read_specification, limit=None, offset=0, records_limit=None, records_offset=0):
         """
         We override get_gantt_data to allow the display of open-ended records,
         We also want to add in the gantt rows, the active emloyees that have a check in in the previous 7 days
@@ -72,7 +72,7 @@ class HrAttendance(models.Model):
         user_domain = self.env.context.get('user_domain')
         start_date = self.env.context.get('gantt_start_date')
 
-        open_ended_gantt_data = super().get_gantt_data(domain, groupby, read_specification, limit=limit, offset=offset)
+        open_ended_gantt_data = super().get_gantt_data(domain, groupby, read_specification, limit=limit, offset=offset, records_limit=records_limit, records_offset=records_offset)
 
         if start_date and groupby and groupby[0] == 'employee_id':
             active_employees_domain = expression.AND([
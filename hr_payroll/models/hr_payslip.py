@@ -590,7 +590,10 @@ class HrPayslip(models.Model):
                 'state': 'verify',
                 'compute_date': today
             })
-        self.env['hr.payslip.line'].create(payslips._get_payslip_lines())
+        # The totals of the previous payslips asked by the rules are read once for the whole batch.
+        batch_sums = {'employee_ids': set(payslips.employee_id.ids), 'totals': {}}
+        self.env['hr.payslip.line'].create(
+            payslips.with_context(payslip_batch_sums=batch_sums)._get_payslip_lines())
         return True
 
     def action_refresh_from_work_entries(self):
@@ -723,63 +726,92 @@ class HrPayslip(models.Model):
     def _sum(self, code, from_date, to_date=None):
         if to_date is None:
             to_date = fields.Date.today()
-        self.env.cr.execute("""
-            SELECT sum(pl.total)
-            FROM hr_payslip as hp, hr_payslip_line as pl
-            WHERE hp.employee_id = %s
-            AND hp.state in ('done', 'paid')
-            AND hp.date_from >= %s
-            AND hp.date_to <= %s
-            AND hp.id = pl.slip_id
-            AND pl.code = %s""", (self.employee_id.id, from_date, to_date, code))
-        res = self.env.cr.fetchone()
-        return res and res[0] or 0.0
+        totals = self._get_payslip_sums('line', from_date, to_date, code)
+        return totals.get((self.employee_id.id, code)) or 0.0
 
     def _sum_category(self, code, from_date, to_date=None):
         self.ensure_one()
         if to_date is None:
             to_date = fields.Date.today()
-
-        self.env['hr.payslip'].flush_model(['employee_id', 'state', 'date_from', 'date_to'])
-        self.env['hr.payslip.line'].flush_model(['total', 'slip_id', 'category_id'])
-        self.env['hr.salary.rule.category'].flush_model(['code'])
-
-        self.env.cr.execute("""
-            SELECT sum(pl.total)
-            FROM hr_payslip as hp, hr_payslip_line as pl, hr_salary_rule_category as rc
-            WHERE hp.employee_id = %s
-            AND hp.state in ('done', 'paid')
-            AND hp.date_from >= %s
-            AND hp.date_to <= %s
-            AND hp.id = pl.slip_id
-            AND rc.id = pl.category_id
-            AND rc.code = %s""", (self.employee_id.id, from_date, to_date, code))
-        res = self.env.cr.fetchone()
-        return res and res[0] or 0.0
+        totals = self._get_payslip_sums('category', from_date, to_date, code)
+        return totals.get((self.employee_id.id, code)) or 0.0
 
     def _sum_worked_days(self, code, from_date, to_date=None):
         self.ensure_one()
         if to_date is None:
             to_date = fields.Date.today()
+        totals = self._get_payslip_sums('worked_days', from_date, to_date, code)
+        return totals.get((self.employee_id.id, code))
+
+    def _get_payslip_sums(self, sum_type, from_date, to_date, code):
+        """ Returns the totals of the done payslips of the employee between the given dates, by
+        (employee id, code).
 
-        query = """
-            SELECT sum(hwd.amount)
-            FROM hr_payslip hp, hr_payslip_worked_days hwd, hr_work_entry_type hwet
-            WHERE hp.state in ('done', 'paid')
-            AND hp.id = hwd.payslip_id
-            AND hwet.id = hwd.work_entry_type_id
-            AND hp.employee_id = %(employee)s
-            AND hp.date_to <= %(stop)s
-            AND hwet.code = %(code)s
-            AND hp.date_from >= %(start)s"""
+        During `compute_sheet`, the totals of all the codes and of all the employees of the computed
+        batch are read at once and kept for the whole computation, as the rules of every payslip ask
+        for the same periods. Otherwise, only the total of the employee for the given code is read.
+
+        :param str sum_type: 'line' for the payslip lines by rule code, 'category' for the payslip
+            lines by salary rule category code, 'worked_days' for the worked days amounts by work
+            entry type code
+        """
+        batch_sums = self.env.context.get('payslip_batch_sums')
+        if batch_sums is None or self.employee_id.id not in batch_sums['employee_ids']:
+            return self._read_payslip_sums(sum_type, self.employee_id.ids, from_date, to_date, code=code)
+        key = (sum_type, from_date, to_date)
+        if key not in batch_sums['totals']:
+            batch_sums['totals'][key] = self._read_payslip_sums(
+                sum_type, batch_sums['employee_ids'], from_date, to_date)
+        return batch_sums['totals'][key]
+
+    @api.model
+    def _read_payslip_sums(self, sum_type, employee_ids, from_date, to_date, code=None):
+        """ See `_get_payslip_sums`, for the given employees and for all the codes if `code` is not given. """
+        if sum_type == 'worked_days':
+            self.env['hr.payslip.worked_days'].flush_model(['amount', 'payslip_id', 'work_entry_type_id'])
+            self.env['hr.work.entry.type'].flush_model(['code'])
+            code_column = 'hwet.code'
+            query = """
+                SELECT hp.employee_id, hwet.code, sum(hwd.amount)
+                FROM hr_payslip hp, hr_payslip_worked_days hwd, hr_work_entry_type hwet
+                WHERE hp.id = hwd.payslip_id
+                AND hwet.id = hwd.work_entry_type_id"""
+        elif sum_type == 'category':
+            self.env['hr.payslip.line'].flush_model(['total', 'slip_id', 'category_id'])
+            self.env['hr.salary.rule.category'].flush_model(['code'])
+            code_column = 'rc.code'
+            query = """
+                SELECT hp.employee_id, rc.code, sum(pl.total)
+                FROM hr_payslip as hp, hr_payslip_line as pl, hr_salary_rule_category as rc
+                WHERE hp.id = pl.slip_id
+                AND rc.id = pl.category_id"""
+        else:
+            self.env['hr.payslip.line'].flush_model(['total', 'slip_id', 'code'])
+            code_column = 'pl.code'
+            query = """
+                SELECT hp.employee_id, pl.code, sum(pl.total)
+                FROM hr_payslip as hp, hr_payslip_line as pl
+                WHERE hp.id = pl.slip_id"""
+        self.env['hr.payslip'].flush_model(['employee_id', 'state', 'date_from', 'date_to'])
+
+        query += """
+                AND hp.employee_id IN %(employee_ids)s
+                AND hp.state in ('done', 'paid')
+                AND hp.date_from >= %(start)s
+                AND hp.date_to <= %(stop)s"""
+        if code is not None:
+            query += f"""
+                AND {code_column} = %(code)s"""
+        query += f"""
+                GROUP BY hp.employee_id, {code_column}"""
 
         self.env.cr.execute(query, {
-            'employee': self.employee_id.id,
-            'code': code,
+            'employee_ids': tuple(employee_ids) or (None,),
             'start': from_date,
-            'stop': to_date})
-        res = self.env.cr.fetchone()
-        return res[0] if res else 0.0
+            'stop': to_date,
+            'code': code,
+        })
+        return {(employee_id, row_code): total for employee_id, row_code, total in self.env.cr.fetchall()}
 
     def _get_base_local_dict(self):
         return {
@@ -854,6 +886,7 @@ class HrPayslip(models.Model):
 
     def _get_payslip_lines(self):
         line_vals = []
+        sorted_rules_by_struct = {}
         for payslip in self:
             if not payslip.contract_id:
                 raise UserError(_("There's no contract set on payslip %s for %s. Check that there is at least a contract set on the employee form.", payslip.name, payslip.employee_id.name))
@@ -868,7 +901,9 @@ class HrPayslip(models.Model):
             blacklisted_rule_ids = self.env.context.get('prevent_payslip_computation_line_ids', [])
 
             result = {}
-            for rule in sorted(payslip.struct_id.rule_ids, key=lambda x: x.sequence):
+            if payslip.struct_id not in sorted_rules_by_struct:
+                sorted_rules_by_struct[payslip.struct_id] = sorted(payslip.struct_id.rule_ids, key=lambda x: x.sequence)
+            for rule in sorted_rules_by_struct[payslip.struct_id]:
                 if rule.id in blacklisted_rule_ids:
                     continue
                 localdict.update({
@@ -216,6 +216,37 @@ class TestPayslipComputation(TestPayslipContractBase):
         self.richard_payslip2.compute_sheet()
         self.assertEqual(3010.13, self.richard_payslip2.line_ids.filtered(lambda x: x.code == 'SUMALW').total)
 
+    def test_sum_batch(self):
+        self.richard_payslip.compute_sheet()
+        self.richard_payslip.action_payslip_done()
+
+        payslip = self.env['hr.payslip'].create({
+            'name': 'Payslip of Richard',
+            'employee_id': self.richard_emp.id,
+            'contract_id': self.contract_cdi.id,
+            'struct_id': self.developer_pay_structure.id,
+            'date_from': date(2016, 1, 1),
+            'date_to': date(2016, 1, 31)
+        })
+        date_from, date_to = date(2016, 1, 1), date(2016, 1, 31)
+        expected_sums = (
+            payslip._sum('SUMALW', date_from, date_to),
+            payslip._sum_category('ALW', date_from, date_to),
+            payslip._sum_worked_days('WORK100', date_from, date_to),
+            payslip._sum_category('DED', date_from, date_to),
+        )
+        self.assertEqual(expected_sums[0], self.richard_payslip.line_ids.filtered(lambda x: x.code == 'SUMALW').total)
+
+        # Within a batch, each kind of total is read once for all the codes and employees
+        batch_payslip = payslip.with_context(payslip_batch_sums={'employee_ids': {self.richard_emp.id}, 'totals': {}})
+        self.env.flush_all()
+        with self.assertQueryCount(3):
+            self.assertEqual(batch_payslip._sum('SUMALW', date_from, date_to), expected_sums[0])
+            self.assertEqual(batch_payslip._sum_category('ALW', date_from, date_to), expected_sums[1])
+            self.assertEqual(batch_payslip._sum_worked_days('WORK100', date_from, date_to), expected_sums[2])
+            self.assertEqual(batch_payslip._sum('CA', date_from, date_to), 800)
+            self.assertEqual(batch_payslip._sum_category('DED', date_from, date_to), expected_sums[3])
+
     def test_payslip_generation_with_extra_work(self):
         # /!\ this is in the weekend (Sunday) => no calendar attendance at this time
         start = datetime(2015, 11, 1, 10, 0, 0)
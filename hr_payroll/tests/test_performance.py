@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
+import datetime as datetime_module
 from datetime import date, datetime
 
+from odoo.addons.hr_payroll.models.hr_salary_rule import _compile_rule_code, _eval_rule_code
 from odoo.addons.hr_payroll.tests.common import TestPayslipBase
 from odoo.tests.common import users, warmup, tagged
 
@@ -85,3 +87,41 @@ class TestPayrollPerformance(TestPayslipBase):
         with self.assertQueryCount(__system__=0, admin=0):  # already cached from warmup
             self.env['hr.rule.parameter']._get_parameter_from_code('test_parameter_cache')
         parameter.unlink()
+
+    def test_performance_payslip_rules_compilation(self):
+        """ The code of the salary rules is compiled once, not for each payslip """
+        contracts = self.env['hr.contract'].search([
+            ('employee_id', 'in', self.employees.ids),
+            ('date_end', '=', date(2018, 2, 1)),
+        ])
+        payslips = self.env['hr.payslip'].create([{
+            'name': 'Payslip of %s' % contract.employee_id.name,
+            'employee_id': contract.employee_id.id,
+            'contract_id': contract.id,
+            'struct_id': self.developer_pay_structure.id,
+            'date_from': date(2018, 1, 1),
+            'date_to': date(2018, 1, 31),
+        } for contract in contracts])
+
+        _compile_rule_code.cache_clear()
+        payslips[0].compute_sheet()
+        misses = _compile_rule_code.cache_info().misses
+        self.assertTrue(misses, "The code of the rules should have been compiled")
+        payslips[1].compute_sheet()
+        self.assertEqual(_compile_rule_code.cache_info().misses, misses,
+                         "The code of the rules should not be compiled again for the next payslips")
+        self.assertEqual(
+            payslips[0].line_ids.mapped(lambda line: (line.code, line.total)),
+            payslips[1].line_ids.mapped(lambda line: (line.code, line.total)))
+
+    def test_performance_payslip_rules_evaluation(self):
+        """ The compiled code of the rules is evaluated with the checks of safe_eval """
+        localdict = {'amounts': [1, 2, 3]}
+        _eval_rule_code("result = sum(amount for amount in amounts)", localdict, mode='exec')
+        self.assertEqual(localdict['result'], 6)
+        self.assertNotIn('__builtins__', localdict, "The builtins should not stay in the localdict")
+        with self.assertRaisesRegex(ValueError, 'while evaluating'):
+            _eval_rule_code("amounts[5]", localdict)
+        localdict['date_module'] = datetime_module
+        with self.assertRaises(TypeError):
+            _eval_rule_code("1", localdict)
@@ -6,6 +6,7 @@ from . import knowledge_article_favorite
 from . import knowledge_article_member
 from . import knowledge_article_template_category
 from . import knowledge_article
+from . import knowledge_article_partner_permission
 from . import knowledge_article_stage
 from . import knowledge_cover
 from . import res_partner
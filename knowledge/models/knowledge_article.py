@@ -16,7 +16,7 @@ from odoo import api, Command, fields, models, _
 from odoo.addons.web_editor.tools import handle_history_divergence
 from odoo.exceptions import AccessError, ValidationError, UserError
 from odoo.osv import expression
-from odoo.tools import get_lang, is_html_empty
+from odoo.tools import get_lang, html2plaintext, is_html_empty
 from odoo.tools.translate import html_translate
 from odoo.tools.sql import SQL
 
@@ -37,8 +37,12 @@ class Article(models.Model):
     DEFAULT_ARTICLE_TRASH_LIMIT_DAYS = 30
 
     active = fields.Boolean(default=True)
-    name = fields.Char(string="Title", tracking=20, default_export_compatible=True)
+    name = fields.Char(string="Title", tracking=20, default_export_compatible=True, index='trigram')
     body = fields.Html(string="Body", prefetch=False)
+    body_text = fields.Text(
+        string="Body Text", compute="_compute_body_text", store=True,
+        prefetch=False, index='trigram',
+        help="Plain text of the body, indexed for the article search.")
     icon = fields.Char(string='Emoji')
     cover_image_id = fields.Many2one("knowledge.cover", string='Article cover')
     cover_image_url = fields.Char(related="cover_image_id.attachment_url", string="Cover url")
@@ -337,6 +341,11 @@ class Article(models.Model):
             for child in article.child_ids:
                 child.template_category_id = article.template_category_id
 
+    @api.depends('body')
+    def _compute_body_text(self):
+        for article in self:
+            article.body_text = False if is_html_empty(article.body) else html2plaintext(article.body)
+
     @api.depends('template_body')
     def _compute_template_preview(self):
         for template in self:
@@ -888,6 +897,7 @@ class Article(models.Model):
         if any(articles.mapped('is_template')) and not self.env.user.has_group('base.group_system'):
             raise ValidationError(_('You are not allowed to create a new template.'))
 
+        self.env['knowledge.article.partner.permission']._mark_to_refresh(articles)
         return articles
 
     def write(self, vals):
@@ -939,6 +949,9 @@ class Article(models.Model):
 
         result = super(Article, self).write(vals)
 
+        if 'parent_id' in vals or 'is_desynchronized' in vals:
+            self.env['knowledge.article.partner.permission']._mark_to_refresh(self)
+
         # resequence only if a sequence was not already computed based on current
         # parent maximum to avoid unnecessary recomputation of sequences
         if _resequence:
@@ -1521,7 +1534,12 @@ class Article(models.Model):
             - name = query & Favorite count
             - root.name = query & is_user_favorite - by Favorite sequence
             - root.name = query & Favorite count
-        and returned result mimic a search_read result structure.
+            - body = query, likewise
+        and returned result mimic a search_read result structure, with a snippet of
+        the body around the first occurrence of the search_query as 'body_snippet'.
+
+        The title and the plain text of the body are trigram indexed, so that the
+        articles containing the search_query are found without scanning the table.
 
         The parameter hidden_mode separates the search into 2 modes: visible and hidden.
         When hidden_mode is True, we search for articles that are hidden, hence that have
@@ -1539,9 +1557,10 @@ class Article(models.Model):
         ]
         if search_query:
             search_domain = expression.AND([search_domain, [
-                "|",
+                "|", "|",
                     ("name", "ilike", search_query),
                     ("root_article_id.name", "ilike", search_query),
+                    ("body_text", "ilike", search_query),
             ]])
 
         articles_query = self._search(search_domain)
@@ -1553,12 +1572,22 @@ class Article(models.Model):
               knowledge_article.root_article_id,
               root_article.icon AS root_article_icon,
               root_article.name AS root_article_name,
-              knowledge_article.icon
+              knowledge_article.icon,
+              CASE
+                  WHEN body_match.position > 0 THEN
+                      SUBSTRING(knowledge_article.body_text FROM GREATEST(body_match.position - 40, 1) FOR 160)
+                  ELSE
+                      NULL
+              END AS body_snippet
          FROM knowledge_article
     LEFT JOIN knowledge_article_favorite AS fav
            ON knowledge_article.id = fav.article_id AND fav.user_id = %s
     LEFT JOIN knowledge_article AS root_article
            ON knowledge_article.root_article_id = root_article.id
+    LEFT JOIN LATERAL (
+                  SELECT POSITION(LOWER(%s) IN LOWER(knowledge_article.body_text)) AS position
+              ) AS body_match
+           ON %s
         WHERE %s
      ORDER BY CASE
                   WHEN knowledge_article.name IS NOT NULL THEN
@@ -1566,6 +1595,12 @@ class Article(models.Model):
                   ELSE
                       FALSE
               END DESC,
+              CASE
+                  WHEN root_article.name IS NOT NULL THEN
+                      POSITION(LOWER(%s) IN LOWER(root_article.name)) > 0
+                  ELSE
+                      FALSE
+              END DESC,
               CASE
                   WHEN %s THEN
                       NOT COALESCE(CAST(knowledge_article.parent_id AS BOOLEAN), FALSE)
@@ -1580,8 +1615,11 @@ class Article(models.Model):
            %s
             ''',
             self.env.user.id,
+            search_query or '',
+            bool(search_query),
             articles_query.where_clause,
             search_query,
+            search_query,
             hidden_mode,
             SQL("LIMIT %s", limit) if limit else SQL()
         ))
@@ -1600,6 +1638,8 @@ class Article(models.Model):
             )
             del sorted_article['root_article_icon']
             del sorted_article['root_article_name']
+            if sorted_article['body_snippet']:
+                sorted_article['body_snippet'] = ' '.join(sorted_article['body_snippet'].split())
         return sorted_articles
 
     # ------------------------------------------------------------
@@ -2109,6 +2149,9 @@ class Article(models.Model):
     def _get_internal_permission(self, filter_domain=None):
         """ Compute article based permissions.
 
+        The inherited permission is stored on the article, so that no walk up the
+        article tree is needed.
+
         Note: we don't use domain because we cannot include properly the where clause
         in the custom sql query. The query's output table and fields names does not match
         the model we are working on.
@@ -2129,24 +2172,12 @@ class Article(models.Model):
             args += where_params
 
         sql = f'''
-    WITH RECURSIVE article_perms as (
-        SELECT id, id as article_id, parent_id, internal_permission, is_desynchronized
-          FROM knowledge_article
-          {base_where_domain}
-         UNION
-        SELECT parents.id, perms.article_id, parents.parent_id,
-               COALESCE(perms.internal_permission, parents.internal_permission),
-               perms.is_desynchronized
-          FROM knowledge_article parents
-    INNER JOIN article_perms perms
-            ON perms.parent_id=parents.id
-               AND perms.is_desynchronized IS NOT TRUE
-               AND perms.internal_permission IS NULL
-    )
-    SELECT article_id, max(internal_permission)
-      FROM article_perms
-           {where_clause}
-  GROUP BY article_id'''
+    SELECT article_id, internal_permission
+      FROM (SELECT id as article_id, inherited_permission as internal_permission
+              FROM knowledge_article
+              {base_where_domain}
+           ) article_perms
+           {where_clause}'''
         self._cr.execute(sql, args)
         return dict(self._cr.fetchall())
 
@@ -2155,41 +2186,21 @@ class Article(models.Model):
         """ Retrieve the permission for the given partner for all articles.
         The articles can be filtered using the article_ids param.
 
-        The member model is fully flushed before running the request. """
-        self.env['knowledge.article'].flush_model()
-        self.env['knowledge.article.member'].flush_model()
+        The permissions are read from knowledge.article.partner.permission, which
+        is refreshed first. """
+        self.env['knowledge.article.partner.permission']._refresh_pending_permissions()
 
         args = [partner.id]
         base_where_domain = ''
         if self.ids:
-            base_where_domain = "WHERE perms1.id in %s"
+            base_where_domain = "AND article_id in %s"
             args.append(tuple(self.ids))
 
         sql = f'''
-    WITH RECURSIVE article_perms as (
-        SELECT a.id, a.parent_id, m.permission, a.is_desynchronized
-          FROM knowledge_article a
-     LEFT JOIN knowledge_article_member m
-            ON a.id=m.article_id and partner_id = %s
-    ), article_rec as (
-        SELECT perms1.id, perms1.id as article_id, perms1.parent_id,
-               perms1.permission, perms1.is_desynchronized
-          FROM article_perms as perms1
-          {base_where_domain}
-         UNION
-        SELECT perms2.id, perms_rec.article_id, perms2.parent_id,
-               COALESCE(perms_rec.permission, perms2.permission),
-               perms2.is_desynchronized
-          FROM article_perms as perms2
-    INNER JOIN article_rec perms_rec
-            ON perms_rec.parent_id=perms2.id
-               AND perms_rec.is_desynchronized IS NOT TRUE
-               AND perms_rec.permission IS NULL
-    )
-    SELECT article_id, max(permission)
-      FROM article_rec
-     WHERE permission IS NOT NULL
-  GROUP BY article_id'''
+    SELECT article_id, permission
+      FROM knowledge_article_partner_permission
+     WHERE partner_id = %s
+           {base_where_domain}'''
         self._cr.execute(sql, args)
         return dict(self._cr.fetchall())
 
@@ -76,11 +76,21 @@ class ArticleMember(models.Model):
                       article.display_name)
                 )
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        members = super().create(vals_list)
+        self.env['knowledge.article.partner.permission']._mark_to_refresh(members.article_id)
+        return members
+
     def write(self, vals):
         """ Whatever rights, avoid any attempt at privilege escalation. """
         if ('article_id' in vals or 'partner_id' in vals) and not self.env.is_admin():
             raise AccessError(_("Can not update the article or partner of a member."))
-        return super().write(vals)
+        articles = self.article_id
+        result = super().write(vals)
+        if vals.keys() & {'article_id', 'partner_id', 'permission'}:
+            self.env['knowledge.article.partner.permission']._mark_to_refresh(articles | self.article_id)
+        return result
 
     @api.ondelete(at_uninstall=False)
     def _unlink_except_no_writer(self):
@@ -88,6 +98,10 @@ class ArticleMember(models.Model):
         We need to check manually on article with no write permission that we do not remove the last write member """
         self._check_is_writable(on_unlink=True)
 
+    def unlink(self):
+        self.env['knowledge.article.partner.permission']._mark_to_refresh(self.article_id)
+        return super().unlink()
+
     def _get_invitation_hash(self):
         """ We use a method instead of a field in order to reduce DB space."""
         self.ensure_one()
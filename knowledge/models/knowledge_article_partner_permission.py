@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+from odoo import api, fields, models
+from odoo.tools import create_index
+
+
+class ArticlePartnerPermission(models.Model):
+    """ The member permission of a partner on an article, resolved through the article's ancestors.
+
+    A partner's permission on an article comes from their membership on the closest ancestor-or-self of that
+    article, without going above the first desynchronized one. Resolving it for every access check needs a
+    recursive walk up the article tree, so the result is kept here instead, with one row per (article, partner)
+    having such a membership (see _get_partner_member_permissions on knowledge.article).
+
+    The ancestors of the articles are read from their parent_path. The rows of the articles whose members,
+    parent or synchronization have changed are refreshed, with the ones of their children, before being read
+    and at the end of the transaction at the latest.
+    """
+    _name = 'knowledge.article.partner.permission'
+    _description = 'Article Partner Permission'
+    _log_access = False
+
+    article_id = fields.Many2one('knowledge.article', 'Article', ondelete='cascade', required=True, readonly=True)
+    partner_id = fields.Many2one('res.partner', 'Partner', ondelete='cascade', required=True, readonly=True)
+    permission = fields.Selection(
+        [('write', 'Can edit'),
+         ('read', 'Can read'),
+         ('none', 'No access')],
+        required=True, readonly=True)
+
+    _sql_constraints = [
+        ('unique_article_partner',
+         'unique(article_id, partner_id)',
+         'An article has only one permission per partner.')
+    ]
+
+    def init(self):
+        super().init()
+        create_index(self.env.cr,
+                     indexname='knowledge_article_partner_permission_partner_article_idx',
+                     tablename=self._table,
+                     expressions=['partner_id', 'article_id'])
+        self.env.cr.execute("SELECT 1 FROM knowledge_article_partner_permission LIMIT 1")
+        if not self.env.cr.fetchone():
+            self._refresh_permissions()
+
+    @api.model
+    def _mark_to_refresh(self, articles):
+        """ Schedules the refresh of the permissions of articles and their descendants, at the end of the
+        transaction at the latest. """
+        if not articles:
+            return
+        pending_ids = self.env.cr.precommit.data.setdefault('knowledge.partner_permission_article_ids', set())
+        if not pending_ids:
+            self.env.cr.precommit.add(self._refresh_pending_permissions)
+        pending_ids.update(articles.ids)
+
+    @api.model
+    def _refresh_pending_permissions(self):
+        """ Refreshes the permissions scheduled by _mark_to_refresh. To be called before reading them. """
+        pending_ids = self.env.cr.precommit.data.pop('knowledge.partner_permission_article_ids', None)
+        if pending_ids:
+            self._refresh_permissions(pending_ids)
+
+    @api.model
+    def _refresh_permissions(self, article_ids=None):
+        """ Recomputes the permissions of the given articles and of all their descendants, or of all the
+        articles if article_ids is None. """
+        self.env['knowledge.article'].flush_model(['parent_id', 'parent_path', 'is_desynchronized'])
+        self.env['knowledge.article.member'].flush_model(['article_id', 'partner_id', 'permission'])
+
+        if article_ids is None:
+            self.env.cr.execute("DELETE FROM knowledge_article_partner_permission")
+            article_condition = ''
+            params = []
+        else:
+            self.env.cr.execute(
+                "SELECT parent_path FROM knowledge_article WHERE id IN %s AND parent_path IS NOT NULL",
+                [tuple(article_ids)])
+            parent_paths = [f'{parent_path}%' for parent_path, in self.env.cr.fetchall()]
+            if not parent_paths:
+                return
+            self.env.cr.execute(
+                "SELECT id FROM knowledge_article WHERE parent_path LIKE ANY(%s)",
+                [parent_paths])
+            subtree_ids = tuple(article_id for article_id, in self.env.cr.fetchall())
+            self.env.cr.execute(
+                "DELETE FROM knowledge_article_partner_permission WHERE article_id IN %s",
+                [subtree_ids])
+            article_condition = 'WHERE article.id IN %s'
+            params = [subtree_ids]
+
+        # The members apply from the closest ancestor-or-self having one for the partner, down to the
+        # closest desynchronized ancestor-or-self (the depth of an ancestor is its position in parent_path).
+        self.env.cr.execute(f'''
+    WITH article_ancestor AS (
+        SELECT article.id AS article_id, ancestor.id AS ancestor_id, ancestor.depth
+          FROM knowledge_article article,
+               UNNEST(string_to_array(rtrim(article.parent_path, '/'), '/')::integer[])
+                   WITH ORDINALITY AS ancestor(id, depth)
+          {article_condition}
+    ), boundary AS (
+        SELECT article_ancestor.article_id, MAX(article_ancestor.depth) AS depth
+          FROM article_ancestor
+          JOIN knowledge_article ancestor
+            ON ancestor.id = article_ancestor.ancestor_id
+         WHERE ancestor.is_desynchronized
+      GROUP BY article_ancestor.article_id
+    )
+    INSERT INTO knowledge_article_partner_permission (article_id, partner_id, permission)
+    SELECT DISTINCT ON (article_ancestor.article_id, member.partner_id)
+           article_ancestor.article_id, member.partner_id, member.permission
+      FROM article_ancestor
+      JOIN knowledge_article_member member
+        ON member.article_id = article_ancestor.ancestor_id
+ LEFT JOIN boundary
+        ON boundary.article_id = article_ancestor.article_id
+     WHERE article_ancestor.depth >= COALESCE(boundary.depth, 1)
+  ORDER BY article_ancestor.article_id, member.partner_id, article_ancestor.depth DESC''', params)
+        self.invalidate_model()
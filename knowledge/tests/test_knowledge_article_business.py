@@ -923,6 +923,31 @@ class TestKnowledgeArticleBusiness(KnowledgeCommonBusinessCase):
                    self.wkspace_grandgrandchildren[0] + self.wkspace_grandchildren[1]
         self.assertEqual([a['id'] for a in result], expected.ids)
 
+    @users('employee')
+    def test_article_sort_for_user_body(self):
+        """ Testing get_user_sorted_articles also finds articles by their body,
+        after the ones matching by name, and returns a snippet of the body. """
+        articles = self.env['knowledge.article'].create([{
+            'body': '<h1>Meeting notes</h1><p>We agreed on the new <b>Zeppelin</b> launch date.</p>',
+            'internal_permission': 'write',
+            'name': 'Weekly Meeting',
+        }, {
+            'body': '<p>Nothing to see here</p>',
+            'internal_permission': 'write',
+            'name': 'Zeppelin Roadmap',
+        }])
+        self.assertIn('We agreed on the new *Zeppelin* launch date.', articles[0].body_text)
+        self.assertNotIn('<p>', articles[0].body_text)
+
+        result = self.env['knowledge.article'].get_user_sorted_articles('zeppelin')
+        self.assertEqual([a['id'] for a in result], articles[::-1].ids)
+        self.assertFalse(result[0]['body_snippet'])
+        self.assertIn('We agreed on the new *Zeppelin* launch date.', result[1]['body_snippet'])
+
+        articles[0].body = '<p>Postponed</p>'
+        result = self.env['knowledge.article'].get_user_sorted_articles('zeppelin')
+        self.assertEqual([a['id'] for a in result], articles[1].ids)
+
 @tagged('knowledge_internals', 'knowledge_management')
 class TestKnowledgeArticleCopy(KnowledgeCommonBusinessCase):
     """ Test copy and duplication of articles """
@@ -71,6 +71,50 @@ class TestKnowledgeArticlePermissions(KnowledgeArticlePermissionsCase):
         self.assertFalse(article_desync.user_has_write_access)
         self.assertFalse(article_desync.user_has_access, 'Permissions: member rights should not be fetch on parents')
 
+    def test_article_partner_permissions_maintenance(self):
+        """ Test the member permissions resolved through the ancestors are kept up to
+        date when the members, the parent or the synchronization of articles change. """
+        root, other_root = self.env['knowledge.article'].create([
+            {'article_member_ids': [(0, 0, {'partner_id': self.partner_employee2.id, 'permission': 'read'})],
+             'internal_permission': 'write',
+             'name': 'Root',
+            },
+            {'internal_permission': 'write',
+             'name': 'Other Root',
+            },
+        ])
+        child = self.env['knowledge.article'].create({'name': 'Child', 'parent_id': root.id})
+        grand_child = self.env['knowledge.article'].create({'name': 'Grand Child', 'parent_id': child.id})
+        articles = root + other_root + child + grand_child
+        self.assertEqual(
+            articles._get_partner_member_permissions(self.partner_employee2),
+            {root.id: 'read', child.id: 'read', grand_child.id: 'read'})
+
+        # closest member wins
+        child.write({'article_member_ids': [(0, 0, {'partner_id': self.partner_employee2.id, 'permission': 'write'})]})
+        self.assertEqual(
+            articles._get_partner_member_permissions(self.partner_employee2),
+            {root.id: 'read', child.id: 'write', grand_child.id: 'write'})
+
+        # members are not fetched above desynchronized articles
+        grand_child.write({'internal_permission': 'write', 'is_desynchronized': True})
+        self.assertEqual(
+            articles._get_partner_member_permissions(self.partner_employee2),
+            {root.id: 'read', child.id: 'write'})
+
+        # moving an article moves its members along, not the ones of its former parents
+        child.write({'parent_id': other_root.id})
+        child.article_member_ids.write({'permission': 'read'})
+        self.assertEqual(
+            articles._get_partner_member_permissions(self.partner_employee2),
+            {root.id: 'read', child.id: 'read'})
+
+        child.article_member_ids.unlink()
+        grand_child.write({'is_desynchronized': False})
+        self.assertEqual(
+            articles._get_partner_member_permissions(self.partner_employee2),
+            {root.id: 'read'})
+
     @mute_logger('odoo.addons.base.models.ir_rule')
     @users('employee')
     def test_article_permissions_inheritance_employee(self):
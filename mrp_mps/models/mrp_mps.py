@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 
+from bisect import bisect_left, bisect_right
 from collections import defaultdict, namedtuple
 from dateutil.relativedelta import relativedelta
 from math import log10
@@ -387,6 +388,9 @@ class MrpProductionSchedule(models.Model):
             read_fields.append('product_uom_id')
         production_schedule_states = schedules_to_compute.read(read_fields)
         production_schedule_states_by_id = {mps['id']: mps for mps in production_schedule_states}
+        qty_available = schedules_to_compute._get_qty_available()
+        forecasts_by_period = schedules_to_compute._get_forecasts_by_period(date_range)
+        date_stops = [date_stop for dummy, date_stop in date_range]
         for production_schedule in indirect_demand_order:
             # Bypass if the schedule is only used in order to compute indirect
             # demand.
@@ -402,7 +406,7 @@ class MrpProductionSchedule(models.Model):
                 production_schedule_state['precision_digits'] = precision_digits
                 production_schedule_state['forecast_ids'] = []
 
-            starting_inventory_qty = production_schedule.product_id.with_context(warehouse=production_schedule.warehouse_id.id).qty_available
+            starting_inventory_qty = qty_available[production_schedule.product_id, production_schedule.warehouse_id]
             if len(date_range):
                 starting_inventory_qty -= incoming_qty_done.get((date_range[0], production_schedule.product_id, production_schedule.warehouse_id), 0.0)
                 starting_inventory_qty += outgoing_qty_done.get((date_range[0], production_schedule.product_id, production_schedule.warehouse_id), 0.0)
@@ -412,7 +416,7 @@ class MrpProductionSchedule(models.Model):
                 key = ((date_start, date_stop), production_schedule.product_id, production_schedule.warehouse_id)
                 key_y_1 = (date_range_year_minus_1[index], *key[1:])
                 key_y_2 = (date_range_year_minus_2[index], *key[1:])
-                existing_forecasts = production_schedule.forecast_ids.filtered(lambda p: p.date >= date_start and p.date <= date_stop)
+                existing_forecasts = forecasts_by_period[production_schedule.id][index]
                 if production_schedule in self:
                     forecast_values['date_start'] = date_start
                     forecast_values['date_stop'] = date_stop
@@ -447,17 +451,18 @@ class MrpProductionSchedule(models.Model):
                 starting_inventory_qty = forecast_values['safety_stock_qty']
                 if not forecast_values['replenish_qty']:
                     continue
-                # Set the indirect demand qty for children schedules.
+                # Set the indirect demand qty for children schedules, in the
+                # period containing the related date or the next one.
+                related_date = max(subtract(date_start, days=lead_time_ignore_components), fields.Date.today())
+                related_period = date_range[bisect_left(date_stops, related_date)]
                 for (product, ratio) in indirect_ratio_mps[(production_schedule.warehouse_id, production_schedule.product_id)].items():
-                    related_date = max(subtract(date_start, days=lead_time_ignore_components), fields.Date.today())
-                    index = next(i for i, (dstart, dstop) in enumerate(date_range) if related_date <= dstart or (related_date >= dstart and related_date <= dstop))
-                    related_key = (date_range[index], product, production_schedule.warehouse_id)
+                    related_key = (related_period, product, production_schedule.warehouse_id)
                     indirect_demand_qty[related_key] += ratio * forecast_values['replenish_qty']
 
             if production_schedule in self:
                 # The state is computed after all because it needs the final
                 # quantity to replenish.
-                forecasts_state = production_schedule._get_forecasts_state(production_schedule_states_by_id, date_range, procurement_date)
+                forecasts_state = production_schedule._get_forecasts_state(production_schedule_states_by_id, date_range, procurement_date, forecasts_by_period)
                 forecasts_state = forecasts_state[production_schedule.id]
                 for index, forecast_state in enumerate(forecasts_state):
                     production_schedule_state['forecast_ids'][index].update(forecast_state)
@@ -607,7 +612,7 @@ class MrpProductionSchedule(models.Model):
             'warehouse_id': self.warehouse_id,
         }
 
-    def _get_forecasts_state(self, production_schedule_states, date_range, procurement_date):
+    def _get_forecasts_state(self, production_schedule_states, date_range, procurement_date, forecasts_by_period=None):
         """ Return the state for each forecast cells.
         - to_relaunch: A procurement has been launched for the same date range
         but a replenish modification require a new procurement.
@@ -627,10 +632,14 @@ class MrpProductionSchedule(models.Model):
         param production_schedule_states: schedules with a state to compute
         param date_range: list of period where a state should be computed
         param procurement_date: today + lead times for products in self
+        param forecasts_by_period: the forecasts of the schedules in self by
+        period, as returned by _get_forecasts_by_period
         return: the state for each time slot in date_range for each schedule in
         production_schedule_states
         rtype: dict
         """
+        if forecasts_by_period is None:
+            forecasts_by_period = self._get_forecasts_by_period(date_range)
         forecasts_state = defaultdict(list)
         for production_schedule in self:
             forecast_values = production_schedule_states[production_schedule.id]['forecast_ids']
@@ -638,7 +647,7 @@ class MrpProductionSchedule(models.Model):
             for index, (date_start, date_stop) in enumerate(date_range):
                 forecast_state = {}
                 forecast_value = forecast_values[index]
-                existing_forecasts = production_schedule.forecast_ids.filtered(lambda p: p.date >= date_start and p.date <= date_stop)
+                existing_forecasts = forecasts_by_period[production_schedule.id][index]
                 procurement_launched = any(existing_forecasts.mapped('procurement_launched'))
 
                 replenish_qty = forecast_value['replenish_qty']
@@ -667,6 +676,41 @@ class MrpProductionSchedule(models.Model):
                 forecasts_state[production_schedule.id].append(forecast_state)
         return forecasts_state
 
+    def _get_forecasts_by_period(self, date_range):
+        """ Group the forecasts of each schedule in self by period.
+
+        param date_range: list of periods (date_start, date_stop), sorted and
+        contiguous
+        return: for each schedule id, the list of its forecasts in each period
+        of date_range
+        rtype: dict
+        """
+        forecasts = self.forecast_ids
+        date_starts = [date_start for date_start, dummy in date_range]
+        forecast_ids_by_period = {production_schedule.id: [[] for dummy in date_range] for production_schedule in self}
+        for forecast in forecasts:
+            index = bisect_right(date_starts, forecast.date) - 1
+            if index >= 0 and forecast.date <= date_range[index][1]:
+                forecast_ids_by_period[forecast.production_schedule_id.id][index].append(forecast.id)
+        return {
+            production_schedule_id: [forecasts.browse(forecast_ids).with_prefetch(forecasts._prefetch_ids) for forecast_ids in forecast_ids_list]
+            for production_schedule_id, forecast_ids_list in forecast_ids_by_period.items()
+        }
+
+    def _get_qty_available(self):
+        """ Get the quantity on hand of the product of each schedule in self,
+        in the schedule's warehouse. The quantities are computed in a single
+        batch per warehouse.
+
+        return: the quantity on hand by (product, warehouse)
+        rtype: dict
+        """
+        qty_available = {}
+        for warehouse, production_schedules in self.grouped('warehouse_id').items():
+            for product in production_schedules.product_id.with_context(warehouse=warehouse.id):
+                qty_available[product, warehouse] = product.qty_available
+        return qty_available
+
     def _get_lead_times(self):
         """ Get the lead time for each product in self. The lead times are
         based on rules lead times + produce delay or supplier info delay.
@@ -219,6 +219,21 @@ class TestMpsMps(common.TransactionCase):
         self.assertEqual(forecast_at_third_period['replenish_qty'], 10)
         self.assertEqual(forecast_at_third_period['safety_stock_qty'], 0)
 
+    def test_forecast_period_boundaries(self):
+        """ Forecasts on the first and last day of a period are counted in
+        that period only. """
+        date_range = self.env.company._get_date_range()
+        for date_forecast, qty in [(date_range[0][1], 10), (date_range[1][0], 20), (date_range[1][1], 30), (date_range[-1][1] + timedelta(days=1), 40)]:
+            self.env['mrp.product.forecast'].create({
+                'production_schedule_id': self.mps_screw.id,
+                'date': date_forecast,
+                'forecast_qty': qty,
+            })
+        screw_mps_state = self.mps_screw.get_production_schedule_view_state()[0]
+        forecast_qties = [forecast['forecast_qty'] for forecast in screw_mps_state['forecast_ids']]
+        self.assertEqual(forecast_qties[:3], [10, 50, 0])
+        self.assertEqual(sum(forecast_qties), 60)
+
     def test_replenish(self):
         """ Test to run procurement for forecasts. Check that replenish for
         different periods will not merger purchase order line and create
@@ -45,8 +45,8 @@ class PosPreparationDisplay(models.Model):
             f"pos_tracking_display-{self.access_token}", f"{self.access_token}-NEW_ORDERS", orders
         )
 
-    def _send_load_orders_message(self, sound=False):
-        super()._send_load_orders_message(sound)
+    def _send_load_orders_message(self, sound=False, orders=None):
+        super()._send_load_orders_message(sound, orders=orders)
         self._send_orders_to_customer_display()
 
     def open_customer_display(self):
@@ -1,6 +1,7 @@
 import secrets
 from odoo import api, fields, models, _
 from odoo.exceptions import ValidationError
+from odoo.tools import SQL
 
 from odoo.addons.pos_preparation_display.models.preparation_display_orderline import PosPreparationDisplayOrderline
 
@@ -30,12 +31,51 @@ class PosPreparationDisplay(models.Model):
     def _get_access_token():
         return secrets.token_hex(16)
 
+    def init(self):
+        super().init()
+        self.search([])._create_notification_sequence()
+
     @api.model_create_multi
     def create(self, vals_list):
         displays = super().create(vals_list)
+        displays._create_notification_sequence()
         displays.reset()
         return displays
 
+    def unlink(self):
+        sequence_names = [display._get_notification_sequence_name() for display in self]
+        res = super().unlink()
+        for sequence_name in sequence_names:
+            self.env.cr.execute(SQL("DROP SEQUENCE IF EXISTS %s", SQL.identifier(sequence_name)))
+        return res
+
+    # The messages sent to a display are numbered, so that it can detect the ones it missed and reload its orders.
+    # A PostgreSQL sequence is used rather than a field so that concurrent orders do not lock the display.
+    def _get_notification_sequence_name(self):
+        self.ensure_one()
+        return f'pos_preparation_display_notification_{self.id}_seq'
+
+    def _create_notification_sequence(self):
+        for display in self:
+            self.env.cr.execute(SQL(
+                "CREATE SEQUENCE IF NOT EXISTS %s",
+                SQL.identifier(display._get_notification_sequence_name()),
+            ))
+
+    def _get_next_notification_sequence(self):
+        self.ensure_one()
+        self.env.cr.execute(SQL("SELECT nextval(%s)", self._get_notification_sequence_name()))
+        return self.env.cr.fetchone()[0]
+
+    def _get_notification_sequence(self):
+        """ Returns the number of the last message sent to the display. """
+        self.ensure_one()
+        self.env.cr.execute(SQL(
+            "SELECT CASE WHEN is_called THEN last_value ELSE 0 END FROM %s",
+            SQL.identifier(self._get_notification_sequence_name()),
+        ))
+        return self.env.cr.fetchone()[0]
+
     # getter for pos_category_ids and pos_config_ids, in case of no one selected, return all of each.
     def _get_pos_category_ids(self):
         self.ensure_one()
@@ -99,11 +139,19 @@ class PosPreparationDisplay(models.Model):
         return {
             'categories': self._get_pos_category_ids().read(['id', 'display_name', 'sequence']),
             'stages': self.stage_ids.read(),
-            'orders': self.env["pos_preparation_display.order"].get_preparation_display_order(self.id),
+            **self.get_preparation_display_orders(),
             'attributes': self.env['product.attribute'].search([]).read(['id', 'name']),
             'attribute_values': self.env['product.template.attribute.value'].search([]).read(['id', 'name', 'attribute_id']),
         }
 
+    def get_preparation_display_orders(self):
+        # The sequence is read first: the messages sent while reading the orders are applied on top of them.
+        sequence = self._get_notification_sequence()
+        return {
+            'sequence': sequence,
+            'orders': self.env["pos_preparation_display.order"].get_preparation_display_order(self.id),
+        }
+
     def open_reset_wizard(self):
         return {
             'name': _("Reset Preparation Display"),
@@ -150,12 +198,21 @@ class PosPreparationDisplay(models.Model):
 
             preparation_display._send_load_orders_message()
 
-    def _send_load_orders_message(self, sound=False):
+    def _send_load_orders_message(self, sound=False, orders=None):
+        """ Notifies the display that its orders changed.
+
+        :param orders: the `pos_preparation_display.order` that changed, sent with the message. When not
+            given, the display reloads all its orders.
+        """
         self.ensure_one()
-        self.env['bus.bus']._sendone(f'preparation_display-{self.access_token}', 'load_orders', {
+        payload = {
             'preparation_display_id': self.id,
-            'sound': sound
-        })
+            'sound': sound,
+        }
+        if orders is not None:
+            payload['orders'], payload['removed_order_ids'] = orders._export_changes_for_ui(self)
+        payload['sequence'] = self._get_next_notification_sequence()
+        self.env['bus.bus']._sendone(f'preparation_display-{self.access_token}', 'load_orders', payload)
 
     @api.depends('stage_ids', 'pos_config_ids', 'category_ids')
     def _compute_order_count(self):
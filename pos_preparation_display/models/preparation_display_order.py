@@ -34,8 +34,9 @@ class PosPreparationDisplayOrder(models.Model):
             ('category_ids', '=', False)])
 
         if data['change']:
+            pdis_orders = self.search([('pos_order_id', '=', order.id)])
             for p_dis in preparation_displays:
-                p_dis._send_load_orders_message(data['sound'])
+                p_dis._send_load_orders_message(data['sound'], orders=pdis_orders)
 
         return True
 
@@ -76,7 +77,8 @@ class PosPreparationDisplayOrder(models.Model):
                     'preparation_display_id': p_dis.id,
                     'order_id': self.id,
                     'last_stage_change': current_stage.write_date,
-                    'stage_id': stage_id
+                    'stage_id': stage_id,
+                    'sequence': p_dis._get_next_notification_sequence(),
                 })
 
                 return current_stage.write_date
@@ -102,7 +104,7 @@ class PosPreparationDisplayOrder(models.Model):
                     'done': True
                 })
 
-        preparation_display._send_load_orders_message()
+        preparation_display._send_load_orders_message(orders=self)
 
     def get_preparation_display_order(self, preparation_display_id):
         preparation_display = self.env['pos_preparation_display.display'].browse(preparation_display_id)
@@ -129,6 +131,38 @@ class PosPreparationDisplayOrder(models.Model):
 
         return preparation_display_orders
 
+    def _export_changes_for_ui(self, preparation_display):
+        """ Exports the orders that changed for the given preparation display, the same way
+        `get_preparation_display_order` does for all of its orders.
+
+        :return: the orders shown by the display and the ids of the ones it no longer shows
+        :rtype: tuple(list, list)
+        """
+        first_stage = preparation_display.stage_ids[0]
+        self.env['pos_preparation_display.order.stage'].create([{
+            'preparation_display_id': preparation_display.id,
+            'stage_id': first_stage.id,
+            'order_id': order.id,
+            'done': False,
+        } for order in self.exists() if not order.order_stage_ids.filtered(
+            lambda order_stage: order_stage.preparation_display_id == preparation_display
+        )])
+
+        preparation_display_orders = []
+        for order in self.exists():
+            order_stages = order.order_stage_ids.filtered(
+                lambda order_stage: order_stage.preparation_display_id == preparation_display
+            )
+            if any(order_stages.mapped('done')) or \
+               order.pos_order_id.session_id.state in ['closed', 'closing_control']:
+                continue
+            order_ui = order._export_for_ui(preparation_display)
+            if order_ui:
+                preparation_display_orders.append(order_ui)
+
+        shown_order_ids = {order_ui['id'] for order_ui in preparation_display_orders}
+        return preparation_display_orders, [order_id for order_id in self.ids if order_id not in shown_order_ids]
+
     def _export_for_ui(self, preparation_display):
         preparation_display_orderlines = []
 
@@ -33,7 +33,8 @@ class PosPreparationDisplayOrderline(models.Model):
                 'change_orderline_status',
                 {
                     'preparation_display_id': preparation_display.id,
-                    'status': orderlines_status
+                    'status': orderlines_status,
+                    'sequence': preparation_display._get_next_notification_sequence(),
                 }
             ]
             for preparation_display in preparation_displays
@@ -77,5 +78,5 @@ class PosPreparationDisplayOrderline(models.Model):
             ('category_ids', '=', False)])
 
         for p_dis in preparation_displays:
-            p_dis._send_load_orders_message()
+            p_dis._send_load_orders_message(orders=order | new_order)
         return new_order.id
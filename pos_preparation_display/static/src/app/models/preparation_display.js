@@ -17,6 +17,7 @@ export class PreparationDisplay extends Reactive {
     async setup(data, env, preparationDisplayId) {
         this.id = preparationDisplayId;
         this.env = env;
+        this.sequence = data.sequence;
         this.showCategoryFilter = false;
         this.orm = env.services.orm;
         this.orders = {};
@@ -204,16 +205,28 @@ export class PreparationDisplay extends Reactive {
     }
 
     async getOrders() {
-        this.rawData.orders = await this.orm.call(
-            "pos_preparation_display.order",
-            "get_preparation_display_order",
-            [[], this.id],
+        const { orders, sequence } = await this.orm.call(
+            "pos_preparation_display.display",
+            "get_preparation_display_orders",
+            [[this.id]],
             {}
         );
+        this.rawData.orders = orders;
+        this.sequence = Math.max(this.sequence, sequence);
 
         this.processOrders();
     }
 
+    /**
+     * Returns whether the notification numbered `sequence` directly follows the
+     * ones already received, i.e. that no notification has been missed.
+     */
+    checkSequence(sequence) {
+        const isNext = sequence === undefined || sequence <= this.sequence + 1;
+        this.sequence = Math.max(this.sequence, sequence ?? 0);
+        return isNext;
+    }
+
     processCategories() {
         this.categories = Object.fromEntries(
             this.rawData.categories
@@ -237,43 +250,89 @@ export class PreparationDisplay extends Reactive {
         }
 
         this.orders = this.rawData.orders.reduce((orders, order) => {
-            if (order.stage_id === null) {
-                order.stage_id = this.firstStage.id;
+            const orderObj = this.processOrder(order);
+
+            if (orderObj.orderlines.length > 0) {
+                orders[order.id] = orderObj;
             }
 
-            const orderObj = new Order(order);
+            return orders;
+        }, {});
+
+        this.filterOrders();
+        return this.orders;
+    }
 
-            orderObj.orderlines = order.orderlines.map((line) => {
-                let blinking = false;
+    processOrder(order) {
+        if (order.stage_id === null) {
+            order.stage_id = this.firstStage.id;
+        }
 
-                if (this.noteByLines[line.id] && line.internal_note !== this.noteByLines[line.id]) {
-                    blinking = true;
-                    this.env.services.sound.play("bell");
-                }
+        const orderObj = new Order(order);
 
-                const orderline = new Orderline(line, orderObj, blinking);
-                const product = new Product([orderline.productId, orderline.productName]);
+        orderObj.orderlines = order.orderlines.map((line) => {
+            let blinking = false;
 
-                this.noteByLines[line.id] = line.internal_note;
-                this.products[product.id] = product;
-                this.orderlines[orderline.id] = orderline;
-                orderline.productCategoryIds.forEach((categoryId) => {
-                    this.categories[categoryId]?.orderlines?.push(orderline);
-                    this.categories[categoryId]?.productIds?.add(orderline.productId);
-                });
+            if (this.noteByLines[line.id] && line.internal_note !== this.noteByLines[line.id]) {
+                blinking = true;
+                this.env.services.sound.play("bell");
+            }
+
+            const orderline = new Orderline(line, orderObj, blinking);
+            const product = new Product([orderline.productId, orderline.productName]);
 
-                return orderline;
+            this.noteByLines[line.id] = line.internal_note;
+            this.products[product.id] = product;
+            this.orderlines[orderline.id] = orderline;
+            orderline.productCategoryIds.forEach((categoryId) => {
+                this.categories[categoryId]?.orderlines?.push(orderline);
+                this.categories[categoryId]?.productIds?.add(orderline.productId);
             });
 
-            if (orderObj.orderlines.length > 0) {
-                orders[order.id] = orderObj;
+            return orderline;
+        });
+
+        return orderObj;
+    }
+
+    removeOrder(orderId) {
+        const order = this.orders[orderId];
+        if (!order) {
+            return;
+        }
+
+        order.clearChangeTimeout();
+        for (const orderline of order.orderlines) {
+            // The line may have been moved to another order in the meantime.
+            if (this.orderlines[orderline.id] === orderline) {
+                delete this.orderlines[orderline.id];
             }
+            orderline.productCategoryIds.forEach((categoryId) => {
+                const category = this.categories[categoryId];
+                if (category) {
+                    category.orderlines = category.orderlines.filter((line) => line !== orderline);
+                }
+            });
+        }
+        delete this.orders[orderId];
+    }
 
-            return orders;
-        }, {});
+    wsUpdateOrders(orders, removedOrderIds) {
+        for (const orderId of removedOrderIds) {
+            this.removeOrder(orderId);
+        }
+        for (const order of orders) {
+            this.removeOrder(order.id);
+        }
+        for (const order of orders) {
+            const orderObj = this.processOrder(order);
+
+            if (orderObj.orderlines.length > 0) {
+                this.orders[order.id] = orderObj;
+            }
+        }
 
         this.filterOrders();
-        return this.orders;
     }
 
     wsChangeLinesStatus(linesStatus) {
@@ -33,11 +33,24 @@ export const preparationDisplayService = {
                 if (datas.preparation_display_id !== odoo.preparation_display.id) {
                     return false;
                 }
+                // If a notification was missed, the orders are out of date: reload them all.
+                if (!preparationDisplayService.checkSequence(datas.sequence)) {
+                    if (detail.type === "load_orders" && datas.sound) {
+                        sound.play("notification");
+                    }
+                    return preparationDisplayService.getOrders();
+                }
                 switch (detail.type) {
                     case "load_orders":
                         if (detail.payload.sound) {
                             sound.play("notification");
                         }
+                        if (datas.orders) {
+                            return preparationDisplayService.wsUpdateOrders(
+                                datas.orders,
+                                datas.removed_order_ids
+                            );
+                        }
                         return preparationDisplayService.getOrders();
                     case "change_order_stage":
                         return preparationDisplayService.wsMoveToNextStage(
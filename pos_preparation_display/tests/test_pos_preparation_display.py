@@ -1,5 +1,7 @@
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 
+import json
+
 from odoo.addons.point_of_sale.tests.common import TestPoSCommon
 from odoo.tests import tagged
 from odoo import Command
@@ -24,6 +26,29 @@ class TestPosPreparationDisplay(TestPoSCommon):
         ])
         self.assertEqual(prep_line.product_quantity, 2)
 
+    def test_preparation_display_changed_orders_message(self):
+        self.product_a.pos_categ_ids = [Command.create({'name': 'Food'})]
+        display = self.env['pos_preparation_display.display'].create({
+            'name': 'Preparation Display',
+            'pos_config_ids': [Command.link(self.config.id)],
+        })
+        self.open_new_session()
+        sequence = display._get_notification_sequence()
+
+        order = self.create_ui_order_data([(self.product_a, 2)])
+        self.env['pos.order'].create_from_ui([order])
+
+        self.env.cr.precommit.run()  # trigger the creation of bus.bus records
+        bus = self.env['bus.bus'].search([
+            ('channel', 'like', f'preparation_display-{display.access_token}'),
+        ], order='id desc', limit=1)
+        payload = json.loads(bus.message)['payload']
+        self.assertEqual(payload['sequence'], sequence + 1, "The messages sent to the display should be numbered")
+        self.assertEqual(len(payload['orders']), 1, "The message should contain the changed order")
+        self.assertEqual(payload['orders'][0]['orderlines'][0]['product_quantity'], 2)
+        self.assertEqual(payload['removed_order_ids'], [])
+        self.assertEqual(display.get_preparation_display_orders()['sequence'], sequence + 1)
+
     def test_load_preparation_display_model(self):
         
         config1 = self.env['pos.config'].create({
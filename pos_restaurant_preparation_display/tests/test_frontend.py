@@ -129,7 +129,7 @@ class TestUi(test_frontend.TestFrontendCommon):
 
         notifications = []
 
-        def _send_load_orders_message(self, sound):
+        def _send_load_orders_message(self, sound, orders=None):
             notifications.append(self.id)
 
         # open a session, the /pos/ui controller will redirect to it
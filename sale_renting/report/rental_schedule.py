@@ -27,7 +27,7 @@ class RentalSchedule(models.Model):
         return all_rental_products
 
     @api.model
-    def get_gantt_data(self, domain, groupby, read_specification, limit=None, offset=0):
+    def get_gantt_data(self, domain, groupby, read_specification, limit=None, offset=0, records_limit=None, records_offset=0):
         if (
             limit
             and not offset
@@ -41,7 +41,7 @@ class RentalSchedule(models.Model):
             # If there are less rental products in the database than the given limit, drop the limit
             # so that the read_group is lazy and the `group_expand` is called
             limit = None
-        return super().get_gantt_data(domain, groupby, read_specification, limit=limit, offset=offset)
+        return super().get_gantt_data(domain, groupby, read_specification, limit=limit, offset=offset, records_limit=records_limit, records_offset=records_offset)
 
     name = fields.Char('Order Reference', readonly=True)
     product_name = fields.Char('Product Reference', readonly=True)
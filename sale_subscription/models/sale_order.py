@@ -2,6 +2,8 @@
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dateutil.relativedelta import relativedelta
 from psycopg2.extensions import TransactionRollbackError
 from ast import literal_eval
@@ -1230,16 +1232,56 @@ class SaleOrder(models.Model):
         }
 
     def _compute_kpi(self):
-        for subscription in self:
-            delta_1month = subscription._get_subscription_delta(fields.Date.today() - relativedelta(months=1))
-            delta_3months = subscription._get_subscription_delta(fields.Date.today() - relativedelta(months=3))
-            subscription.write({
-                'kpi_1month_mrr_delta': delta_1month['delta'],
-                'kpi_1month_mrr_percentage': delta_1month['percentage'],
-                'kpi_3months_mrr_delta': delta_3months['delta'],
-                'kpi_3months_mrr_percentage': delta_3months['percentage'],
+        """ Compute the MRR evolution of the subscriptions over the last month and the last 3 months, based on the
+        last MRR logged before those dates (see _get_subscription_delta). The logs are read in a single query per batch
+        of subscriptions, and the subscriptions ending up with the same KPIs are written together.
+        """
+        today = fields.Date.today()
+        self.flush_model(['recurring_monthly'])
+        self.env['sale.order.log'].flush_model(['order_id', 'event_type', 'event_date', 'recurring_monthly'])
+        for batch_ids in split_every(10000, self.ids):
+            self.env.cr.execute("""
+                SELECT sale_order.id,
+                       sale_order.recurring_monthly,
+                       log.mrr_1month,
+                       log.mrr_3months
+                  FROM sale_order
+             LEFT JOIN (
+                           SELECT order_id,
+                                  (ARRAY_AGG(recurring_monthly ORDER BY event_date DESC, id DESC))[1] AS mrr_1month,
+                                  (ARRAY_AGG(recurring_monthly ORDER BY event_date DESC, id DESC)
+                                       FILTER (WHERE event_date <= %(date_3months)s))[1] AS mrr_3months
+                             FROM sale_order_log
+                            WHERE order_id IN %(order_ids)s
+                              AND event_type IN ('0_creation', '1_expansion', '15_contraction', '2_transfer')
+                              AND event_date <= %(date_1month)s
+                         GROUP BY order_id
+                       ) AS log
+                    ON log.order_id = sale_order.id
+                 WHERE sale_order.id IN %(order_ids)s
+            """, {
+                'order_ids': tuple(batch_ids),
+                'date_1month': today - relativedelta(months=1),
+                'date_3months': today - relativedelta(months=3),
             })
 
+            subscription_ids_by_kpi = defaultdict(list)
+            for subscription_id, recurring_monthly, mrr_1month, mrr_3months in self.env.cr.fetchall():
+                kpi = []
+                for log_mrr in (mrr_1month, mrr_3months):
+                    if log_mrr is None:
+                        kpi += [False, False]
+                    else:
+                        delta = recurring_monthly - log_mrr
+                        kpi += [delta, delta / log_mrr if log_mrr != 0 else 100]
+                subscription_ids_by_kpi[tuple(kpi)].append(subscription_id)
+
+            for kpi, subscription_ids in subscription_ids_by_kpi.items():
+                self.browse(subscription_ids).write(dict(zip(
+                    ['kpi_1month_mrr_delta', 'kpi_1month_mrr_percentage', 'kpi_3months_mrr_delta', 'kpi_3months_mrr_percentage'],
+                    kpi,
+                )))
+
     def _get_portal_return_action(self):
         """ Return the action used to display orders when returning from customer portal. """
         if self.is_subscription:
@@ -1252,13 +1294,63 @@ class SaleOrder(models.Model):
     ####################
 
     @api.model
-    def _cron_recurring_create_invoice(self):
+    def _cron_recurring_create_invoice(self, nb_workers=1):
+        """ Create the invoices of the due subscriptions.
+
+        :param nb_workers: The number of batches of subscriptions invoiced concurrently, each by its own worker and
+                           cursor. The subscriptions are claimed with SKIP LOCKED, so that the workers never invoice the
+                           same subscription. Consolidated invoicing is always done by a single worker, as a batch has to
+                           contain all the subscriptions of a group.
+        """
         deferred_account = self.env.company.deferred_revenue_account_id
         deferred_journal = self.env.company.deferred_journal_id
         if not deferred_account or not deferred_journal:
             raise ValidationError(_("The deferred settings are not properly set. Please complete them to generate subscription deferred revenues"))
+        grouped_invoice = self.env['ir.config_parameter'].get_param('sale_subscription.invoice_consolidation', False)
+        if nb_workers > 1 and not grouped_invoice and not modules.module.current_test:
+            return self._create_recurring_invoice_parallel(nb_workers)
         return self._create_recurring_invoice()
 
+    @api.model
+    def _create_recurring_invoice_parallel(self, nb_workers, batch_size=30):
+        """ Run _create_recurring_invoice in nb_workers concurrent workers, then retrigger the cron if some due
+        subscriptions remain, or run the post invoicing actions once all of them have been processed.
+        """
+        start_time = time.time()
+        self.env.cr.commit()
+
+        def create_shard_invoices():
+            with self.env.registry.cursor() as cr:
+                shard_self = self.env(cr=cr)['sale.order'].with_context(recurring_invoice_shard=True)
+                return shard_self._create_recurring_invoice(batch_size=batch_size).ids
+
+        account_move_ids = []
+        nb_failed_workers = 0
+        with ThreadPoolExecutor(max_workers=nb_workers) as executor:
+            futures = [executor.submit(create_shard_invoices) for _i in range(nb_workers)]
+            for future in futures:
+                try:
+                    account_move_ids += future.result()
+                except Exception:
+                    # The batch of the worker is rolled back, its subscriptions are due again.
+                    nb_failed_workers += 1
+                    _logger.exception("Recurring invoicing: a worker failed.")
+
+        duration = time.time() - start_time
+        _logger.info(
+            "Recurring invoicing: %s invoice(s) created by %s worker(s) in %.2fs (%.2f invoices/s).",
+            len(account_move_ids), nb_workers, duration, len(account_move_ids) / duration if duration else 0.0,
+        )
+
+        self.env.invalidate_all()
+        if self.search_count(self._recurring_invoice_domain(), limit=1):
+            # Unless all the workers failed, which the next scheduled run retries
+            if nb_failed_workers < nb_workers:
+                self._subscription_launch_cron_parallel(batch_size)
+        elif self.search_count([('is_invoice_cron', '=', True)], limit=1):
+            self._recurring_invoice_post_process(auto_commit=True)
+        return self.env['account.move'].browse(account_move_ids)
+
     def _get_invoiceable_lines(self, final=False):
         date_from = self.env.context.get('invoiceable_date_from', fields.Date.today())
         res = super()._get_invoiceable_lines(final=final)
@@ -1511,6 +1603,17 @@ class SaleOrder(models.Model):
                 self._get_auto_invoice_grouping_keys(),
                 limit=limit, lazy=False)
             all_subscriptions = [self.browse(res['id']) for res in all_subscriptions]
+        elif batch_size:
+            # Claim the batch: the subscriptions locked by a concurrent cron worker are left to it, until they are
+            # flagged with is_invoice_cron.
+            query_str, params = self._search(domain, limit=batch_size).select('sale_order.id')
+            self.env.cr.execute(f"{query_str} FOR UPDATE OF sale_order SKIP LOCKED", params)
+            all_subscriptions = self.browse(subscription_id for subscription_id, in self.env.cr.fetchall())
+            if self.env.context.get('recurring_invoice_shard'):
+                # The parallel cron looks for the remaining subscriptions once all its workers are done
+                return all_subscriptions, False
+            need_cron_trigger = bool(self.search_count(expression.AND([domain, [('id', 'not in', all_subscriptions.ids)]]), limit=1))
+            return all_subscriptions, need_cron_trigger
         else:
             all_subscriptions = self.search(domain, limit=limit)
 
@@ -1543,6 +1646,7 @@ class SaleOrder(models.Model):
 
     def _create_recurring_invoice(self, batch_size=30):
         today = fields.Date.today()
+        start_time = time.time()
         auto_commit = not bool(config['test_enable'] or config['test_file'])
         grouped_invoice = self.env['ir.config_parameter'].get_param('sale_subscription.invoice_consolidation', False)
         all_subscriptions, need_cron_trigger = self._recurring_invoice_get_subscriptions(grouped=grouped_invoice, batch_size=batch_size)
@@ -1568,6 +1672,7 @@ class SaleOrder(models.Model):
         # It prevents the use of _compute method and compare the today date and the next_invoice_date in the compute which would be bad for perfs
         all_invoiceable_lines._reset_subscription_qty_to_invoice()
         self._subscription_commit_cursor(auto_commit)
+        invoiceable_lines_per_order = all_invoiceable_lines.grouped('order_id')
         for subscription in all_subscriptions:
             if len(subscription) == 1:
                 subscription = subscription[0]  # Trick to not prefetch other subscriptions is all_subscription is recordset, as the cache is currently invalidated at each iteration
@@ -1585,7 +1690,10 @@ class SaleOrder(models.Model):
                 elif draft_invoices:
                     # Skip subscription if no payment_token, and it has a draft invoice
                     continue
-                invoiceable_lines = all_invoiceable_lines.filtered(lambda l: l.order_id.id in subscription.ids)
+                invoiceable_lines = self.env['sale.order.line'].concat(*(
+                    invoiceable_lines_per_order.get(order, self.env['sale.order.line'])
+                    for order in subscription
+                ))
                 invoice_is_free, is_exception = subscription._invoice_is_considered_free(invoiceable_lines)
                 if not invoiceable_lines or invoice_is_free:
                     updatable_invoice_date = subscription.filtered(lambda sub: sub.next_invoice_date and sub.next_invoice_date <= today)
@@ -1647,27 +1755,42 @@ class SaleOrder(models.Model):
         self._subscription_commit_cursor(auto_commit)
         self._process_invoices_to_send(self.env['account.move'].browse(move_to_send_ids))
         self._subscription_commit_cursor(auto_commit)
+
+        duration = time.time() - start_time
+        nb_subscriptions = sum(len(subscription) for subscription in all_subscriptions)
+        _logger.info(
+            "Recurring invoicing: %s subscription(s) processed, %s invoice(s) created in %.2fs (%.2f subscriptions/s).",
+            nb_subscriptions, len(account_moves), duration, nb_subscriptions / duration if duration else 0.0,
+        )
+
+        if self.env.context.get('recurring_invoice_shard'):
+            # The parallel cron retriggers itself or post processes the invoices once all its workers are done.
+            return account_moves
         # There is still some subscriptions to process. Then, make sure the CRON will be triggered again asap.
         if need_cron_trigger:
             self._subscription_launch_cron_parallel(batch_size)
         else:
-            if self:
-                invoice_sub = self.filtered('is_subscription')
-            else:
-                invoice_sub = self.search([('is_invoice_cron', '=', True)])
+            self._recurring_invoice_post_process(auto_commit)
+        return account_moves
 
-            try:
-                invoice_sub._post_invoice_hook()
-                self._subscription_commit_cursor(auto_commit)
-            except Exception as e:
-                self._subscription_rollback_cursor(auto_commit)
-                _logger.exception("Error during post invoice action: %s", e)
-                invoice_sub._handle_post_invoice_hook_exception()
+    def _recurring_invoice_post_process(self, auto_commit):
+        """ Run the post invoice actions of the subscriptions invoiced by the cron, or of self if set, and release them. """
+        if self:
+            invoice_sub = self.filtered('is_subscription')
+        else:
+            invoice_sub = self.search([('is_invoice_cron', '=', True)])
 
-            failing_subscriptions = self.search([('is_batch', '=', True)])
-            (failing_subscriptions | invoice_sub).write({'is_batch': False, 'is_invoice_cron': False})
+        try:
+            invoice_sub._post_invoice_hook()
             self._subscription_commit_cursor(auto_commit)
-        return account_moves
+        except Exception as e:
+            self._subscription_rollback_cursor(auto_commit)
+            _logger.exception("Error during post invoice action: %s", e)
+            invoice_sub._handle_post_invoice_hook_exception()
+
+        failing_subscriptions = self.search([('is_batch', '=', True)])
+        (failing_subscriptions | invoice_sub).write({'is_batch': False, 'is_invoice_cron': False})
+        self._subscription_commit_cursor(auto_commit)
 
     def _create_invoices(self, grouped=False, final=False, date=None):
         """ Override to increment periods when needed """
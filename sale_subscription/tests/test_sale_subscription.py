@@ -295,6 +295,53 @@ class TestSubscription(TestSubscriptionCommon):
         invoice._post()  # should not throw an error
         self.assertEqual(invoice.line_ids.product_id, sub_product1 | sub_product2)
 
+    def test_recurring_invoice_shard(self):
+        """ The workers of the parallel invoicing cron claim the due subscriptions, report their throughput and leave
+        the post invoicing actions to the cron. """
+        subscriptions = self.subscription + self.subscription.copy()
+        subscriptions.action_confirm()
+        with self.assertLogs('odoo.addons.sale_subscription.models.sale_order', level='INFO') as capture:
+            invoices = self.env['sale.order'].with_context(recurring_invoice_shard=True)._create_recurring_invoice()
+        self.assertLessEqual(subscriptions, invoices.invoice_line_ids.sale_line_ids.order_id)
+        self.assertTrue(any("subscription(s) processed" in output for output in capture.output))
+        self.assertEqual(subscriptions.mapped('is_invoice_cron'), [True, True])
+
+        self.env['sale.order']._recurring_invoice_post_process(auto_commit=False)
+        self.assertEqual(subscriptions.mapped('is_invoice_cron'), [False, False])
+
+    def test_recurring_invoice_parallel(self):
+        """ The parallel invoicing cron invoices the due subscriptions with its workers, and retriggers itself for the
+        remaining ones even when one of its workers fails. """
+        subscriptions = self.subscription + self.subscription.copy()
+        subscriptions.action_confirm()
+        self.patch(self.env.cr, 'commit', lambda: None)
+        self.registry.enter_test_mode(self.cr)
+        self.addCleanup(self.registry.leave_test_mode)
+
+        create_recurring_invoice = SaleOrder._create_recurring_invoice
+        nb_calls = []
+
+        def _create_recurring_invoice(self, batch_size=30):
+            nb_calls.append(batch_size)
+            if len(nb_calls) == 1:
+                raise UserError("Worker failure")
+            return create_recurring_invoice(self, batch_size=batch_size)
+
+        with patch.object(SaleOrder, '_create_recurring_invoice', _create_recurring_invoice), \
+             patch.object(SaleOrder, '_subscription_launch_cron_parallel') as launch_cron, \
+             mute_logger('odoo.addons.sale_subscription.models.sale_order'):
+            invoices = self.env['sale.order']._create_recurring_invoice_parallel(2, batch_size=1)
+        self.assertEqual(len(nb_calls), 2)
+        self.assertEqual(len(invoices.invoice_line_ids.sale_line_ids.order_id), 1,
+                         "The worker that did not fail should have invoiced one subscription")
+        launch_cron.assert_called_once()
+
+        with patch.object(SaleOrder, '_subscription_launch_cron_parallel') as launch_cron:
+            invoices |= self.env['sale.order']._create_recurring_invoice_parallel(2)
+        self.assertLessEqual(subscriptions, invoices.invoice_line_ids.sale_line_ids.order_id)
+        launch_cron.assert_not_called()
+        self.assertEqual(subscriptions.mapped('is_invoice_cron'), [False, False], "The post invoicing actions should have run")
+
     def test_invoicing_access_rights(self):
         """Ensure a salesman can get amount invoiced for subscriptions with others' invoices."""
         self.subscription.order_line = [Command.create({
@@ -758,6 +805,35 @@ class TestSubscription(TestSubscriptionCommon):
         self.assertEqual(self.subscription.kpi_3months_mrr_percentage, 0.5)
         self.assertEqual(self.subscription.health, 'done')
 
+    def test_compute_kpi_batch(self):
+        """ The KPIs computed for all the subscriptions at once match the deltas computed one by one. """
+        subscriptions = self.subscription + self.subscription.copy() + self.subscription.copy()
+        subscriptions.action_confirm()
+        for subscription, logs in zip(subscriptions, [[(16, 80), (6, 100), (2, 120)], [(6, 0)], []]):
+            for weeks, recurring_monthly in logs:
+                self.env['sale.order.log'].sudo().create({
+                    'event_type': '1_expansion',
+                    'event_date': datetime.date.today() - relativedelta(weeks=weeks),
+                    'order_id': subscription.id,
+                    'recurring_monthly': recurring_monthly,
+                    'amount_signed': recurring_monthly,
+                    'currency_id': subscription.currency_id.id,
+                    'subscription_state': subscription.subscription_state,
+                })
+
+        self.env['sale.order']._cron_update_kpi()
+        for subscription in subscriptions:
+            delta_1month = subscription._get_subscription_delta(datetime.date.today() - relativedelta(months=1))
+            delta_3months = subscription._get_subscription_delta(datetime.date.today() - relativedelta(months=3))
+            self.assertRecordValues(subscription, [{
+                'kpi_1month_mrr_delta': delta_1month['delta'],
+                'kpi_1month_mrr_percentage': delta_1month['percentage'],
+                'kpi_3months_mrr_delta': delta_3months['delta'],
+                'kpi_3months_mrr_percentage': delta_3months['percentage'],
+            }])
+        self.assertEqual(subscriptions[1].kpi_1month_mrr_percentage, 100)
+        self.assertFalse(subscriptions[2].kpi_3months_mrr_delta)
+
     def test_onchange_date_start(self):
         recurring_bound_tmpl = self.env['sale.order.template'].create({
             'name': 'Recurring Bound Template',
@@ -9,6 +9,7 @@
     'depends': ['spreadsheet'],
     'data': [
         'security/ir.model.access.csv',
+        'data/ir_cron_data.xml',
         'views/spreadsheet_views.xml',
     ],
     'installable': True,
@@ -1,6 +1,7 @@
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 
 import json
+import gzip
 import logging
 import base64
 import psycopg2
@@ -16,6 +17,10 @@ _logger = logging.getLogger(__name__)
 
 CollaborationMessage = Dict[str, Any]
 
+# Number of revisions since the last snapshot above which the clients are asked to snapshot
+# the spreadsheet, even if it is still being edited.
+SNAPSHOT_REVISIONS_THRESHOLD = 1000
+
 
 class SpreadsheetMixin(models.AbstractModel):
     _inherit = "spreadsheet.mixin"
@@ -70,7 +75,7 @@ class SpreadsheetMixin(models.AbstractModel):
             spreadsheet._copy_spreadsheet_image_attachments()
         return spreadsheets
 
-    def join_spreadsheet_session(self, share_id=None, access_token=None):
+    def join_spreadsheet_session(self, share_id=None, access_token=None, revision_id=None):
         """Join a spreadsheet session.
         Returns the following data::
         - the last snapshot
@@ -78,6 +83,10 @@ class SpreadsheetMixin(models.AbstractModel):
         - the spreadsheet name
         - whether the user favorited the spreadsheet or not
         - whether the user can edit the content of the spreadsheet or not
+
+        If the client already has the spreadsheet at `revision_id` and that
+        revision is still known by the server, the snapshot is not returned
+        and the revisions are only the ones following `revision_id`.
         """
         self.ensure_one()
         self._check_collaborative_spreadsheet_access("read", share_id, access_token)
@@ -85,16 +94,19 @@ class SpreadsheetMixin(models.AbstractModel):
             "write", share_id, access_token, raise_exception=False
         )
         spreadsheet_sudo = self.sudo()
-        return {
+        revisions = spreadsheet_sudo._get_spreadsheet_revisions_since(revision_id) if revision_id else None
+        data = {
             "id": spreadsheet_sudo.id,
             "name": spreadsheet_sudo.display_name or "",
-            "data": spreadsheet_sudo._get_spreadsheet_snapshot(),
-            "revisions": spreadsheet_sudo._build_spreadsheet_messages(),
+            "revisions": spreadsheet_sudo._build_spreadsheet_messages(revisions),
             "snapshot_requested": can_write and spreadsheet_sudo._should_be_snapshotted(),
             "isReadonly": not can_write,
             "default_currency": self.env["res.currency"].get_company_currency_for_spreadsheet(),
             "user_locale": self.env["res.lang"]._get_user_spreadsheet_locale()
         }
+        if revisions is None:
+            data["data"] = spreadsheet_sudo._get_spreadsheet_snapshot()
+        return data
 
     def dispatch_spreadsheet_message(self, message: CollaborationMessage, share_id=None, access_token=None):
         """This is the entry point of collaborative editing.
@@ -205,9 +217,7 @@ class SpreadsheetMixin(models.AbstractModel):
             {"type": "SNAPSHOT_CREATED", "version": 1},
         )
         if is_accepted:
-            self.spreadsheet_snapshot = base64.b64encode(
-                json.dumps(spreadsheet_snapshot).encode("utf-8")
-            )
+            self.spreadsheet_snapshot = self._encode_spreadsheet_snapshot(spreadsheet_snapshot)
             self.spreadsheet_revision_ids.active = False
             self._broadcast_spreadsheet_message(
                 {
@@ -223,14 +233,52 @@ class SpreadsheetMixin(models.AbstractModel):
             return False
         elif self.spreadsheet_snapshot is False:
             return json.loads(self.spreadsheet_data)
-        return json.loads(base64.decodebytes(self.spreadsheet_snapshot))
+        snapshot = base64.decodebytes(self.spreadsheet_snapshot)
+        # snapshots saved before they were compressed are plain JSON
+        if snapshot[:2] == b"\x1f\x8b":
+            snapshot = gzip.decompress(snapshot)
+        return json.loads(snapshot)
+
+    @api.model
+    def _encode_spreadsheet_snapshot(self, spreadsheet_snapshot: dict):
+        """Encode a snapshot to be stored in `spreadsheet_snapshot`. The JSON
+        is compressed as snapshots are large and highly redundant."""
+        return base64.b64encode(gzip.compress(json.dumps(spreadsheet_snapshot).encode("utf-8")))
 
     def _should_be_snapshotted(self):
-        if not self.spreadsheet_revision_ids:
+        self.ensure_one()
+        [(revisions_count, last_activity)] = self.env["spreadsheet.revision"]._read_group(
+            [("res_model", "=", self._name), ("res_id", "=", self.id)],
+            aggregates=["__count", "create_date:max"],
+        )
+        if not revisions_count:
             return False
-        last_activity = max(self.spreadsheet_revision_ids.mapped("create_date"))
+        # The revisions would take too long to replay by each client joining
+        if revisions_count > SNAPSHOT_REVISIONS_THRESHOLD:
+            return True
         return last_activity < fields.Datetime.now() - timedelta(hours=2)
 
+    def _get_spreadsheet_revisions_since(self, revision_id):
+        """Get the revisions following `revision_id`, or None if it is not
+        the last snapshot or one of the revisions since then.
+        The revision ids of the initial data are not unique (e.g. a new file
+        uploaded over the spreadsheet), only the saved revisions are accepted."""
+        self.ensure_one()
+        is_saved_revision = self.env["spreadsheet.revision"].with_context(active_test=False).search_count([
+            ("res_model", "=", self._name),
+            ("res_id", "=", self.id),
+            ("revision_id", "=", revision_id),
+        ], limit=1)
+        if not is_saved_revision:
+            return None
+        revisions = self.spreadsheet_revision_ids
+        if revision_id == self.server_revision_id:
+            return revisions.browse()
+        parent_revision_ids = revisions.mapped("parent_revision_id")
+        if revision_id in parent_revision_ids:
+            return revisions[parent_revision_ids.index(revision_id):]
+        return None
+
     def _save_concurrent_revision(self, next_revision_id, parent_revision_id, commands):
         """Save the given revision if no concurrency issue is found.
         i.e. if no other revision was saved based on the same `parent_revision_id`
@@ -272,17 +320,19 @@ class SpreadsheetMixin(models.AbstractModel):
         message.pop("clientId", None)
         return message
 
-    def _build_spreadsheet_messages(self) -> List[CollaborationMessage]:
+    def _build_spreadsheet_messages(self, revisions=None) -> List[CollaborationMessage]:
         """Build spreadsheet collaboration messages from the saved
-        revision data"""
+        revision data, of all the revisions since the last snapshot by default"""
         self.ensure_one()
+        if revisions is None:
+            revisions = self.spreadsheet_revision_ids
         return [
             dict(
                 json.loads(rev.commands),
                 serverRevisionId=rev.parent_revision_id,
                 nextRevisionId=rev.revision_id,
             )
-            for rev in self.spreadsheet_revision_ids
+            for rev in revisions
         ]
 
     def _check_collaborative_spreadsheet_access(
@@ -380,7 +430,7 @@ class SpreadsheetMixin(models.AbstractModel):
         default['spreadsheet_data'] = self.spreadsheet_data
         new_spreadsheet = self.copy(default)
         self.with_context(active_test=False)._copy_revisions_to(new_spreadsheet, revision_id)
-        new_spreadsheet.spreadsheet_snapshot = base64.b64encode(json.dumps(spreadsheet_snapshot).encode())
+        new_spreadsheet.spreadsheet_snapshot = self._encode_spreadsheet_snapshot(spreadsheet_snapshot)
         new_spreadsheet.spreadsheet_revision_ids.active = False
         return {
             'type': 'ir.actions.client',
@@ -430,7 +480,7 @@ class SpreadsheetMixin(models.AbstractModel):
         if mapping:
             self.with_context(preserve_spreadsheet_revisions=True).spreadsheet_data = json.dumps(data)
             if self.spreadsheet_snapshot:
-                self.spreadsheet_snapshot = base64.encodebytes(json.dumps(snapshot).encode())
+                self.spreadsheet_snapshot = self._encode_spreadsheet_snapshot(snapshot)
 
     def _copy_spreadsheet_images_data(self, data, mapping):
         for sheet in data.get("sheets", []):
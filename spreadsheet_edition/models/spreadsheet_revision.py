@@ -1,11 +1,22 @@
 # -*- coding: utf-8 -*-
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 
+import base64
+import json
+import logging
+import psycopg2
+
 from dateutil.relativedelta import relativedelta
 from collections import defaultdict
 
 from odoo import api, fields, models
 
+_logger = logging.getLogger(__name__)
+
+# Number of revisions since the last snapshot above which the revisions of a
+# spreadsheet that is no longer edited are compacted.
+COMPACT_REVISIONS_THRESHOLD = 100
+
 
 class SpreadsheetRevision(models.Model):
     _name = "spreadsheet.revision"
@@ -52,9 +63,69 @@ class SpreadsheetRevision(models.Model):
             records = self.env[res_model].browse(res_ids).with_context(preserve_spreadsheet_revisions=True)
             for record in records.filtered('spreadsheet_snapshot'):
                 # reset the initial data to the current snapshot
-                record.spreadsheet_binary_data = record.spreadsheet_snapshot
+                record.spreadsheet_binary_data = base64.b64encode(
+                    json.dumps(record._get_spreadsheet_snapshot()).encode("utf-8")
+                )
             self.search([
                 ("res_model", "=", res_model),
                 ("res_id", "in", res_ids),
                 ("active", "=", False),
             ]).unlink()
+
+    def _cron_compact_revisions(self):
+        """Compact the revisions of the spreadsheets which have many revisions
+        since their last snapshot but have not been edited for two hours.
+        Those spreadsheets are only snapshotted when a client joins them again,
+        until then their revisions would be kept as they are.
+        """
+        inactive_since = fields.Datetime.now() - relativedelta(hours=2)
+        spreadsheets = self._read_group(
+            domain=[],
+            groupby=["res_model", "res_id"],
+            having=[
+                ("__count", ">", COMPACT_REVISIONS_THRESHOLD),
+                ("create_date:max", "<", inactive_since),
+            ],
+        )
+        for res_model, res_id in spreadsheets:
+            revisions = self.search([("res_model", "=", res_model), ("res_id", "=", res_id)])
+            try:
+                with self.env.cr.savepoint():
+                    revisions._compact_revisions()
+            except psycopg2.Error:
+                _logger.exception("Could not compact the revisions of %s(%s)", res_model, res_id)
+
+    def _compact_revisions(self):
+        """Fold the consecutive revisions of a spreadsheet into the last revision
+        of their run, which then carries the commands of the whole run. The state
+        of the spreadsheet at the end of each run is unchanged.
+
+        Only the revisions following the last undo or redo are compacted, as the
+        revisions before may be referenced by them. A named revision ends a run
+        so that it can still be restored from the history.
+        """
+        messages = [json.loads(revision.commands) for revision in self]
+        start = max(
+            (index + 1 for index, message in enumerate(messages) if message["type"] != "REMOTE_REVISION"),
+            default=0,
+        )
+        runs = [[]]
+        for revision, message in list(zip(self, messages))[start:]:
+            if runs[-1] and runs[-1][-1][1].get("version") != message.get("version"):
+                runs.append([])
+            runs[-1].append((revision, message))
+            if revision.name:
+                runs.append([])
+        for run in runs:
+            if len(run) < 2:
+                continue
+            first_revision = run[0][0]
+            last_revision, last_message = run[-1]
+            parent_revision_id = first_revision.parent_revision_id
+            commands = [command for _revision, message in run for command in message["commands"]]
+            # unlink first, the parent revision must stay unique
+            self.browse([revision.id for revision, _message in run[:-1]]).unlink()
+            last_revision.write({
+                "parent_revision_id": parent_revision_id,
+                "commands": json.dumps(dict(last_message, commands=commands)),
+            })
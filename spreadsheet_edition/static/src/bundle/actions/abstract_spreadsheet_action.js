@@ -19,6 +19,14 @@ import { waitForDataLoaded } from "@spreadsheet/helpers/model";
 const uuidGenerator = new spreadsheet.helpers.UuidGenerator();
 
 const { Model } = spreadsheet;
+
+/**
+ * Snapshot and revisions received when last joining each spreadsheet, as JSON.
+ * Joining the spreadsheet again only fetches the revisions made since then.
+ * @type {Map<string, string>}
+ */
+const joinedSessions = new Map();
+
 /**
  * @typedef SpreadsheetRecord
  * @property {number} id
@@ -263,11 +271,29 @@ export class AbstractSpreadsheetAction extends Component {
      * @returns {Promise<SpreadsheetRecord>}
      */
     async _fetchData() {
-        return this.orm.call(this.resModel, "join_spreadsheet_session", [
-            this.resId,
-            this.shareId,
-            this.accessToken,
-        ]);
+        const sessionKey = `${this.resModel},${this.resId}`;
+        const cachedSession = joinedSessions.has(sessionKey)
+            ? JSON.parse(joinedSessions.get(sessionKey))
+            : undefined;
+        const args = [this.resId, this.shareId, this.accessToken];
+        if (cachedSession) {
+            args.push(cachedSession.revisionId);
+        }
+        const record = await this.orm.call(this.resModel, "join_spreadsheet_session", args);
+        if (!("data" in record)) {
+            // the server only sent the revisions following the cached ones
+            record.data = cachedSession.data;
+            record.revisions = cachedSession.revisions.concat(record.revisions);
+        }
+        const lastRevision = record.revisions?.at(-1);
+        const revisionId = lastRevision ? lastRevision.nextRevisionId : record.data?.revisionId;
+        if (revisionId) {
+            joinedSessions.set(
+                sessionKey,
+                JSON.stringify({ data: record.data, revisions: record.revisions, revisionId })
+            );
+        }
+        return record;
     }
 
     /**
@@ -29,36 +29,27 @@ class StockBarcodeController(http.Controller):
                         barcode_type = result['rule'].type
                         break
 
-        if not barcode_type:
-            ret_open_picking = self._try_open_picking(barcode)
-            if ret_open_picking:
-                return ret_open_picking
+        # Looks for the scanned barcode in all the models at once.
+        records_by_model = self._search_barcode_records(
+            self._get_main_menu_domain_by_model(barcode, barcode_type), limit=1)
 
-            ret_open_picking_type = self._try_open_picking_type(barcode)
-            if ret_open_picking_type:
-                return ret_open_picking_type
+        if records_by_model.get('stock.picking'):
+            return self._try_open_picking(records_by_model['stock.picking'])
 
-        if request.env.user.has_group('stock.group_stock_multi_locations') and \
-           (not barcode_type or barcode_type in ['location', 'dest_location']):
-            ret_new_internal_picking = self._try_new_internal_picking(barcode)
-            if ret_new_internal_picking:
-                return ret_new_internal_picking
+        if records_by_model.get('stock.picking.type'):
+            return self._try_open_picking_type(records_by_model['stock.picking.type'])
 
-        if not barcode_type or barcode_type == 'product':
-            ret_open_product_location = self._try_open_product_location(barcode)
-            if ret_open_product_location:
-                return ret_open_product_location
+        if records_by_model.get('stock.location'):
+            return self._try_new_internal_picking(records_by_model['stock.location'])
 
-        if not barcode_type or barcode_type == 'lot':
-            ret_open_lot_location = self._try_open_lot_location(barcode)
-            if ret_open_lot_location:
-                return ret_open_lot_location
+        if records_by_model.get('product.product'):
+            return self._try_open_product_location(records_by_model['product.product'])
 
-        if request.env.user.has_group('stock.group_tracking_lot') and \
-           (not barcode_type or barcode_type == 'package'):
-            ret_open_package = self._try_open_package(barcode)
-            if ret_open_package:
-                return ret_open_package
+        if records_by_model.get('stock.lot'):
+            return self._try_open_lot_location(records_by_model['stock.lot'])
+
+        if records_by_model.get('stock.quant.package'):
+            return self._try_open_package(records_by_model['stock.quant.package'])
 
         if request.env.user.has_group('stock.group_stock_multi_locations'):
             return {'warning': _('No picking or location or product corresponding to barcode %(barcode)s', barcode=barcode)}
@@ -115,6 +106,7 @@ class StockBarcodeController(http.Controller):
         result = defaultdict(list)
         model_names = model_name and [model_name] or list(barcode_field_by_model.keys())
         universal_domain = domains_by_model.get('all')
+        domain_by_model = {}
         for model in model_names:
             domain = [
                 (barcode_field_by_model[model], operator, barcode),
@@ -124,8 +116,11 @@ class StockBarcodeController(http.Controller):
                 domain = expression.AND([domain, domain_for_this_model])
             if universal_domain:
                 domain = expression.AND([domain, universal_domain])
-            record = request.env[model].with_context(display_default_code=False).search(domain, limit=limit)
+            domain_by_model[model] = domain
+        records_by_model = self._search_barcode_records(domain_by_model, limit=limit)
+        for model, record in records_by_model.items():
             if record:
+                record = record.with_context(display_default_code=False)
                 result[model] += record.read(request.env[model]._get_fields_stock_barcode(), load=False)
                 if hasattr(record, '_get_stock_barcode_specific_data'):
                     additional_result = record._get_stock_barcode_specific_data()
@@ -166,13 +161,65 @@ class StockBarcodeController(http.Controller):
 
         return request.make_response(merged_pdf, headers=pdfhttpheaders)
 
-    def _try_open_lot_location(self, barcode):
+    def _get_main_menu_domain_by_model(self, barcode, barcode_type):
+        """ Returns the domains to find the records a barcode scanned from the main menu can
+        stand for, by model and in order of precedence.
+        """
+        domain_by_model = {}
+        if not barcode_type:
+            domain_by_model['stock.picking'] = [('name', '=', barcode)]
+            domain_by_model['stock.picking.type'] = [
+                ('barcode', '=', barcode),
+                ('company_id', 'in', [False, *self._get_allowed_company_ids()]),
+            ]
+        if request.env.user.has_group('stock.group_stock_multi_locations') and \
+           (not barcode_type or barcode_type in ['location', 'dest_location']):
+            domain_by_model['stock.location'] = [
+                ('barcode', '=', barcode),
+                ('usage', '=', 'internal'),
+            ]
+        if not barcode_type or barcode_type == 'product':
+            domain_by_model['product.product'] = [('barcode', '=', barcode)]
+        if not barcode_type or barcode_type == 'lot':
+            domain_by_model['stock.lot'] = [('name', '=', barcode)]
+        if request.env.user.has_group('stock.group_tracking_lot') and \
+           (not barcode_type or barcode_type == 'package'):
+            domain_by_model['stock.quant.package'] = [('name', '=', barcode)]
+        return domain_by_model
+
+    def _search_barcode_records(self, domain_by_model, limit=None):
+        """ Searches the records of several models in a single query, instead of one search by model.
+
+        :param dict domain_by_model: the domain of the records to find, by model
+        :param int limit: the maximum number of records to find for each model
+        :return: the records found for each model of `domain_by_model`
+        :rtype: dict
+        """
+        subqueries = []
+        params = []
+        for model_name, domain in domain_by_model.items():
+            model = request.env[model_name]
+            if expression.is_false(model, domain):
+                continue
+            model.flush_model()
+            query_str, query_params = model._search(domain, limit=limit).select(f'"{model._table}"."id"')
+            subqueries.append(f'SELECT %s, barcode_record.id FROM ({query_str}) AS barcode_record')
+            params += [model_name, *query_params]
+        ids_by_model = defaultdict(list)
+        if subqueries:
+            request.env.cr.execute(' UNION ALL '.join(subqueries), params)
+            for model_name, record_id in request.env.cr.fetchall():
+                ids_by_model[model_name].append(record_id)
+        return {
+            model_name: request.env[model_name].browse(ids_by_model[model_name])
+            for model_name in domain_by_model
+        }
+
+    def _try_open_lot_location(self, lot):
         """ If barcode represent a lot, open a list/kanban view to show all
         the locations of this lot.
         """
-        result = request.env['stock.lot'].search_read([
-            ('name', '=', barcode),
-        ], ['id', 'display_name'], limit=1)
+        result = lot.read(['id', 'display_name'])
         if result:
             tree_view_id = request.env.ref('stock.view_stock_quant_tree').id
             kanban_view_id = request.env.ref('stock_barcode.stock_quant_barcode_kanban_2').id
@@ -189,13 +236,11 @@ class StockBarcodeController(http.Controller):
                 },
             }
 
-    def _try_open_product_location(self, barcode):
+    def _try_open_product_location(self, product):
         """ If barcode represent a product, open a list/kanban view to show all
         the locations of this product.
         """
-        result = request.env['product.product'].search_read([
-            ('barcode', '=', barcode),
-        ], ['id', 'display_name'], limit=1)
+        result = product.read(['id', 'display_name'])
         if result:
             tree_view_id = request.env.ref('stock.view_stock_quant_tree').id
             kanban_view_id = request.env.ref('stock_barcode.stock_quant_barcode_kanban_2').id
@@ -212,34 +257,26 @@ class StockBarcodeController(http.Controller):
                 }
             }
 
-    def _try_open_picking_type(self, barcode):
+    def _try_open_picking_type(self, picking_type):
         """ If barcode represent a picking type, open a new
         picking with this type
         """
-        picking_type = request.env['stock.picking.type'].search([
-            ('barcode', '=', barcode),
-            ('company_id', 'in', [False, *self._get_allowed_company_ids()]),
-        ], limit=1)
         if picking_type:
             picking = request.env['stock.picking']._create_new_picking(picking_type)
             return picking._get_client_action()
         return False
 
-    def _try_open_picking(self, barcode):
+    def _try_open_picking(self, corresponding_picking):
         """ If barcode represents a picking, open it
         """
-        corresponding_picking = request.env['stock.picking'].search([
-            ('name', '=', barcode),
-        ], limit=1)
         if corresponding_picking:
             action = corresponding_picking.action_open_picking_client_action()
             return {'action': action}
         return False
 
-    def _try_open_package(self, barcode):
+    def _try_open_package(self, package):
         """ If barcode represents a package, open it.
         """
-        package = request.env['stock.quant.package'].search([('name', '=', barcode)], limit=1)
         if package:
             view_id = request.env.ref('stock.view_quant_package_form').id
             return {
@@ -254,13 +291,9 @@ class StockBarcodeController(http.Controller):
             }
         return False
 
-    def _try_new_internal_picking(self, barcode):
+    def _try_new_internal_picking(self, corresponding_location):
         """ If barcode represents a location, open a new picking from this location
         """
-        corresponding_location = request.env['stock.location'].search([
-            ('barcode', '=', barcode),
-            ('usage', '=', 'internal')
-        ], limit=1)
         if corresponding_location:
             internal_picking_type = request.env['stock.picking.type'].search([('code', '=', 'internal')])
             warehouse = corresponding_location.warehouse_id
@@ -68,3 +68,42 @@ class TestStockBarcodeController(HttpCase):
                     f"Expected product '{expected_display_name}' for company '{company.name}' "
                     f"(id: {company.id}), but got '{display_name}' instead."
                 )
+
+    def test_scan_from_main_menu(self):
+        product = self.env['product.product'].create({'name': 'Scanned Product', 'barcode': 'scan_product'})
+        lot = self.env['stock.lot'].create({
+            'name': 'scan_lot',
+            'product_id': product.id,
+            'company_id': self.env.company.id,
+        })
+        picking_type = self.env.ref('stock.picking_type_internal')
+        picking = self.env['stock.picking'].create({
+            'name': 'scan_picking',
+            'picking_type_id': picking_type.id,
+            'location_id': picking_type.default_location_src_id.id,
+            'location_dest_id': picking_type.default_location_dest_id.id,
+        })
+
+        self.authenticate('admin', 'admin')
+
+        def scan(barcode):
+            payload = json.dumps({
+                'jsonrpc': '2.0',
+                'method': 'call',
+                'id': 0,
+                'params': {'barcode': barcode},
+            })
+            response = self.url_open(
+                '/stock_barcode/scan_from_main_menu',
+                data=payload,
+                headers={'Content-Type': 'application/json'},
+            )
+            return response.json()['result']
+
+        action = scan('scan_picking')['action']
+        self.assertEqual(action['context']['active_id'], picking.id)
+        action = scan('scan_product')['action']
+        self.assertEqual(action['domain'], [['product_id', '=', product.id]])
+        action = scan('scan_lot')['action']
+        self.assertEqual(action['domain'], [['lot_id', '=', lot.id]])
+        self.assertIn('warning', scan('scan_nothing'))
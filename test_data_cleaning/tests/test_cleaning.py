@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 
+from unittest.mock import patch
+
 from . import test_common
 
 class TestCleaning(test_common.TestCommon):
@@ -168,6 +170,23 @@ class TestCleaning(test_common.TestCommon):
         self.assertEqual(records_found.country_id, country_be, 'It should take the country of the company')
         self.assertEqual(records_found.suggested_value, '+32 81 12 34 00', 'It should add Belgium\'s country code')
 
+    def test_cleaning_action_phone_chunks(self):
+        country_be = self.env['res.country'].search([('code', '=', 'BE')])
+        jc = self._create_record('data_cleaning.test.model', name='jc', phone='081 12 34 00', country_id=country_be.id)
+        jc2 = self._create_record('data_cleaning.test.model', name='jc2', phone='081 12 34 00', country_id=country_be.id)
+        self._create_record('data_cleaning.test.model', name='jc3', phone='+32 470 12 34 00', country_id=country_be.id)
+        self._create_rule('phone', field_name='phone')
+
+        with patch('odoo.addons.data_cleaning.models.data_cleaning_model.DR_PHONE_FORMAT_STEP', 1):
+            self.TestDCModel.action_clean_records()
+            records_found = self.Record.search([('cleaning_model_id', '=', self.TestDCModel.id)])
+            self.assertEqual(sorted(records_found.mapped('res_id')), sorted([jc.id, jc2.id]), 'Should find the records to clean in every chunk')
+            self.assertEqual(set(records_found.mapped('suggested_value')), {'+32 81 12 34 00'})
+
+            self.TestDCModel.action_clean_records()
+            records_found = self.Record.search([('cleaning_model_id', '=', self.TestDCModel.id)])
+            self.assertEqual(len(records_found), 2, 'Should not create the same cleaning record twice')
+
     def test_automatic_cleaning(self):
         self.TestDCModel.update({'cleaning_mode': 'automatic'})
 
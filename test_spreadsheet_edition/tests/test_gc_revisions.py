@@ -1,5 +1,6 @@
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 from freezegun import freeze_time
+from unittest.mock import patch
 import json
 
 from odoo.addons.spreadsheet_edition.tests.spreadsheet_test_case import (
@@ -127,3 +128,64 @@ class SpreadsheetRevisionTest(SpreadsheetTestCase):
             revisions = spreadsheet.with_context(active_test=False).spreadsheet_revision_ids
             self.assertEqual(len(revisions), 1, "the history should not be deleted")
             self.assertTrue(spreadsheet.spreadsheet_data)
+
+    def _dispatch_revisions(self, spreadsheet, count):
+        for index in range(count):
+            spreadsheet.dispatch_spreadsheet_message(
+                self.new_revision_data(spreadsheet, commands=[{"type": "A_COMMAND", "index": index}])
+            )
+
+    @patch("odoo.addons.spreadsheet_edition.models.spreadsheet_revision.COMPACT_REVISIONS_THRESHOLD", 1)
+    def test_compact_revisions_of_inactive_spreadsheet(self):
+        with freeze_time("2018-01-01 10:00:00"):
+            spreadsheet = self.env["spreadsheet.test"].create({})
+            self._dispatch_revisions(spreadsheet, 5)
+            spreadsheet.spreadsheet_revision_ids[1].name = "named"
+            messages = spreadsheet._build_spreadsheet_messages()
+
+        with freeze_time("2018-01-01 11:00:00"):
+            self.env["spreadsheet.revision"]._cron_compact_revisions()
+            self.assertEqual(len(spreadsheet.spreadsheet_revision_ids), 5, "the spreadsheet is still edited")
+
+        with freeze_time("2018-01-01 13:00:00"):
+            self.env["spreadsheet.revision"]._cron_compact_revisions()
+        revisions = spreadsheet.spreadsheet_revision_ids
+        self.assertEqual(len(revisions), 2)
+        self.assertEqual(revisions[0].name, "named")
+        self.assertEqual(spreadsheet.server_revision_id, messages[-1]["nextRevisionId"])
+        self.assertEqual(spreadsheet._build_spreadsheet_messages(), [
+            dict(
+                messages[1],
+                serverRevisionId=messages[0]["serverRevisionId"],
+                commands=messages[0]["commands"] + messages[1]["commands"],
+            ),
+            dict(
+                messages[4],
+                serverRevisionId=messages[2]["serverRevisionId"],
+                commands=messages[2]["commands"] + messages[3]["commands"] + messages[4]["commands"],
+            ),
+        ])
+
+    @patch("odoo.addons.spreadsheet_edition.models.spreadsheet_revision.COMPACT_REVISIONS_THRESHOLD", 1)
+    def test_compact_revisions_after_undo(self):
+        with freeze_time("2018-01-01 10:00:00"):
+            spreadsheet = self.env["spreadsheet.test"].create({})
+            self._dispatch_revisions(spreadsheet, 2)
+            spreadsheet.dispatch_spreadsheet_message(self.new_revision_data(
+                spreadsheet,
+                type="REVISION_UNDONE",
+                undoneRevisionId=spreadsheet.server_revision_id,
+                commands=[],
+            ))
+            self._dispatch_revisions(spreadsheet, 2)
+            messages = spreadsheet._build_spreadsheet_messages()
+
+        with freeze_time("2018-01-01 13:00:00"):
+            self.env["spreadsheet.revision"]._cron_compact_revisions()
+        self.assertEqual(spreadsheet._build_spreadsheet_messages(), messages[:3] + [
+            dict(
+                messages[4],
+                serverRevisionId=messages[3]["serverRevisionId"],
+                commands=messages[3]["commands"] + messages[4]["commands"],
+            ),
+        ], "the revisions before the undo should be kept as they are")
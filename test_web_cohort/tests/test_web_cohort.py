@@ -265,6 +265,19 @@ class TestCohortEmptyFuturBackward(TestCohortCommon):
         self.assertEqual(result[0]['columns'][0]['value'], 100)
         self.assertEqual(result[0]['columns'][-1]['value'], 0)
 
+    def test_backward_count(self):
+        """
+            Test the initial value of a row when the cells are counted
+        """
+        result = self.WebCohortSimpleModel.get_cohort_data("datetime_start", "datetime_stop",
+            '__count', 'day', [('name', 'like', 'backward')], 'retention', 'backward')['rows']
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]['value'], 5)
+        self.assertEqual(result[0]['columns'][0]['value'], 5)
+        self.assertEqual([col['value'] for col in result[0]['columns'][5:10]], [4, 3, 2, 1, 0])
+        self.assertEqual(result[0]['columns'][-1]['value'], 0)
+
 class TestCohortEmpty(TestCohortCommon):
     def test_empty_backward(self):
         """
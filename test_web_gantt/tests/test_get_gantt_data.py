@@ -151,6 +151,56 @@ class TestUnityWebReadGroupGantt(TransactionCase):
                 'length': 5,
             })
 
+    def test_get_gantt_data_with_records_limit(self):
+        result = self.env['test.web.gantt.pill'].get_gantt_data(
+            [('id', 'in', self.pills.ids)], ['parent_id'], {'display_name': {}}, records_limit=2,
+        )
+        self.assertEqual(result, {
+            'groups': [
+                {
+                    'parent_id': (self.pill_1.id, 'PillParent1'),
+                    '__record_ids': [self.pills[0].id, self.pills[5].id],
+                    '__record_count': 2,
+                },
+                {
+                    'parent_id': (self.pill_2.id, 'PillParent2'),
+                    '__record_ids': [self.pills[1].id, self.pills[2].id],
+                    '__record_count': 4,
+                },
+            ],
+            'records': [
+                {'id': self.pills[0].id, 'display_name': 'one'},
+                {'id': self.pills[1].id, 'display_name': 'two'},
+                {'id': self.pills[2].id, 'display_name': 'there'},
+                {'id': self.pills[5].id, 'display_name': 'six'},
+            ],
+            'length': 2,
+        })
+
+        # Fetch the next records of the groups
+        result = self.env['test.web.gantt.pill'].get_gantt_data(
+            [('id', 'in', self.pills.ids)], ['parent_id'], {'display_name': {}}, records_limit=2, records_offset=2,
+        )
+        self.assertEqual(result, {
+            'groups': [
+                {
+                    'parent_id': (self.pill_1.id, 'PillParent1'),
+                    '__record_ids': [],
+                    '__record_count': 2,
+                },
+                {
+                    'parent_id': (self.pill_2.id, 'PillParent2'),
+                    '__record_ids': [self.pills[3].id, self.pills[4].id],
+                    '__record_count': 4,
+                },
+            ],
+            'records': [
+                {'id': self.pills[3].id, 'display_name': 'four'},
+                {'id': self.pills[4].id, 'display_name': 'four'},
+            ],
+            'length': 2,
+        })
+
     def test_get_gantt_data_with_inactive(self):
         self.env.invalidate_all()
         self.pills[0:2].active = False
@@ -2,6 +2,7 @@
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 from odoo import Command
 from .common import TestWebGantt
@@ -418,3 +419,67 @@ class TestWebGanttReschedule(TestWebGantt):
             self.pill_4_slave_in_conflict[self.date_start_field_name], self.pill_4_slave_in_conflict_start_date,
             'Pill in conflict with Pill 4 should not have been rescheduled.'
         )
+
+    def test_reschedule_dry_run(self):
+        """ This test purpose is to ensure that a dry run gives the new dates of the rescheduled records without
+            saving them.
+        """
+        with patch.object(type(self.TestWebGanttPill), 'write', side_effect=AssertionError('A dry run should not write.')):
+            result = self.TestWebGanttPill.web_gantt_reschedule(
+                self.TestWebGanttPill._WEB_GANTT_RESCHEDULE_FORWARD,
+                self.pill_2.id, self.pill_3.id,
+                self.dependency_field_name, self.dependency_inverted_field_name,
+                self.date_start_field_name, self.date_stop_field_name,
+                dry_run=True,
+            )
+        pill_2_start_date = self.pill_3_start_date - timedelta(hours=8)
+        self.assertTrue(result['result'])
+        self.assertEqual(sorted(result['records'], key=lambda values: values['id']), [
+            {
+                'id': self.pill_1.id,
+                self.date_start_field_name: pill_2_start_date - timedelta(hours=8),
+                self.date_stop_field_name: pill_2_start_date,
+            },
+            {
+                'id': self.pill_2.id,
+                self.date_start_field_name: pill_2_start_date,
+                self.date_stop_field_name: self.pill_3_start_date,
+            },
+        ])
+        for pill, start_date, stop_date in [
+            (self.pill_1, self.pill_1_start_date, self.pill_1_stop_date),
+            (self.pill_2, self.pill_2_start_date, self.pill_2_stop_date),
+        ]:
+            self.assertEqual(
+                (pill[self.date_start_field_name], pill[self.date_stop_field_name]), (start_date, stop_date),
+                'A dry run should not save the new dates.'
+            )
+
+    def test_reschedule_save_new_dates_at_once(self):
+        """ This test purpose is to ensure that the new dates of the rescheduled records are computed first, then
+            saved with a single write per record, matching the ones given by a dry run.
+        """
+        args = (
+            self.TestWebGanttPill._WEB_GANTT_RESCHEDULE_FORWARD,
+            self.pill_2.id, self.pill_3.id,
+            self.dependency_field_name, self.dependency_inverted_field_name,
+            self.date_start_field_name, self.date_stop_field_name,
+        )
+        dry_run_records = self.TestWebGanttPill.web_gantt_reschedule(*args, dry_run=True)['records']
+
+        written_record_ids = []
+        write = type(self.TestWebGanttPill).write
+
+        def _write(records, vals):
+            written_record_ids.extend(records.ids)
+            return write(records, vals)
+
+        with patch.object(type(self.TestWebGanttPill), 'write', _write):
+            self.assertTrue(self.TestWebGanttPill.web_gantt_reschedule(*args))
+        self.assertEqual(sorted(written_record_ids), sorted([self.pill_1.id, self.pill_2.id]))
+        for values in dry_run_records:
+            pill = self.TestWebGanttPill.browse(values['id'])
+            self.assertEqual(
+                (pill[self.date_start_field_name], pill[self.date_stop_field_name]),
+                (values[self.date_start_field_name], values[self.date_stop_field_name]),
+            )
@@ -42,12 +42,15 @@ class Base(models.AbstractModel):
         columns_avg = defaultdict(lambda: dict(percentage=0, count=0))
         total_value = 0
         initial_churn_value = 0
+        # the value of a row can be summed up from its cells for these aggregates only
+        additive_measure = measure == '__count'
         if measure != '__count':
             field = self._fields[measure]
             if field.type == 'many2one':
                 measure = f'{measure}:count_distinct'
             else:
                 measure = f'{measure}:{field.group_operator}'
+                additive_measure = field.group_operator == 'sum'
 
         locale = get_lang(self.env).code
 
@@ -66,21 +69,23 @@ class Base(models.AbstractModel):
             today = date.today()
             convert_method = fields.Date.to_date
 
+        # all the cells of the cohort, in a single query: {row: {column: value}}
+        cell_groups = self._read_group(
+            domain=domain,
+            groupby=[date_start + ':' + interval, date_stop + ':' + interval],
+            aggregates=[measure],
+        ) if row_groups else []
+        sub_groups_per_row = defaultdict(dict)
+        for row_value, col_value, aggregate_value in cell_groups:
+            sub_groups_per_row[row_value][convert_method(col_value)] = aggregate_value
+
         for group_value, value in row_groups:
             total_value += value
             group_domain = expression.AND([
                 domain,
                 ['&', (date_start, '>=', group_value), (date_start, '<', group_value + models.READ_GROUP_TIME_GRANULARITY[interval])]
             ])
-            sub_group = self._read_group(
-                domain=group_domain,
-                groupby=[date_stop + ':' + interval],
-                aggregates=[measure],
-            )
-            sub_group_per_period = {
-                convert_method(group_value): aggregate_value
-                for group_value, aggregate_value in sub_group
-            }
+            sub_group_per_period = sub_groups_per_row[group_value]
 
             columns = []
             initial_value = value
@@ -113,7 +118,14 @@ class Base(models.AbstractModel):
 
                 # In backward timeline, if columns are out of given range, we need
                 # to set initial value for calculating correct percentage
-                if timeline == 'backward' and col_index == 0:
+                if timeline == 'backward' and col_index == 0 and additive_measure:
+                    initial_value = float(sum(
+                        aggregate_value or 0
+                        for period, aggregate_value in sub_group_per_period.items()
+                        if not period or period >= col_start_date
+                    ))
+                    initial_churn_value = value - initial_value
+                elif timeline == 'backward' and col_index == 0:
                     outside_timeline_domain = expression.AND(
                         [
                             group_domain,
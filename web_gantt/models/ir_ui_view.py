@@ -44,7 +44,8 @@ GANTT_VALID_ATTRIBUTES = set([
     'dependency_field',
     'dependency_inverted_field',
     'pill_label',
-    'groups_limit'
+    'groups_limit',
+    'records_limit',
 ])
 
 class View(models.Model):
@@ -6,7 +6,7 @@ from lxml.builder import E
 
 from odoo import _, api, models
 from odoo.exceptions import UserError
-from odoo.tools.misc import OrderedSet, unique
+from odoo.tools.misc import OrderedSet, frozendict, unique
 
 
 class Base(models.AbstractModel):
@@ -50,22 +50,33 @@ class Base(models.AbstractModel):
     @api.model
     def get_gantt_data(
         self, domain, groupby, read_specification, limit=None, offset=0,
+        records_limit=None, records_offset=0,
     ):
         """
         Returns the result of a read_group (and optionally search for and read records inside each
         group), and the total number of groups matching the search domain.
 
+        The gantt view only loads what it displays: the domain holds the visible date range, the
+        groups (the rows) are paged with ``limit`` and ``offset``, and the records of each group
+        can be windowed with ``records_limit`` and ``records_offset``. In that case, only the
+        records inside the window of their group are read, and each group gives its total number
+        of records in ``__record_count``, so that the next records of the groups can be fetched
+        incrementally by moving ``records_offset``.
+
         :param domain: search domain
         :param groupby: list of field to group on (see ``groupby``` param of ``read_group``)
         :param read_specification: web_read specification to read records within the groups
         :param limit: see ``limit`` param of ``read_group``
         :param offset: see ``offset`` param of ``read_group``
+        :param records_limit: maximum number of records to return per group
+        :param records_offset: number of records to skip in each group
         :return: {
             'groups': [
                 {
                     '<groupby_1>': <value_groupby_1>,
                     ...,
-                    '__record_ids': [<ids>]
+                    '__record_ids': [<ids>],
+                    '__record_count': total number of records of the group (only if windowed)
                 }
             ],
             'records': [<record data>]
@@ -85,19 +96,34 @@ class Base(models.AbstractModel):
             for one_group in final_result['groups']
             for record_id in one_group['__record_ids']
         ))
-        # Do search_fetch to order records (model order can be no-trivial)
-        all_records = self.with_context(active_test=False).search_fetch([('id', 'in', all_record_ids)], read_specification.keys())
-        final_result['records'] = all_records.with_env(self.env).web_read(read_specification)
+        windowed = records_limit is not None or records_offset
+        if windowed:
+            # Only order the ids (model order can be no-trivial), the records out of the window of
+            # their group are not read
+            all_records = self.with_context(active_test=False).search([('id', 'in', all_record_ids)])
+        else:
+            # Do search_fetch to order records (model order can be no-trivial)
+            all_records = self.with_context(active_test=False).search_fetch([('id', 'in', all_record_ids)], read_specification.keys())
 
         ordered_set_ids = OrderedSet(all_records._ids)
+        window_stop = records_offset + records_limit if records_limit is not None else None
+        window_record_ids = set()
         for group in final_result['groups']:
             # Reorder __record_ids
             group['__record_ids'] = list(ordered_set_ids & OrderedSet(group['__record_ids']))
+            if windowed:
+                group['__record_count'] = len(group['__record_ids'])
+                group['__record_ids'] = group['__record_ids'][records_offset:window_stop]
+                window_record_ids.update(group['__record_ids'])
             # We don't need these in the gantt view
             del group['__domain']
             del group[f'{groupby[0]}_count' if lazy else '__count']
             group.pop('__fold', None)
 
+        if windowed:
+            all_records = all_records.browse([record_id for record_id in all_records._ids if record_id in window_record_ids])
+        final_result['records'] = all_records.with_env(self.env).web_read(read_specification)
+
         return final_result
 
     @api.model
@@ -106,7 +132,8 @@ class Base(models.AbstractModel):
         direction,
         master_record_id, slave_record_id,
         dependency_field_name, dependency_inverted_field_name,
-        start_date_field_name, stop_date_field_name
+        start_date_field_name, stop_date_field_name,
+        dry_run=False,
     ):
         """ Reschedule a record according to the provided parameters.
 
@@ -118,7 +145,10 @@ class Base(models.AbstractModel):
                    records.
             :param start_date_field_name: The start date field used in the gantt view.
             :param stop_date_field_name: The stop date field used in the gantt view.
+            :param dry_run: Only compute the new dates without saving them.
             :return: True if Successful, a client action of notification type if not.
+                     In dry run, a dict with that result under 'result' and the new dates of the records that
+                     would be moved under 'records'.
         """
 
         if direction not in (self._WEB_GANTT_RESCHEDULE_FORWARD, self._WEB_GANTT_RESCHEDULE_BACKWARD):
@@ -155,10 +185,69 @@ class Base(models.AbstractModel):
             trigger_record = slave_record
             related_record = master_record
 
+        # The records are walked level by level from the trigger record, each one being moved according to the record
+        # it depends on, that was moved at the previous level. The new dates are only put in the cache during the walk
+        # (see _web_gantt_reschedule_write_new_dates), then saved all at once.
+        self.env[self._name].flush_model([start_date_field_name, stop_date_field_name])
+        new_dates = {}
+        result = trigger_record.with_context(web_gantt_reschedule_new_dates=new_dates)._web_gantt_reschedule_trigger_record(
+            related_record, related_record == master_record,
+            dependency_field_name, dependency_inverted_field_name,
+            start_date_field_name, stop_date_field_name,
+            direction,
+        )
+        self.env[self._name].invalidate_model([start_date_field_name, stop_date_field_name])
+        moved_records_dates = {
+            record.id: new_dates[record.id]
+            for record in self.env[self._name].browse(new_dates)
+            if record[start_date_field_name] != new_dates[record.id][start_date_field_name]
+            or record[stop_date_field_name] != new_dates[record.id][stop_date_field_name]
+        }
+        if dry_run:
+            return {
+                'result': result,
+                'records': [{'id': record_id, **dates} for record_id, dates in moved_records_dates.items()],
+            }
+        self.env[self._name]._web_gantt_reschedule_save_new_dates(moved_records_dates)
+        return result
+
+    @api.model
+    def _web_gantt_reschedule_save_new_dates(self, new_dates):
+        """ Save the dates computed by the rescheduling, with one write per distinct dates values.
+
+            :param new_dates: A dict {record_id: {start_date_field_name: start_date, stop_date_field_name: stop_date}}.
+        """
+        record_ids_per_dates = defaultdict(list)
+        for record_id, dates in new_dates.items():
+            record_ids_per_dates[frozendict(dates)].append(record_id)
+        for dates, record_ids in record_ids_per_dates.items():
+            self.browse(record_ids).write(dict(dates))
+
+    def _web_gantt_reschedule_trigger_record(
+        self,
+        related_record, is_related_record_master,
+        dependency_field_name, dependency_inverted_field_name,
+        start_date_field_name, stop_date_field_name,
+        direction,
+    ):
+        """ Move the record in self towards related_record, then reschedule the records depending on it.
+
+            :param related_record: The record towards which self is moved.
+            :param is_related_record_master: Tells whether the related record is the master or slave in the dependency.
+            :param dependency_field_name: The field name of the relation between the master and slave records.
+            :param dependency_inverted_field_name: The field name of the relation between the slave and the parent
+                   records.
+            :param start_date_field_name: The start date field used in the gantt view.
+            :param stop_date_field_name: The stop date field used in the gantt view.
+            :param direction: The direction of the rescheduling 'forward' or 'backward'
+            :return: True if Successful, a client action of notification type if not.
+        """
+        self.ensure_one()
+        trigger_record = self
         cache = self._web_gantt_reschedule_get_empty_cache()
 
         new_start_date, new_stop_date = trigger_record._web_gantt_reschedule_record(
-            related_record, related_record == master_record,
+            related_record, is_related_record_master,
             start_date_field_name, stop_date_field_name,
             cache
         )
@@ -167,6 +256,8 @@ class Base(models.AbstractModel):
             new_start_date, new_stop_date, start_date_field_name, stop_date_field_name,
         )
 
+        new_dates = self.env.context.get('web_gantt_reschedule_new_dates')
+        trigger_record_dates = dict(new_dates or {})
         with self.env.cr.savepoint() as sp:
             record_ids_to_exclude = defaultdict(list)
 
@@ -179,6 +270,9 @@ class Base(models.AbstractModel):
             )
             if result is not True:
                 sp.rollback()
+                if new_dates is not None:
+                    new_dates.clear()
+                    new_dates.update(trigger_record_dates)
 
         if result is not True:
             if result is False:
@@ -431,6 +525,12 @@ class Base(models.AbstractModel):
         rescheduling_forward = direction == self._WEB_GANTT_RESCHEDULE_FORWARD
         rescheduling_backward = direction == self._WEB_GANTT_RESCHEDULE_BACKWARD
 
+        # Read the dependencies of the records and the dates of the records they are linked to at once, rather than
+        # record by record. Only the records the walk reaches at this step are read.
+        self.fetch([dependency_field_name, dependency_inverted_field_name, start_date_field_name, stop_date_field_name])
+        related_records = self.mapped(dependency_field_name) | self.mapped(dependency_inverted_field_name)
+        related_records._filter_access_rules('read').fetch([start_date_field_name, stop_date_field_name])
+
         slave_per_record = defaultdict(lambda: self.env[self._name])
         master_per_record = defaultdict(lambda: self.env[self._name])
         records_to_reschedule = self.env[self._name]
@@ -669,8 +769,15 @@ class Base(models.AbstractModel):
         if new_start_date < datetime.now(timezone.utc):
             return False
 
-        self.write({
+        values = {
             start_date_field_name: new_start_date.astimezone(timezone.utc).replace(tzinfo=None),
             stop_date_field_name: new_stop_date.astimezone(timezone.utc).replace(tzinfo=None)
-        })
+        }
+        new_dates = self.env.context.get('web_gantt_reschedule_new_dates')
+        if new_dates is not None:
+            # Only update the cache, for the rest of the rescheduling to see the new dates (see web_gantt_reschedule).
+            self._update_cache(values, validate=False)
+            new_dates.update((record.id, values) for record in self)
+        else:
+            self.write(values)
         return True
@@ -10,6 +10,15 @@ function _mockGetGanttData(_, { model, kwargs }) {
         fields: ["__record_ids:array_agg(id)"],
     });
 
+    const { records_limit: recordsLimit, records_offset: recordsOffset = 0 } = kwargs;
+    if (recordsLimit || recordsOffset) {
+        const stop = recordsLimit ? recordsOffset + recordsLimit : undefined;
+        for (const group of groups) {
+            group.__record_count = group.__record_ids.length;
+            group.__record_ids = group.__record_ids.slice(recordsOffset, stop);
+        }
+    }
+
     const recordIds = [];
     for (const group of groups) {
         recordIds.push(...(group.__record_ids || []));
@@ -34,7 +34,10 @@ const { DateTime } = luxon;
  * @property {string} [maxValue]
  *
  * @typedef Data
+ * @property {Record<string, any>[]} groups
+ * @property {boolean} hasMoreRecords
  * @property {Record<string, any>[]} records
+ * @property {number} recordsOffset
  * @property {Row[]} rows
  *
  * @typedef Field
@@ -55,6 +58,7 @@ const { DateTime } = luxon;
  * @property {number | false} formViewId
  * @property {string[]} groupedBy
  * @property {Element | null} popoverTemplate
+ * @property {number | null} recordsLimit
  * @property {string} resModel
  * @property {Scale} scale
  * @property {Scale[]} scales
@@ -77,6 +81,7 @@ const { DateTime } = luxon;
  * @property {boolean} isGroup
  * @property {string} name
  * @property {number[]} recordIds
+ * @property {number} [recordCount]
  * @property {ProgressBar} [progressBar]
  * @property {number | false} resId
  * @property {Row[]} [rows]
@@ -172,6 +177,8 @@ export class GanttModel extends Model {
         this.mutex = new Mutex();
         /** @type {MetaData | null} */
         this._nextMetaData = null;
+        /** @type {Object | undefined} context of the last fetch, reused to fetch more records */
+        this._additionalContext = undefined;
     }
 
     /**
@@ -529,6 +536,45 @@ export class GanttModel extends Model {
         this.notify();
     }
 
+    /**
+     * Fetches the next window of records of the displayed groups (see the
+     * records_limit attribute of the arch), and adds them to the current data.
+     */
+    async fetchMoreRecords() {
+        const metaData = this.metaData;
+        const { groupedBy } = metaData;
+        const recordsOffset = this.data.recordsOffset + metaData.recordsLimit;
+        const { groups, records } = await this.keepLast.add(
+            this._fetchGanttData(metaData, { recordsOffset })
+        );
+
+        const getGroupKey = (group) =>
+            JSON.stringify(groupedBy.map((fieldName) => group[fieldName] ?? false));
+        const nextRecordIds = new Map(groups.map((g) => [getGroupKey(g), g.__record_ids]));
+        const allGroups = this.data.groups.map((group) => ({
+            ...group,
+            __record_ids: [...group.__record_ids, ...(nextRecordIds.get(getGroupKey(group)) || [])],
+        }));
+
+        const data = {
+            count: this.data.count,
+            groups: allGroups,
+            hasMoreRecords: this._hasMoreRecords(allGroups),
+            records: [...this.data.records, ...this._parseServerData(metaData, records)],
+            recordsOffset,
+        };
+        data.rows = this._generateRows(metaData, {
+            groupedBy,
+            groups: [...allGroups],
+            parentGroup: [],
+        });
+
+        await this.keepLast.add(this._fetchDataPostProcess(metaData, data));
+
+        this.data = data;
+        this.notify();
+    }
+
     async updatePagerParams({ limit, offset }) {
         await this.fetchData({ pagerLimit: limit, pagerOffset: offset });
     }
@@ -651,41 +697,25 @@ export class GanttModel extends Model {
      * @param {Object} [additionalContext]
      */
     async _fetchData(metaData, additionalContext) {
-        const { groupedBy, pagerLimit, pagerOffset, resModel } = metaData;
-        const context = {
-            ...this.searchParams.context,
-            group_by: groupedBy,
-            ...additionalContext,
-        };
-        const domain = this._getDomain(metaData);
-        const fields = this._getFields(metaData);
-        const specification = {};
-        for (const fieldName of fields) {
-            specification[fieldName] = {};
-            if (metaData.fields[fieldName].type === "many2one") {
-                specification[fieldName].fields = { display_name: {} };
-            }
-        }
-
+        const { groupedBy } = metaData;
+        this._additionalContext = additionalContext;
         const { length, groups, records } = await this.keepLast.add(
-            this.orm.call(resModel, "get_gantt_data", [], {
-                domain,
-                groupby: groupedBy,
-                read_specification: specification,
-                context,
-                limit: pagerLimit,
-                offset: pagerOffset,
-            })
+            this._fetchGanttData(metaData)
         );
 
         groups.forEach((g) => (g.fromServer = true));
 
-        const data = { count: length };
+        const data = {
+            count: length,
+            groups,
+            hasMoreRecords: this._hasMoreRecords(groups),
+            recordsOffset: 0,
+        };
 
         data.records = this._parseServerData(metaData, records);
         data.rows = this._generateRows(metaData, {
             groupedBy,
-            groups,
+            groups: [...groups],
             parentGroup: [],
         });
 
@@ -696,6 +726,47 @@ export class GanttModel extends Model {
         this._nextMetaData = null;
     }
 
+    /**
+     * Calls get_gantt_data for the visible date range and rows. Only the
+     * window of records starting at recordsOffset is read in each group when
+     * the arch sets a records_limit.
+     *
+     * @protected
+     * @param {MetaData} metaData
+     * @param {Object} [params]
+     * @param {number} [params.recordsOffset=0]
+     */
+    _fetchGanttData(metaData, { recordsOffset = 0 } = {}) {
+        const { groupedBy, pagerLimit, pagerOffset, recordsLimit, resModel } = metaData;
+        const context = {
+            ...this.searchParams.context,
+            group_by: groupedBy,
+            ...this._additionalContext,
+        };
+        const domain = this._getDomain(metaData);
+        const fields = this._getFields(metaData);
+        const specification = {};
+        for (const fieldName of fields) {
+            specification[fieldName] = {};
+            if (metaData.fields[fieldName].type === "many2one") {
+                specification[fieldName].fields = { display_name: {} };
+            }
+        }
+        const kwargs = {
+            domain,
+            groupby: groupedBy,
+            read_specification: specification,
+            context,
+            limit: pagerLimit,
+            offset: pagerOffset,
+        };
+        if (recordsLimit) {
+            kwargs.records_limit = recordsLimit;
+            kwargs.records_offset = recordsOffset;
+        }
+        return this.orm.call(resModel, "get_gantt_data", [], kwargs);
+    }
+
     /**
      * @protected
      * @param {MetaData} metaData
@@ -813,8 +884,10 @@ export class GanttModel extends Model {
 
         if (!groupedBy.length || !groups.length) {
             const recordIds = [];
+            let recordCount = 0;
             for (const g of groups) {
                 recordIds.push(...(g.__record_ids || []));
+                recordCount += g.__record_count ?? (g.__record_ids || []).length;
             }
             return [
                 {
@@ -822,6 +895,7 @@ export class GanttModel extends Model {
                     id: JSON.stringify([...parentGroup, {}]),
                     isGroup: false,
                     name: "",
+                    recordCount,
                     recordIds: unique(recordIds),
                 },
             ];
@@ -857,8 +931,10 @@ export class GanttModel extends Model {
             const resId = Array.isArray(value) ? value[0] : value; // not really a resId
             const fromServer = subGroups.some((g) => g.fromServer);
             const recordIds = [];
+            let recordCount = 0;
             for (const g of subGroups) {
                 recordIds.push(...(g.__record_ids || []));
+                recordCount += g.__record_count ?? (g.__record_ids || []).length;
             }
             const row = {
                 consolidate,
@@ -870,6 +946,7 @@ export class GanttModel extends Model {
                 isGroup,
                 name: this._getRowName(metaData, groupedByField, value),
                 resId, // not really a resId
+                recordCount,
                 recordIds: unique(recordIds),
             };
             // if isGroup Generate sub rows
@@ -891,6 +968,15 @@ export class GanttModel extends Model {
         return rows;
     }
 
+    /**
+     * @protected
+     * @param {Record<string, any>[]} groups
+     * @returns {boolean} whether some records of the groups have not been fetched yet
+     */
+    _hasMoreRecords(groups) {
+        return groups.some((g) => g.__record_count > (g.__record_ids || []).length);
+    }
+
     /**
      * Get domain of records to display in the gantt view.
      *
@@ -2037,6 +2037,10 @@ export class GanttRenderer extends Component {
         this.model.expandRows();
     }
 
+    onLoadMoreClicked() {
+        this.model.fetchMoreRecords();
+    }
+
     onNextPeriodClicked() {
         this.model.setFocusDate("next");
     }
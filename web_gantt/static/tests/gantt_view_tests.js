@@ -6219,6 +6219,42 @@ QUnit.test("groups_limit attribute (no groupBy)", async (assert) => {
     ]);
 });
 
+QUnit.test("records_limit attribute", async (assert) => {
+    await makeView({
+        type: "gantt",
+        resModel: "tasks",
+        serverData,
+        arch: `
+            <gantt
+                date_start="start"
+                date_stop="stop"
+                records_limit="4"
+            />
+        `,
+        mockRPC(_, { method, kwargs }) {
+            if (method === "get_gantt_data") {
+                assert.step(`records ${kwargs.records_offset}-${kwargs.records_limit}`);
+            }
+        },
+    });
+
+    assert.verifySteps(["records 0-4"]);
+    assert.strictEqual(getGridContent().rows[0].pills.length, 4);
+    assert.containsOnce(target, ".o_gantt_button_load_more");
+
+    await click(target, ".o_gantt_button_load_more");
+    assert.verifySteps(["records 4-4"]);
+    assert.deepEqual(getGridContent().rows[0].pills.map((pill) => pill.title).sort(), [
+        "Task 1",
+        "Task 2",
+        "Task 3",
+        "Task 4",
+        "Task 5",
+        "Task 7",
+    ]);
+    assert.containsNone(target, ".o_gantt_button_load_more");
+});
+
 QUnit.test("groups_limit attribute (one groupBy)", async (assert) => {
     await makeView({
         type: "gantt",